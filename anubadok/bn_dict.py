@@ -33,32 +33,231 @@
 
 import re
 import os
-from typing import Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import user_settings
 from anubadok import settings
+from anubadok import bn_dict_compiler
 
 
 class BnDict:
     dict_table: Dict[str, str] = {}
-    new_words_table: Dict[str, str] = {}
+    # New words (lookup keys) found, and how often each was looked up
+    new_words_table: Dict[str, int] = {}
+    # Signature (path, mtime, size) of the dictionary files last loaded
+    signature: Optional[list] = None
+    # Bumped every time the dictionaries are (re)loaded or updated
+    generation: int = 0
+    # Meanings of the words of dict_table (see word_entry); complete
+    # unless they are read from a compiled dictionary as needed
+    word_index: Dict[str, "WordEntry"] = {}
+    word_index_complete: bool = True
+    lock = threading.RLock()
+    # New words found by a thread are also collected in new_words_log.keys
+    # while it is set (see recording_new_words)
+    new_words_log = threading.local()
 
 
-def load_dictionary():
+class WordEntry(NamedTuple):
     """
-    Load all dictionaries
+    Meanings of a word: its default (untagged) meaning, None if it has
+    none, and its meanings by tag
     """
-    BnDict.dict_table = {}
-    
-    load_main_dictionary()
-    load_secondary_dictionary()
-    load_user_dictionary()
-    load_local_dictionary()
-    update_dictionary()
-    
+    default: Optional[str]
+    tags: Dict[str, str]
+
+
+NO_WORD_ENTRY = WordEntry(None, {})
+
+
+class UnknownWords:
+    """
+    Lookups (see dictionary_lookup) of words not in the dictionary: what
+    they returned and the new words they added, most recently used last.
+    Emptied whenever the dictionary changes.
+    """
+    entries: "OrderedDict[str, Tuple[str, Tuple[str, ...]]]" = OrderedDict()
+    generation: int = -1
+    hits: int = 0
+    misses: int = 0
+    lock = threading.Lock()
+
+
+class CompiledDictTable(dict):
+    """
+    Dictionary table backed by a compiled dictionary. Entries are decoded
+    on first use and kept, along with newly added words, in memory.
+    """
+
+    def __init__(self, compiled):
+        super().__init__()
+        self.compiled = compiled
+        # Words added to the table (not in the compiled dictionary)
+        self.added = {}
+
+    def __missing__(self, key):
+        value = self.compiled.get(key)
+        if value is None:
+            raise KeyError(key)
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.added[key] = value
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self.compiled
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def load_dictionary(force=False):
+    """
+    Load all dictionaries. They are loaded once per process and read
+    again only if any of the dictionary files has changed since.
+
+    Args:
+        force: Reload even if the dictionary files are unchanged
+    """
+    with BnDict.lock:
+        signature = dictionary_signature()
+        if force or signature != BnDict.signature:
+            BnDict.dict_table = {}
+
+            if not (settings.use_compiled_dictionary and load_compiled_dictionary()):
+                load_main_dictionary()
+                load_secondary_dictionary()
+                load_user_dictionary()
+            load_local_dictionary()
+            BnDict.signature = signature
+            BnDict.generation += 1
+            index_dictionary()
+
+        # Words merged into the secondary dictionary are already in the
+        # table, so that change alone does not need a reload
+        if update_dictionary() > 0:
+            BnDict.signature = dictionary_signature()
+            BnDict.generation += 1
+            index_dictionary()
+
+
+def reload_dictionary():
+    """
+    Load all dictionaries again regardless of whether they have changed
+    """
+    load_dictionary(force=True)
+
+
+def dictionary_signature():
+    """
+    Path, mtime and size of each dictionary file
+    """
+    return [bn_dict_compiler.source_signature(path) for path in dictionary_sources()]
+
+
+def dictionary_sources():
+    """
+    All dictionary files in order of precedence (lowest first)
+    """
+    return compiled_dictionary_sources() + [settings.local_dict_db]
+
+
+def compiled_dictionary_sources():
+    """
+    Dictionary files kept in the compiled dictionary. The local
+    dictionary depends on the working directory, so it is read on top.
+    """
+    return [
+        settings.primary_dict_db,
+        settings.secondary_dict_db,
+        settings.user_dict_db
+    ]
+
+
+def index_dictionary():
+    """
+    Index the words of the loaded dictionaries by their meanings. Words
+    of a compiled dictionary are indexed as they are looked up.
+    """
+    table = BnDict.dict_table
+    if isinstance(table, CompiledDictTable):
+        BnDict.word_index = {}
+        BnDict.word_index_complete = False
+        return
+
+    defaults = {}
+    tags = {}
+    for key, value in table.items():
+        word, colon, tag = key.partition(':')
+        if colon:
+            tags.setdefault(word, {})[tag] = value
+        else:
+            defaults[word] = value
+
+    BnDict.word_index = {
+        word: WordEntry(defaults.get(word), tags.get(word, {}))
+        for word in defaults.keys() | tags.keys()
+    }
+    BnDict.word_index_complete = True
+
+
+def word_entry(word):
+    """
+    Meanings of a (lowercased) word, i.e. of the dictionary entries
+    `word` and `word:TAG` for any tag
+    """
+    entry = BnDict.word_index.get(word)
+    if entry is not None:
+        return entry
+    if BnDict.word_index_complete:
+        return NO_WORD_ENTRY
+
+    table = BnDict.dict_table
+    prefix = word + ":"
+    tags = {key[len(prefix):]: value
+            for key, value in table.compiled.items_with_prefix(prefix)}
+    tags.update((key[len(prefix):], value)
+                for key, value in table.added.items() if key.startswith(prefix))
+    entry = WordEntry(table.get(word), tags)
+
+    # Only words in the dictionary are kept, so that the index does not
+    # grow with every unknown word
+    if entry.default is not None or tags:
+        BnDict.word_index[word] = entry
+    return entry
+
+
+def load_compiled_dictionary(rebuild=False):
+    """
+    Open the compiled dictionary, compiling it first if it is out of date.
+    Returns False if that is not possible.
+    """
+    try:
+        compiled = bn_dict_compiler.open_compiled_dictionary(
+            compiled_dictionary_sources(), rebuild)
+    except IOError:
+        return False
+
+    BnDict.dict_table = CompiledDictTable(compiled)
+    report_secondary_dictionary_size(
+        compiled.source_entries(settings.secondary_dict_db), settings.secondary_dict_db)
+    return True
+
 
 def update_dictionary():
     """
     Read translated words from new_words.list and update the secondary_dict_db
+
+    Returns:
+        Number of entries added to the secondary_dict_db (-1 if there is
+        no new_words.list)
     """
     translated_dict_table: Dict[str, str] = {}
     
@@ -113,6 +312,7 @@ def update_dictionary():
         raise e
     # Reset
     BnDict.new_words_table = {}
+    return len(translated_dict_table)
 
 
 def load_main_dictionary():
@@ -205,8 +405,15 @@ def load_secondary_dictionary():
             BnDict.dict_table[db_data[0]] = db_data[1]
             count += 1
     
+    report_secondary_dictionary_size(count, dict_new_db)
+
+
+def report_secondary_dictionary_size(count, dict_new_db):
+    """
+    Encourage user to contribute their translated words
+    """
     if user_settings.verbose and count > 200:
-        print("""________________________________________________________
+        print(f"""________________________________________________________
 
 Hey! number of entries in your dictionary that you have
 translated during your use of Anubadok is {count}. You may
@@ -218,6 +425,41 @@ The file is: {dict_new_db}
 _________________________________________________________""")
     
 
+# Verbal nouns (how new verbs are usually translated) and their root verbs
+root_verb_table = {
+    'ওয়া': '',
+    'করা': 'কর',
+    'বলা': 'বল',
+    'ফেলা': 'ফেল',
+    'মারা': 'মার',
+    'পড়া': 'পড়',
+    'পাঠান': 'পাঠা',
+    'থাকা': 'থাক',
+    'দেয়া': 'দে',
+    'চলা': 'চল',
+    'ধরা': 'ধর',
+    'দৌড়ান': 'দৌড়া',
+    'দৌড়ানো': 'দৌড়া',
+    'বেড়ান': 'বেড়া',
+    'বেড়ানো': 'বেড়া',
+    'গোছান': 'গোছা',
+    'গোছানো': 'গোছা',
+    'ভালবাসা': 'ভালবাস',
+    'তোলা': 'তোল',
+    'মানান': 'মানা',
+    'মানানো': 'মানা',
+    'বোনা': 'বুন',
+    'জ্বালানো': 'জ্বালা',
+    'জ্বালান': 'জ্বালা',
+    'হাসা': 'হাস',
+    'কাঁদা': 'কাঁদ'
+}
+
+# Any of the verb nouns at the end of a word (none of them ends another)
+root_verb_ending = re.compile(
+    "(?:" + "|".join(re.escape(ending) for ending in root_verb_table) + ")$")
+
+
 def extract_root_verb(root_verb):
     """
     Extract root verb from Bengali verb form
@@ -225,43 +467,57 @@ def extract_root_verb(root_verb):
     # Remove trailing spaces
     root_verb = root_verb.rstrip()
     
-    patterns = [
-        (r'ওয়া$', ''),
-        (r'করা$', 'কর'),
-        (r'বলা$', 'বল'),
-        (r'ফেলা$', 'ফেল'),
-        (r'মারা$', 'মার'),
-        (r'পড়া$', 'পড়'),
-        (r'পাঠান$', 'পাঠা'),
-        (r'থাকা$', 'থাক'),
-        (r'দেয়া$', 'দে'),
-        (r'চলা$', 'চল'),
-        (r'ধরা$', 'ধর'),
-        (r'দৌড়ান$', 'দৌড়া'),
-        (r'দৌড়ানো$', 'দৌড়া'),
-        (r'বেড়ান$', 'বেড়া'),
-        (r'বেড়ানো$', 'বেড়া'),
-        (r'গোছান$', 'গোছা'),
-        (r'গোছানো$', 'গোছা'),
-        (r'ভালবাসা$', 'ভালবাস'),
-        (r'তোলা$', 'তোল'),
-        (r'মানান$', 'মানা'),
-        (r'মানানো$', 'মানা'),
-        (r'বোনা$', 'বুন'),
-        (r'জ্বালানো$', 'জ্বালা'),
-        (r'জ্বালান$', 'জ্বালা'),
-        (r'হাসা$', 'হাস'),
-        (r'কাঁদা$', 'কাঁদ')
-    ]
-    
-    for pattern, replacement in patterns:
-        if re.search(pattern, root_verb):
-            root_verb = re.sub(pattern, replacement, root_verb)
-            break
+    match = root_verb_ending.search(root_verb)
+    if match:
+        root_verb = root_verb[:match.start()] + root_verb_table[match.group(0)]
     # Return 
     return root_verb
 
 
+def verb_roots():
+    """
+    Bengali root verbs of all verb (:VV) entries of the loaded dictionaries
+    """
+    with BnDict.lock:
+        table = BnDict.dict_table
+        keys = set(table)
+        compiled = getattr(table, "compiled", None)
+        if compiled is not None:
+            keys.update(compiled.keys())
+        return {table[key] for key in keys if key.endswith(":VV")}
+
+
+def add_new_word(lookup_key, count=1):
+    """
+    Add a word (not found in the dictionary) to the new words table, or
+    count it again if it is there
+    """
+    # Threads (of the server) count words in the same table
+    with BnDict.lock:
+        BnDict.new_words_table[lookup_key] = BnDict.new_words_table.get(lookup_key, 0) + count
+    
+    keys = getattr(BnDict.new_words_log, "keys", None)
+    if keys is not None:
+        keys.extend([lookup_key] * count)
+
+
+@contextmanager
+def recording_new_words():
+    """
+    Collect the new words which this thread adds to the new words table
+    (in order, repeats included) in the list given by the context. They
+    are also collected by any enclosing context.
+    """
+    previous = getattr(BnDict.new_words_log, "keys", None)
+    keys = BnDict.new_words_log.keys = []
+    try:
+        yield keys
+    finally:
+        BnDict.new_words_log.keys = previous
+        if previous is not None:
+            previous.extend(keys)
+
+
 def dictionary_prelim_lookup(en_word, new_log=False):
     """
     Check whether given word is present (tagged or untagged)
@@ -277,16 +533,16 @@ def dictionary_prelim_lookup(en_word, new_log=False):
     if not word:
         return False
     
-    # Exact lookup
-    lookup_key = f"{word}:{tag}" if tag else word
+    entry = word_entry(word)
     
-    if lookup_key in BnDict.dict_table:
+    # Exact lookup
+    if (tag in entry.tags) if tag else (entry.default is not None):
         return True
     elif new_log:
-        BnDict.new_words_table[lookup_key] = lookup_key
+        add_new_word(f"{word}:{tag}" if tag else word)
     
     # Now try default entry, if available
-    if word in BnDict.dict_table:
+    if entry.default is not None:
         return True
     # Return    
     return False
@@ -299,6 +555,15 @@ def dictionary_lookup(en_word):
     if not en_word or en_word == '<unknown>':
         return en_word
     
+    # Words not in the dictionary are looked up only once
+    unknown = recall_unknown_word(en_word)
+    if unknown is not None:
+        bn_word, new_words = unknown
+        for lookup_key in new_words:
+            add_new_word(lookup_key)
+        return bn_word
+    
+    given_word = en_word
     en_word = en_word.strip()
     dictwds_array = en_word.split(':')
     words = dictwds_array[0].strip()
@@ -308,85 +573,191 @@ def dictionary_lookup(en_word):
         return ""
     
     # Exact lookup
-    lookup_key = f"{words.lower()}:{tag}" if tag else words.lower()
-    bn_word = BnDict.dict_table.get(lookup_key, "")
-    
-    if bn_word:
-        return bn_word
-    
-    # Update new words if not found
-    if tag:  # Original condition was more complex, simplified here
-        BnDict.new_words_table[lookup_key] = lookup_key
+    entry = word_entry(words.lower())
+    new_words = []
+    if tag:
+        bn_word = entry.tags.get(tag)
+        if bn_word:
+            return bn_word
+        
+        # Update new words if not found
+        lookup_key = f"{words.lower()}:{tag}"
+        add_new_word(lookup_key)
+        new_words.append(lookup_key)
     
     # Try default entry
-    lookup_key = words.lower()
-    bn_word = BnDict.dict_table.get(lookup_key, "")
+    bn_word = entry.default
     
     if bn_word:
         return bn_word
     elif tag == "CD" or words[0].isdigit():
-        return bn_cardinal_number(words)
+        bn_word = bn_cardinal_number(words)
     
     # Check for 'dotted' words
-    if '.' in words:
+    elif '.' in words:
         tmpwd = words + "."
         tmpwd = tmpwd.replace('.', ':').replace('::', '.:')
-        dictwds_array2 = tmpwd.split(':')
-        bng_word = ""
+        dotted_words = tmpwd.split(':')
         
-        for wd in dictwds_array2:
-            lookup_key = f"{wd.lower()}:{tag}" if tag else wd.lower()
-            bn_word = BnDict.dict_table.get(lookup_key, "")
-            
-            if not bn_word:
-                lookup_key = wd.lower()
-                bn_word = BnDict.dict_table.get(lookup_key, "")
-                if not bn_word:
-                    BnDict.new_words_table[lookup_key] = lookup_key
-                    bn_word = wd
-            
-            bng_word = f"{bng_word} {bn_word}"
-        
-        return bng_word.strip()
+        bn_words = lookup_word_parts(dotted_words, tag)
+        new_words.extend(wd.lower() for wd, bn_part in zip(dotted_words, bn_words) if bn_part is None)
+        bn_word = " ".join(bn_part or wd for wd, bn_part in zip(dotted_words, bn_words)).strip()
     else:
-        return words
+        bn_word = words
+    
+    remember_unknown_word(given_word, bn_word, new_words)
+    return bn_word
+
+
+def recall_unknown_word(en_word):
+    """
+    What an earlier lookup of a word not in the dictionary returned, and
+    the new words it added (None if there was none)
+    """
+    if settings.unknown_words_cache_size <= 0:
+        return None
+    
+    with UnknownWords.lock:
+        if UnknownWords.generation != BnDict.generation:
+            UnknownWords.entries.clear()
+            UnknownWords.generation = BnDict.generation
+        
+        unknown = UnknownWords.entries.get(en_word)
+        if unknown is None:
+            UnknownWords.misses += 1
+        else:
+            UnknownWords.entries.move_to_end(en_word)
+            UnknownWords.hits += 1
+        return unknown
+
+
+def remember_unknown_word(en_word, bn_word, new_words):
+    """
+    Remember the lookup of a word not in the dictionary
+    """
+    max_size = settings.unknown_words_cache_size
+    if max_size <= 0:
+        return
+    
+    with UnknownWords.lock:
+        if UnknownWords.generation == BnDict.generation:
+            UnknownWords.entries[en_word] = (bn_word, tuple(new_words))
+            while len(UnknownWords.entries) > max_size:
+                UnknownWords.entries.popitem(last=False)
+
+
+def unknown_words_info():
+    """
+    Hits, misses and size of the cache of words not in the dictionary
+    """
+    with UnknownWords.lock:
+        return {
+            "hits": UnknownWords.hits,
+            "misses": UnknownWords.misses,
+            "size": len(UnknownWords.entries),
+            "max_size": settings.unknown_words_cache_size,
+        }
+
+
+def lookup_word_parts(words: List[str], tag: str) -> List[Optional[str]]:
+    """
+    Lookup the parts of a dotted word, each by the tag or else by its
+    default entry. A part with neither is added (untagged) to the new
+    words, and None is returned for it.
+    """
+    bn_words = []
+    for word in words:
+        word = word.lower()
+        entry = word_entry(word)
+        
+        bn_word = (tag and entry.tags.get(tag)) or entry.default
+        if not bn_word:
+            add_new_word(word)
+            bn_word = None
+        bn_words.append(bn_word)
+    return bn_words
+
+
+# English digits to Bengali digits (everything else is kept as it is)
+bn_number_table = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+
+# Ordinal suffixes (1st, 2nd, 3rd, 4th ...) translated as তম
+bn_ordinal_suffix = re.compile(r'(?:th|st|nd|rd)$', re.IGNORECASE)
+bn_ordinal_suffix_lines = re.compile(r'(?:th|st|nd|rd)$', re.IGNORECASE | re.MULTILINE)
+
+# Numbers written with thousands separators or of at least six digits
+grouped_number = re.compile(r'(?<![\d,.])(?:\d{1,3}(?:,\d{3})+|\d{6,})(?![\d,])')
 
 
 def bn_cardinal_number(eng_word):
     """
     Translates any cardinal number to Bengali digits
     """
-    bn_number_table = {
-        '0': '০',
-        '1': '১',
-        '2': '২',
-        '3': '৩',
-        '4': '৪',
-        '5': '৫',
-        '6': '৬',
-        '7': '৭',
-        '8': '৮',
-        '9': '৯',
-        '.': '.',
-        ',': ',',
-        '-': '-',
-        '+': '+'
-    }
-    
-    bng_word = []
-    for number in eng_word:
-        bng_letter = bn_number_table.get(number, number)
-        bng_word.append(bng_letter)
-    
-    bng_word_str = ''.join(bng_word)
+    if settings.indian_digit_grouping:
+        eng_word = grouped_number.sub(indian_digit_grouping, eng_word)
+
+    return bn_ordinal_suffix.sub('তম', eng_word.translate(bn_number_table), count=1)
+
+
+def bn_cardinal_numbers(eng_words: List[str]) -> List[str]:
+    """
+    Translates a list of cardinal numbers (e.g. all numbers of a
+    document) to Bengali digits at once
     
-    # Translate ordinal suffixes
-    bng_word_str = re.sub(r'th$', 'তম', bng_word_str, flags=re.IGNORECASE)
-    bng_word_str = re.sub(r'st$', 'তম', bng_word_str, flags=re.IGNORECASE)
-    bng_word_str = re.sub(r'nd$', 'তম', bng_word_str, flags=re.IGNORECASE)
-    bng_word_str = re.sub(r'rd$', 'তম', bng_word_str, flags=re.IGNORECASE)
+    Args:
+        eng_words: Numbers to translate
+        
+    Returns:
+        Translated numbers in the same order
+    """
+    if not eng_words:
+        return []
+    if any("\n" in word for word in eng_words):
+        return [bn_cardinal_number(word) for word in eng_words]
+
+    text = "\n".join(eng_words)
+    if settings.indian_digit_grouping:
+        text = grouped_number.sub(indian_digit_grouping, text)
+
+    text = bn_ordinal_suffix_lines.sub('তম', text.translate(bn_number_table))
+    return text.split("\n")
+
+
+def translate_numbers(en_words: List[str]) -> None:
+    """
+    Translate the numbers (word:CD lookup keys) of a document at once.
+    Those not in the dictionary are remembered as unknown words, so that
+    dictionary_lookup gives them without translating each on its own.
+    """
+    numbers = []
+    for en_word in dict.fromkeys(en_words):
+        word, colon, tag = en_word.partition(':')
+        if tag != "CD" or not word or word != word.strip():
+            continue
+        entry = word_entry(word.lower())
+        if entry.tags.get(tag) or entry.default:
+            continue
+        numbers.append(word)
     
-    return bng_word_str
+    for word, bn_word in zip(numbers, bn_cardinal_numbers(numbers)):
+        remember_unknown_word(f"{word}:CD", bn_word, [f"{word.lower()}:CD"])
+
+
+def indian_digit_grouping(match) -> str:
+    """
+    Regroup the digits of a matched number in lakh and crore
+    (e.g. 1,234,567 -> 12,34,567)
+    """
+    digits = match.group(0).replace(",", "")
+    if len(digits) <= 3:
+        return digits
+
+    head, tail = digits[:-3], digits[-3:]
+    groups = []
+    while head:
+        groups.insert(0, head[-2:])
+        head = head[:-2]
+    return ",".join(groups + [tail])
 
 
 def save_new_words_list():
@@ -401,7 +772,7 @@ def save_new_words_list():
 
 Anubadok has encountered some new English words for which 
 it does not know the Bengali meaning. These are written
-in the file "{new_db}". 
+(most frequent first) in the file "{new_db}". 
 You may want to translate some of these new words (simply
 by substituting BENGALI_MEANING in the file). Anubadok will 
 use these translated words in your subsequent translations.
@@ -409,8 +780,10 @@ _________________________________________________________
 """)
         
         try:
-            with open(new_db, 'w', encoding='utf-8') as f:
-                for key in sorted(BnDict.new_words_table.keys()):
-                    f.write(f"{key}\tBENGALI_MEANING\n")
+            with BnDict.lock, open(new_db, 'w', encoding='utf-8') as f:
+                # Most frequent first, along with how often they were found
+                for key, count in sorted(BnDict.new_words_table.items(),
+                                         key=lambda item: (-item[1], item[0])):
+                    f.write(f"{key}\tBENGALI_MEANING\t{count}\n")
         except IOError:
             pass
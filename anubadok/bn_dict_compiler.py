@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+#
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+import os
+import sys
+import json
+import mmap
+import array
+import struct
+import hashlib
+import tempfile
+from typing import Iterator, List, Optional, Tuple
+
+from anubadok import settings
+
+###########################################
+#
+#  Compiled dictionary
+#
+#  Layout of a compiled dictionary file:
+#
+#    magic, format version, header size, no. of entries
+#    header (JSON: byte order and signature of the source files)
+#    key offsets   (no. of entries + 1, uint32)
+#    value offsets (no. of entries + 1, uint32)
+#    keys   (UTF-8, sorted bytewise)
+#    values (UTF-8, in the order of keys)
+#
+###########################################
+
+MAGIC = b"ANUBDICT"
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct("<8sIII")
+
+
+class CompiledDictionary:
+    """
+    Read-only view of a compiled dictionary file. The file is memory
+    mapped, keys are found by binary search and values are decoded
+    only when asked for.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.data) < PREAMBLE.size:
+            raise IOError(f"Error! {path} is not a compiled dictionary.")
+
+        magic, version, header_size, self.size = PREAMBLE.unpack_from(self.data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise IOError(f"Error! {path} is not a compiled dictionary.")
+
+        position = PREAMBLE.size
+        self.header = json.loads(self.data[position:position + header_size].decode('utf-8'))
+        if self.header.get("byteorder") != sys.byteorder:
+            raise IOError(f"Error! {path} was compiled on another platform.")
+
+        position = align(position + header_size)
+        table_size = (self.size + 1) * 4
+        view = memoryview(self.data)
+        self.key_offsets = view[position:position + table_size].cast('I')
+        position += table_size
+        self.value_offsets = view[position:position + table_size].cast('I')
+        position += table_size
+
+        self.keys_start = position
+        self.values_start = position + self.key_offsets[self.size]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) >= 0
+
+    def find(self, key: str) -> int:
+        """
+        Return the index of the key or -1 if it is not present
+        """
+        key_bytes = key.encode('utf-8')
+        data = self.data
+        offsets = self.key_offsets
+        start = self.keys_start
+
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            entry = data[start + offsets[middle]:start + offsets[middle + 1]]
+            if entry < key_bytes:
+                low = middle + 1
+            elif entry > key_bytes:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def lower_bound(self, key_bytes: bytes) -> int:
+        """
+        Return the index of the first key not less than the given one
+        """
+        data = self.data
+        offsets = self.key_offsets
+        start = self.keys_start
+
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            if data[start + offsets[middle]:start + offsets[middle + 1]] < key_bytes:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def items_with_prefix(self, prefix: str) -> Iterator[Tuple[str, str]]:
+        """
+        All entries whose keys start with the given prefix
+        """
+        prefix_bytes = prefix.encode('utf-8')
+        data = self.data
+        offsets = self.key_offsets
+        start = self.keys_start
+
+        index = self.lower_bound(prefix_bytes)
+        while (index < self.size and
+               data[start + offsets[index]:start + offsets[index + 1]].startswith(prefix_bytes)):
+            yield self.key(index), self.value(index)
+            index += 1
+
+    def key(self, index: int) -> str:
+        """
+        Decode the key stored at the given index
+        """
+        start = self.keys_start
+        return self.data[start + self.key_offsets[index]:
+                         start + self.key_offsets[index + 1]].decode('utf-8')
+
+    def keys(self) -> Iterator[str]:
+        """
+        All keys in (bytewise) sorted order
+        """
+        for index in range(self.size):
+            yield self.key(index)
+
+    def value(self, index: int) -> str:
+        """
+        Decode the value stored at the given index
+        """
+        start = self.values_start
+        return self.data[start + self.value_offsets[index]:
+                         start + self.value_offsets[index + 1]].decode('utf-8')
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Lookup a key and return its value
+        """
+        index = self.find(key)
+        return self.value(index) if index >= 0 else default
+
+    def source_entries(self, path: str) -> int:
+        """
+        Number of entries the given source file contributed when compiled
+        """
+        path = os.path.abspath(path)
+        for source in self.header["sources"]:
+            if source[0] == path:
+                return source[3]
+        return 0
+
+    def is_up_to_date(self, sources: List[str]) -> bool:
+        """
+        Check whether the compiled file still matches its source files
+        """
+        signature = [source[:3] for source in self.header["sources"]]
+        return signature == [source_signature(path) for path in sources]
+
+
+def align(position: int) -> int:
+    """
+    Round up to the next 4 byte boundary
+    """
+    return (position + 3) & ~3
+
+
+def source_signature(path: str) -> list:
+    """
+    Absolute path, mtime and size of a source file ([path, -1, -1] if missing)
+    """
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return [path, -1, -1]
+    return [path, stat.st_mtime_ns, stat.st_size]
+
+
+def read_dictionary_source(path: str, table: dict) -> int:
+    """
+    Read a text dictionary (word\\tmeaning per line) into the table
+    """
+    count = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for entry in f:
+            entry = entry.strip()
+            if not entry:
+                continue
+
+            db_data = entry.split('\t')
+            if len(db_data) >= 2:
+                table[db_data[0]] = db_data[1]
+                count += 1
+    return count
+
+
+def compile_dictionary(sources: List[str], target: str) -> None:
+    """
+    Compile the given text dictionaries into a single compiled dictionary.
+    Later sources override earlier ones. The first source is mandatory,
+    the others are skipped if they do not exist.
+
+    Args:
+        sources: Text dictionary files in order of precedence (lowest first)
+        target: Compiled dictionary file to write
+
+    Raises:
+        IOError: If the first source cannot be read or target cannot be written
+    """
+    table = {}
+    header_sources = []
+
+    for i, path in enumerate(sources):
+        signature = source_signature(path)
+        try:
+            count = read_dictionary_source(path, table)
+        except IOError:
+            if i == 0:
+                raise
+            count = 0
+        header_sources.append(signature + [count])
+
+    entries = sorted((key.encode('utf-8'), value.encode('utf-8'))
+                     for key, value in table.items())
+
+    key_offsets = array.array('I', [0])
+    value_offsets = array.array('I', [0])
+    for key, value in entries:
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(value))
+
+    header = json.dumps({
+        "byteorder": sys.byteorder,
+        "sources": header_sources
+    }).encode('utf-8')
+    preamble = PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header), len(entries))
+    padding = b"\0" * (align(len(preamble) + len(header)) - len(preamble) - len(header))
+
+    # Write to a temp file and move it in place, so that concurrent
+    # readers never see a half written file
+    target_dir = os.path.dirname(os.path.abspath(target))
+    os.makedirs(target_dir, exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(prefix=".bdict.", dir=target_dir)
+    try:
+        with open(fd, 'wb') as f:
+            f.write(preamble)
+            f.write(header)
+            f.write(padding)
+            f.write(key_offsets.tobytes())
+            f.write(value_offsets.tobytes())
+            for key, _ in entries:
+                f.write(key)
+            for _, value in entries:
+                f.write(value)
+        os.replace(tmp_file, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+def sources_digest(sources: List[str]) -> str:
+    """
+    Short digest naming files compiled from the given set of sources
+    """
+    return hashlib.sha1(
+        "\n".join(os.path.abspath(path) for path in sources).encode('utf-8')
+    ).hexdigest()[:12]
+
+
+def compiled_dictionary_path(sources: List[str]) -> str:
+    """
+    Location of the compiled dictionary for the given set of sources
+    """
+    return os.path.join(settings.compiled_dict_dir, f"bdict.{sources_digest(sources)}.cdb")
+
+
+def open_compiled_dictionary(sources: List[str], rebuild: bool = False) -> CompiledDictionary:
+    """
+    Open the compiled dictionary of the given sources, compiling it first
+    if it is missing or older than any of its sources.
+
+    Raises:
+        IOError: If the dictionary can be neither opened nor compiled
+    """
+    target = compiled_dictionary_path(sources)
+
+    if not rebuild:
+        try:
+            compiled = CompiledDictionary(target)
+            if compiled.is_up_to_date(sources):
+                return compiled
+        except (IOError, ValueError, TypeError, KeyError, struct.error):
+            pass
+
+    compile_dictionary(sources, target)
+    return CompiledDictionary(target)
@@ -32,159 +32,452 @@
 #___________________________________________________________________
 
 
-def bn_verb_sondhi_preposition(sondhi_word1: str, sondhi_word2: str) -> str:
+import re
+import functools
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from anubadok import settings
+
+###########################################
+#
+#  Bengali letters
+#
+###########################################
+
+# Letters by name, and the class of each (code point) letter. Letters
+# not listed (incl. chandrabindu, anusvar, spaces etc.) have no class.
+BN_LETTERS = {
+    'chandrabindu': 'ঁ', 'anusvar': 'ং', ':': '0',
+
+    'A': 'অ', 'AA': 'আ', 'I': 'ই', 'II': 'ঈ', 'U': 'উ', 'UU': 'ঊ',
+    'RI': 'ঋ', 'E': 'এ', 'AI': 'ঐ', 'O': 'ও', 'AU': 'ঔ',
+
+    'KA': 'ক', 'KHA': 'খ', 'GA': 'গ', 'GHA': 'ঘ', 'NGA': 'ঙ',
+    'CA': 'চ', 'CHA': 'ছ', 'JA': 'জ', 'JHA': 'ঝ', 'NYA': 'ঞ',
+    'TTA': 'ট', 'TTHA': 'ঠ', 'DDA': 'ড', 'DDHA': 'ঢ', 'NNA': 'ণ',
+    'TA': 'ত', 'THA': 'থ', 'DA': 'দ', 'DHA': 'ধ', 'NA': 'ন',
+    'PA': 'প', 'PHA': 'ফ', 'BA': 'ব', 'BHA': 'ভ', 'MA': 'ম',
+    'YA': 'য', 'RA': 'র', 'LA': 'ল', 'SHA': 'শ', 'SSA': 'ষ',
+    'SA': 'স', 'HA': 'হ', 'RRA': 'ড়', 'RHA': 'ঢ়', 'YYA': 'য়',
+
+    'akar': 'া', 'ikar': 'ি', 'iikar': 'ী', 'ukar': 'ু', 'uukar': 'ূ',
+    'rikar': 'ৃ', 'ekar': 'ে', 'oikar': 'ৈ', 'okar': 'ো', 'aukar': 'ৌ',
+
+    'hasant': '্',
+}
+
+BN_LETTER_CLASSES = {
+    'vowel': "অআইঈউঊঋএঐওঔ",
+    'consonant': "কখগঘঙচছজঝঞটঠডঢণতথদধনপফবভমযরলশষসহড়ঢ়য়",
+    'matra': "ািীুূৃেৈোৌ",
+    'hasant': "্",
+}
+
+BN_LETTER_CLASS = {
+    letter: letter_class
+    for letter_class, letters in BN_LETTER_CLASSES.items()
+    for letter in letters
+}
+
+# Endings standing in for a whole word ending (see map_to_proper_bn_letter)
+BN_PROPER_LETTERS = {
+    'ি': 'ই',
+    'ে': 'য়',
+    'েন': 'ন',
+}
+
+###########################################
+#
+#  Sandhi rules
+#
+#  Each rule matches the end of the first word and the beginning of the
+#  second. Patterns are space separated elements, each matching one
+#  character: a letter name (see BN_LETTERS), a letter class ('vowel',
+#  'consonant', 'matra', 'hasant'), 'letter' (any of these), 'other'
+#  (none of these), 'space' or 'any', and alternatives of them joined
+#  by '|'. A second word pattern ending in '$' matches the whole word.
+#
+#  Replacements give what the matched characters become: {n} is the
+#  n-th matched character and the rest are letter names; None keeps
+#  them. A JOIN rule gives the joined words, while a REWRITE rule only
+#  changes the first word and goes on with the next rules. Rules are
+#  tried in order and the words are simply joined if none gives them.
+#
+###########################################
+
+JOIN = "join"
+REWRITE = "rewrite"
+
+
+class SondhiRule(NamedTuple):
     """
-    Apply Bengali sandhi rules for verb-preposition combinations
+    A sandhi rule (see above)
     """
-    sondhi_word1 = sondhi_word1.rstrip()  # remove any trailing space
+    kind: str
+    word1: str
+    word2: Union[str, Tuple[str, ...]] = ""
+    word1_replacement: Optional[str] = None
+    word2_replacement: Optional[str] = None
+    # Only in imperative (True) or other (False) sentences
+    imperative: Optional[bool] = None
+
+
+VERB_PREPOSITION_RULES = [
+    # "XX_khol+te_YY => XX_khulte_YY
+    SondhiRule(JOIN, "consonant okar consonant", "TA ekar", "{1} ukar {3}"),
+    # "XX_patha+te_YY => XX_pathate_YY
+    SondhiRule(JOIN, "akar consonant akar", "TA ekar"),
+    # "XX_ne+ar_YY => XX_neoar_YY
+    SondhiRule(JOIN, "consonant ekar|ikar", "akar|ekar RA", "{1} ekar O YYA", "akar {2}"),
+    # "XX_pa+te_YY => XX_pete_YY
+    SondhiRule(JOIN, "consonant akar", "TA ekar", "{1} ekar"),
+    # "XX_de+te_YY => XX_dite_YY
+    SondhiRule(JOIN, "consonant ekar", "TA ekar", "{1} ikar"),
+    SondhiRule(JOIN, "consonant consonant", "ekar RA", None, "akar {2}"),
+    SondhiRule(JOIN, "matra", "matra", None, ""),
+]
 
-    if len(sondhi_word1) <= 1 or len(sondhi_word2) < 1:
-        return sondhi_word1 + sondhi_word2
+PREPOSITION_RULES = [
+    # Ex. 'lekh' => 'likh'
+    SondhiRule(REWRITE, "LA ekar consonant", "", "{1} ikar {3}"),
+    # TO BE Checked and CONFIRMED that its alright
+    # Ei+ti => Eti
+    SondhiRule(JOIN, "E I", "TA ikar", "{1}"),
+    # "XX_ke+er_YY => XX_ar_YY (ex. amake+er jonyo = amar + jonyo)
+    SondhiRule(JOIN, "RA KA ekar", "ekar RA", "", "{2}"),
+    SondhiRule(JOIN, "KA ekar", "ekar RA", "", "{2}"),
+    SondhiRule(JOIN, "space consonant consonant", "ekar RA", None, "akar {2}"),
+    SondhiRule(JOIN, "letter consonant", "TA ekar", None, "{2}"),
+    SondhiRule(JOIN, "matra", "matra", None, ""),
+    SondhiRule(JOIN, "other", "ekar RA", None, "E {2}"),
+]
+
+BASIC_RULES = [
+    SondhiRule(JOIN, "matra consonant", "TA ekar", None, "{2}"),
+    SondhiRule(JOIN, "matra", "matra", None, ""),
+]
+
+POSSESSIVE_RULES = [
+    SondhiRule(JOIN, "matra", "any", None, ""),
+]
+
+VERB_BASIC_RULES = [
+    SondhiRule(JOIN, "ikar", "", "ekar O YYA"),
+]
+
+VERB_PASSIVE_RULES = [
+    SondhiRule(JOIN, "consonant|matra consonant"),
+    SondhiRule(JOIN, "ikar", "", "ekar O YYA"),
+    SondhiRule(JOIN, "", "", "O YYA"),
+]
+
+# Verb endings of the past simple - 'lam', 'len', 'la'
+PAST_SIMPLE = ("LA $", "LA akar MA $", "LA ekar NA $")
+
+VERB_ACTIVE_OKAR_RULES = [
+    SondhiRule(JOIN, "ekar", "okar $", "akar", "O"),
+    SondhiRule(JOIN, "matra", "okar $", None, "O"),
+    SondhiRule(JOIN, "", "okar $"),
+]
+
+VERB_ACTIVE_RULES = VERB_ACTIVE_OKAR_RULES + [
+    # Ex. 'de' => 'di'
+    SondhiRule(REWRITE, "consonant ekar", "", "{1} ikar"),
+    # Ex. 'lekh' => 'likh'
+    SondhiRule(REWRITE, "LA ekar consonant", "", "{1} ikar {3}"),
 
-    sondhi_wds_array1 = list(sondhi_word1)
-    sondhi_wds_array2 = list(sondhi_word2)
-
-    if len(sondhi_word1) >= 3:
-        # "XX_khol+te_YY => XX_khulte_YY
-        if (check_bn_letter(sondhi_wds_array1[-3]) == 'consonant'
-                and sondhi_wds_array1[-2] == get_bn_letter('okar')
-                and check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'
-                and sondhi_wds_array2[0] == get_bn_letter('TA')
-                and sondhi_wds_array2[1] == get_bn_letter('ekar')):
-            sondhi_wds_array1[-2] = get_bn_letter('ukar')
-            return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-
-        # "XX_patha+te_YY => XX_pathate_YY
-        if (sondhi_wds_array1[-3] == get_bn_letter('akar')
-                and check_bn_letter(sondhi_wds_array1[-2]) == 'consonant'
-                and sondhi_wds_array1[-1] == get_bn_letter('akar')
-                and sondhi_wds_array2[0] == get_bn_letter('TA')
-                and sondhi_wds_array2[1] == get_bn_letter('ekar')):
-            return sondhi_word1 + sondhi_word2
+    # 3rd person, present simple - XX + 'ekar'
+    # Ex. 'likh' => 'lekh' (reversal)
+    SondhiRule(REWRITE, "LA ikar consonant", "ekar $", "{1} ekar {3}"),
+    # Ex. 'di' => 'de'
+    SondhiRule(REWRITE, "consonant ikar", "ekar $", "{1} ekar"),
+    SondhiRule(JOIN, "consonant|matra consonant", "ekar $"),
+    SondhiRule(JOIN, "", "ekar $", None, "YYA"),
 
-    # "XX_ne+ar_YY => XX_neoar_YY
-    if (check_bn_letter(sondhi_wds_array1[-2]) == 'consonant'
-            and (sondhi_wds_array1[-1] == get_bn_letter('ekar')
-                 or sondhi_wds_array1[-1] == get_bn_letter('ikar'))
-            and (sondhi_wds_array2[0] == get_bn_letter('akar')
-                 or sondhi_wds_array2[0] == get_bn_letter('ekar'))
-            and sondhi_wds_array2[1] == get_bn_letter('RA')):
-        sondhi_wds_array1[-1] = get_bn_letter('ekar')
-        sondhi_wds_array2[0] = get_bn_letter('akar')
-        return (''.join(sondhi_wds_array1) + get_bn_letter('O') +
-                get_bn_letter('YYA') + ''.join(sondhi_wds_array2))
+    # 2nd person, present simple - XX + 'ekar NA'
+    # Ex. 'likh' => 'lekh' (reversal)
+    SondhiRule(REWRITE, "LA ikar consonant", "ekar NA $", "{1} ekar {3}"),
+    SondhiRule(JOIN, "consonant|vowel|ekar consonant", "ekar NA $", None, "ukar {2}",
+               imperative=True),
+    SondhiRule(JOIN, "consonant|vowel|matra consonant", "ekar NA $"),
+    SondhiRule(JOIN, "", "ekar NA $", None, "NA"),
 
-    # "XX_pa+te_YY => XX_pete_YY
-    if (check_bn_letter(sondhi_wds_array1[-2]) == 'consonant'
-            and sondhi_wds_array1[-1] == get_bn_letter('akar')
-            and sondhi_wds_array2[0] == get_bn_letter('TA')
-            and sondhi_wds_array2[1] == get_bn_letter('ekar')):
-        sondhi_wds_array1[-1] = get_bn_letter('ekar')
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
+    # Future simple - XX + 'BA', 'be', 'ben'
+    SondhiRule(JOIN, "ikar", "BA", "ekar"),
 
-    # "XX_de+te_YY => XX_dite_YY
-    if (check_bn_letter(sondhi_wds_array1[-2]) == 'consonant'
-            and sondhi_wds_array1[-1] == get_bn_letter('ekar')
-            and sondhi_wds_array2[0] == get_bn_letter('TA')
-            and sondhi_wds_array2[1] == get_bn_letter('ekar')):
-        sondhi_wds_array1[-1] = get_bn_letter('ikar')
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-
-    if (check_bn_letter(sondhi_wds_array1[-2]) == 'consonant'
-            and check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'
-            and sondhi_wds_array2[0] == get_bn_letter('ekar')
-            and sondhi_wds_array2[1] == get_bn_letter('RA')):
-        sondhi_wds_array2[0] = get_bn_letter('akar')
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-
-    if (check_bn_letter(sondhi_wds_array1[-1]) == 'matra'
-            and check_bn_letter(sondhi_wds_array2[0]) == 'matra'):
-        sondhi_wds_array2.pop(0)
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
+    # Past simple - XX + 'lam', 'len', 'la'
+    # YA akar + LA = GA akar + LA
+    SondhiRule(REWRITE, "space YA akar", PAST_SIMPLE, "{1} GA {3}"),
+    SondhiRule(JOIN, "akar", PAST_SIMPLE, "ekar"),
+
+    # 1st person, present simple - XX + 'ikar'
+    SondhiRule(JOIN, "consonant|matra consonant", "ikar $"),
+    # Ex. kha + akar + ikar => kha + akar + I
+    SondhiRule(JOIN, "", "ikar $", None, "I"),
+
+    # Present/past continuous - XX + 'chi', 'che', 'chen'
+    # ...kh+ akar + chh + ... => ...kh + akar + ch+ chh..
+    SondhiRule(JOIN, "space consonant", "CHA ikar|ekar", "{1} {2} CA hasant"),
+    SondhiRule(JOIN, "consonant", "CHA ikar|ekar"),
+    SondhiRule(JOIN, "", "CHA ikar|ekar", "CA hasant"),
+
+    # Present/past perfect - XX + 'echhi', 'echhe', 'echhen'
+    # YA akar + LA = GA ikar + LA
+    SondhiRule(REWRITE, "space YA akar", "ekar CHA ekar|ikar", "{1} GA ikar"),
+    # Ex. 'bas' => 'bes'
+    SondhiRule(REWRITE, "consonant akar consonant", "ekar CHA ekar|ikar", "{1} ekar {3}"),
+    # ...ha + ekar ... => ...ha + Ya+ ekar ..
+    SondhiRule(JOIN, "space consonant", "ekar CHA ekar|ikar", "{1} {2} YYA"),
+    SondhiRule(JOIN, "consonant ikar", "ekar CHA ekar|ikar", "{1} {2} YYA"),
+    SondhiRule(JOIN, "okar consonant akar", "ekar CHA ekar|ikar", "ukar {2} ikar YYA"),
+    SondhiRule(JOIN, "consonant|matra consonant akar", "ekar CHA ekar|ikar", "{1} {2} ikar YYA"),
+    SondhiRule(JOIN, "akar", "ekar CHA ekar|ikar", "ekar YYA"),
+]
+
+###########################################
+#
+#  Rule compilation
+#
+###########################################
+
+PATTERN_ELEMENTS = {
+    'letter': "".join(BN_LETTER_CLASSES.values()),
+    'space': " ",
+    **BN_LETTER_CLASSES,
+}
+
+
+class CompiledSondhiRule(NamedTuple):
+    """
+    A sandhi rule compiled into regular expressions (see compile_sondhi_rule)
+    """
+    rewrite: bool
+    word1: "re.Pattern"
+    word1_length: int
+    word2: "re.Pattern"
+    word2_length: int
+    word1_replacement: Optional[List[Union[int, str]]]
+    word2_replacement: Optional[List[Union[int, str]]]
+    imperative: Optional[bool]
+
+
+def compile_pattern_element(element: str) -> str:
+    """
+    Regular expression of one pattern element (one character)
+    """
+    if element == 'any':
+        return "(.)"
+    if element == 'other':
+        return "([^" + PATTERN_ELEMENTS['letter'] + "])"
+
+    letters = ""
+    for alternative in element.split('|'):
+        if alternative in PATTERN_ELEMENTS:
+            letters += PATTERN_ELEMENTS[alternative]
+        elif alternative in BN_LETTERS:
+            letters += BN_LETTERS[alternative]
+        else:
+            raise ValueError(f"Unknown sandhi pattern element {alternative!r}")
+    return "([" + re.escape(letters) + "])"
+
+
+def compile_pattern(pattern: str) -> Tuple[str, int]:
+    """
+    Regular expression of a pattern, and the number of characters it matches
+    """
+    elements = pattern.split()
+    whole_word = bool(elements) and elements[-1] == '$'
+    if whole_word:
+        elements.pop()
+    return "".join(map(compile_pattern_element, elements)) + ("$" if whole_word else ""), len(elements)
+
+
+def compile_replacement(replacement: Optional[str]) -> Optional[List[Union[int, str]]]:
+    """
+    A replacement as matched characters (by number) and letters
+    """
+    if replacement is None:
+        return None
+    return [
+        int(element[1:-1]) if element.startswith('{') else BN_LETTERS[element]
+        for element in replacement.split()
+    ]
+
+
+def compile_sondhi_rule(rule: SondhiRule) -> CompiledSondhiRule:
+    """
+    Compile a rule: the first word pattern is matched at a fixed distance
+    from the end, and the second word pattern at its beginning
+    """
+    word1, word1_length = compile_pattern(rule.word1)
+    alternatives = [compile_pattern(alternative) for alternative in
+                    ([rule.word2] if isinstance(rule.word2, str) else rule.word2)]
+    word2 = "|".join(f"(?:{alternative})" for alternative, _ in alternatives)
+
+    return CompiledSondhiRule(
+        rule.kind == REWRITE,
+        re.compile(word1 + "$", re.DOTALL),
+        word1_length,
+        re.compile(word2, re.DOTALL),
+        max(length for _, length in alternatives),
+        compile_replacement(rule.word1_replacement),
+        compile_replacement(rule.word2_replacement),
+        rule.imperative,
+    )
+
+
+class SondhiRuleTable(NamedTuple):
+    """
+    Compiled rules, and how many characters at the end of the first
+    word and at the start of the second they look at
+    """
+    rules: List[CompiledSondhiRule]
+    word1_context: int
+    word2_context: int
+
+
+def compile_sondhi_rules(rules: List[SondhiRule]) -> SondhiRuleTable:
+    """
+    Compile a table of rules. Rewrites keep the length of the first word,
+    so no rule looks further into it than its own pattern. One character
+    more of the second word tells whether a pattern matches all of it.
+    """
+    compiled = [compile_sondhi_rule(rule) for rule in rules]
+    return SondhiRuleTable(
+        compiled,
+        max(rule.word1_length for rule in compiled),
+        max(rule.word2_length for rule in compiled) + 1,
+    )
+
+
+def replace_match(match: "re.Match", replacement: Optional[List[Union[int, str]]]) -> str:
+    """
+    What the matched characters become
+    """
+    if replacement is None:
+        return match.group(0)
+    return "".join(match.group(item) if isinstance(item, int) else item for item in replacement)
+
+
+def apply_sondhi_rules(rules: List[CompiledSondhiRule], sondhi_word1: str,
+                       sondhi_word2: str, imperative: bool = False) -> str:
+    """
+    Join two words by the first matching rule
+    """
+    for rule in rules:
+        if rule.imperative is not None and rule.imperative != imperative:
+            continue
+
+        start = len(sondhi_word1) - rule.word1_length
+        if start < 0:
+            continue
+        match1 = rule.word1.match(sondhi_word1, start)
+        if match1 is None:
+            continue
+        match2 = rule.word2.match(sondhi_word2)
+        if match2 is None:
+            continue
+
+        sondhi_word1 = sondhi_word1[:start] + replace_match(match1, rule.word1_replacement)
+        if not rule.rewrite:
+            return sondhi_word1 + replace_match(match2, rule.word2_replacement) + sondhi_word2[match2.end():]
 
     return sondhi_word1 + sondhi_word2
 
 
-def bn_sondhi_preposition(sondhi_word1: str, sondhi_word2: str) -> str:
+SONDHI_RULE_TABLES: Dict[str, SondhiRuleTable] = {
+    name: compile_sondhi_rules(rules) for name, rules in [
+        ("verb_preposition", VERB_PREPOSITION_RULES),
+        ("preposition", PREPOSITION_RULES),
+        ("basic", BASIC_RULES),
+        ("possessive", POSSESSIVE_RULES),
+        ("verb_basic", VERB_BASIC_RULES),
+        ("verb_passive", VERB_PASSIVE_RULES),
+        ("verb_active_okar", VERB_ACTIVE_OKAR_RULES),
+        ("verb_active", VERB_ACTIVE_RULES),
+    ]
+}
+
+###########################################
+#
+#  Joins by word boundary
+#
+#  The rules only look at the last few characters of the first word and
+#  the first few of the second (see SondhiRuleTable), so joins are
+#  remembered by those, and a suffix joined to many words again costs
+#  a single lookup.
+#
+###########################################
+
+def join_words(rule_table: str, sondhi_word1: str, sondhi_word2: str,
+               imperative: bool = False) -> str:
     """
-    Apply general Bengali sandhi rules for prepositions
+    Join two words by the given table of rules
+    """
+    table = SONDHI_RULE_TABLES[rule_table]
+    split1 = max(0, len(sondhi_word1) - table.word1_context)
+    split2 = table.word2_context
+    return (sondhi_word1[:split1] +
+            join_word_boundary(rule_table, sondhi_word1[split1:], sondhi_word2[:split2], imperative) +
+            sondhi_word2[split2:])
+
+
+@functools.lru_cache(maxsize=settings.sondhi_cache_size)
+def join_word_boundary(rule_table: str, word1_end: str, word2_start: str,
+                       imperative: bool) -> str:
+    """
+    Join the end of a word to the start of the next by the given table
+    """
+    return apply_sondhi_rules(SONDHI_RULE_TABLES[rule_table].rules, word1_end, word2_start, imperative)
+
+
+def sondhi_cache_info() -> dict:
+    """
+    Hits, misses and size of the cache of joins by word boundary
+    """
+    info = join_word_boundary.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+def clear_sondhi_cache() -> None:
+    """
+    Forget all remembered joins
+    """
+    join_word_boundary.cache_clear()
+
+###########################################
+#
+#  Sandhi engines
+#
+###########################################
+
+def bn_verb_sondhi_preposition(sondhi_word1: str, sondhi_word2: str) -> str:
+    """
+    Apply Bengali sandhi rules for verb-preposition combinations
     """
     sondhi_word1 = sondhi_word1.rstrip()  # remove any trailing space
 
     if len(sondhi_word1) <= 1 or len(sondhi_word2) < 1:
         return sondhi_word1 + sondhi_word2
 
-    sondhi_wds_array1 = list(sondhi_word1)
-    sondhi_wds_array2 = list(sondhi_word2)
+    return join_words("verb_preposition", sondhi_word1, sondhi_word2)
 
-    # Preprocessing starts here
-    # Ex. 'lekh' => 'likh'
-    if (len(sondhi_wds_array1) >= 3
-            and sondhi_wds_array1[-3] == get_bn_letter('LA')
-            and sondhi_wds_array1[-2] == get_bn_letter('ekar')
-            and check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-        sondhi_wds_array1[-2] = get_bn_letter('ikar')
-        sondhi_word1 = ''.join(sondhi_wds_array1)
 
-    # TO BE Checked and CONFIRMED that its alright
-    # Ei+ti => Eti
-    if (len(sondhi_wds_array1) >= 2
-            and sondhi_wds_array1[-2] == get_bn_letter('E')
-            and sondhi_wds_array1[-1] == get_bn_letter('I')
-            and len(sondhi_wds_array2) >= 2
-            and sondhi_wds_array2[0] == get_bn_letter('TA')
-            and sondhi_wds_array2[1] == get_bn_letter('ikar')):
-        sondhi_wds_array1.pop()
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
+def bn_sondhi_preposition(sondhi_word1: str, sondhi_word2: str) -> str:
+    """
+    Apply general Bengali sandhi rules for prepositions
+    """
+    sondhi_word1 = sondhi_word1.rstrip()  # remove any trailing space
 
-    # "XX_ke+er_YY => XX_ar_YY (ex. amake+er jonyo = amar + jonyo)
-    if (len(sondhi_wds_array1) >= 2
-            and sondhi_wds_array1[-2] == get_bn_letter('KA')
-            and sondhi_wds_array1[-1] == get_bn_letter('ekar')
-            and len(sondhi_wds_array2) >= 2
-            and sondhi_wds_array2[0] == get_bn_letter('ekar')
-            and sondhi_wds_array2[1] == get_bn_letter('RA')):
-        sondhi_wds_array1 = sondhi_wds_array1[:-2]
-        sondhi_wds_array2.pop(0)
-        
-        if sondhi_wds_array1 and sondhi_wds_array1[-1] == get_bn_letter('RA'):
-            sondhi_wds_array1.pop()
-            
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-
-    if (len(sondhi_wds_array1) >= 3
-            and sondhi_wds_array1[-3] == ' '
-            and check_bn_letter(sondhi_wds_array1[-2]) == 'consonant'
-            and check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'
-            and len(sondhi_wds_array2) >= 2
-            and sondhi_wds_array2[0] == get_bn_letter('ekar')
-            and sondhi_wds_array2[1] == get_bn_letter('RA')):
-        sondhi_wds_array2[0] = get_bn_letter('akar')
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-
-    if (len(sondhi_wds_array1) >= 2
-            and (check_bn_letter(sondhi_wds_array1[-2]) in ['consonant', 'vowel', 'hasant', 'matra'])
-            and check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'
-            and len(sondhi_wds_array2) >= 2
-            and sondhi_wds_array2[0] == get_bn_letter('TA')
-            and sondhi_wds_array2[1] == get_bn_letter('ekar')):
-        sondhi_wds_array2.pop(0)
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-
-    if (check_bn_letter(sondhi_wds_array1[-1]) == 'matra'
-            and check_bn_letter(sondhi_wds_array2[0]) == 'matra'):
-        sondhi_wds_array2.pop(0)
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-
-    if (len(sondhi_wds_array2) >= 2
-            and (sondhi_wds_array1[-1] == get_bn_letter('anusvar')
-                 or check_bn_letter(sondhi_wds_array1[-1]) == sondhi_wds_array1[-1])
-            and sondhi_wds_array2[0] == get_bn_letter('ekar')
-            and sondhi_wds_array2[1] == get_bn_letter('RA')):
-        sondhi_wds_array2[0] = get_bn_letter('E')
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
+    if len(sondhi_word1) <= 1 or len(sondhi_word2) < 1:
+        return sondhi_word1 + sondhi_word2
 
-    return sondhi_word1 + sondhi_word2
+    return join_words("preposition", sondhi_word1, sondhi_word2)
 
 
 def bn_sondhi(sondhi_word1: str, sondhi_word2: str) -> str:
@@ -197,25 +490,7 @@ def bn_sondhi(sondhi_word1: str, sondhi_word2: str) -> str:
     if len(sondhi_word1) <= 1 or len(sondhi_word2) < 1:
         return sondhi_word1 + sondhi_word2
 
-    sondhi_wds_array1 = list(sondhi_word1)
-    sondhi_wds_array2 = list(sondhi_word2)
-
-    if (len(sondhi_wds_array1) >= 2
-            and check_bn_letter(sondhi_wds_array1[-2]) == 'matra'
-            and check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'
-            and len(sondhi_wds_array2) >= 2
-            and sondhi_wds_array2[0] == get_bn_letter('TA')
-            and sondhi_wds_array2[1] == get_bn_letter('ekar')):
-        sondhi_wds_array2.pop(0)
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-
-    if (check_bn_letter(sondhi_wds_array1[-1]) == 'matra'
-            and len(sondhi_wds_array2) > 0
-            and check_bn_letter(sondhi_wds_array2[0]) == 'matra'):
-        sondhi_wds_array2.pop(0)
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-
-    return sondhi_word1 + sondhi_word2
+    return join_words("basic", sondhi_word1, sondhi_word2)
 
 
 def bn_sondhi_possessive(sondhi_word1: str, sondhi_word2: str) -> str:
@@ -228,14 +503,7 @@ def bn_sondhi_possessive(sondhi_word1: str, sondhi_word2: str) -> str:
     if len(sondhi_word1) <= 1 or len(sondhi_word2) < 1:
         return sondhi_word1 + sondhi_word2
 
-    sondhi_wds_array1 = list(sondhi_word1)
-    sondhi_wds_array2 = list(sondhi_word2)
-
-    if check_bn_letter(sondhi_wds_array1[-1]) == 'matra':
-        sondhi_wds_array2.pop(0)
-        return ''.join(sondhi_wds_array1) + ''.join(sondhi_wds_array2)
-    
-    return sondhi_word1 + sondhi_word2
+    return join_words("possessive", sondhi_word1, sondhi_word2)
 
 
 def bn_verb_sondhi_basic(sondhi_word1: str, sondhi_word2: str) -> str:
@@ -248,15 +516,7 @@ def bn_verb_sondhi_basic(sondhi_word1: str, sondhi_word2: str) -> str:
     if len(sondhi_word1) <= 1 or len(sondhi_word2) < 1:
         return sondhi_word1 + sondhi_word2
 
-    sondhi_wds_array1 = list(sondhi_word1)
-    sondhi_wds_array2 = list(sondhi_word2)
-
-    if sondhi_wds_array1[-1] == get_bn_letter('ikar'):
-        sondhi_wds_array1[-1] = get_bn_letter('ekar')
-        return (''.join(sondhi_wds_array1) + get_bn_letter('O') + 
-                get_bn_letter('YYA') + ''.join(sondhi_wds_array2))
-
-    return sondhi_word1 + sondhi_word2
+    return join_words("verb_basic", sondhi_word1, sondhi_word2)
 
 
 def bn_verb_sondhi_passive(sondhi_word1: str, sondhi_word2: str) -> str:
@@ -269,22 +529,9 @@ def bn_verb_sondhi_passive(sondhi_word1: str, sondhi_word2: str) -> str:
     if len(sondhi_word1) <= 1 or len(sondhi_word2) < 1:
         return sondhi_word1 + sondhi_word2
 
-    # pad-up by 3 spaces to avoid array index problems
-    sondhi_word1 = "   " + sondhi_word1
-    sondhi_wds_array1 = list(sondhi_word1)
-    sondhi_wds_array2 = list(sondhi_word2)
-
-    if ((check_bn_letter(sondhi_wds_array1[-2]) == 'consonant' and 
-         check_bn_letter(sondhi_wds_array1[-1]) == 'consonant') or
-        (check_bn_letter(sondhi_wds_array1[-2]) == 'matra' and 
-         check_bn_letter(sondhi_wds_array1[-1]) == 'consonant')):
-        return sondhi_word1[3:] + sondhi_word2  # Remove padding before returning
-    else:
-        if sondhi_wds_array1[-1] == get_bn_letter('ikar'):
-            sondhi_wds_array1[-1] = get_bn_letter('ekar')
-            sondhi_word1 = ''.join(sondhi_wds_array1)
-        return (sondhi_word1[3:] + get_bn_letter('O') +  # Remove padding
-                get_bn_letter('YYA') + sondhi_word2)
+    # pad-up by 3 spaces so that rules see spaces before the word
+    joined = join_words("verb_passive", "   " + sondhi_word1, sondhi_word2)
+    return joined[3:]  # Remove padding before returning
 
 
 def bn_verb_sondhi_active(sondhi_word1: str, sondhi_word2: str, 
@@ -298,371 +545,39 @@ def bn_verb_sondhi_active(sondhi_word1: str, sondhi_word2: str,
     if len(sondhi_word1) <= 1 or len(sondhi_word2) < 1:
         return sondhi_word1 + sondhi_word2
 
-    # pad-up by 3 spaces to avoid array index problems
-    sondhi_word1 = "   " + sondhi_word1
-
-    if sondhi_word2 == get_bn_letter('okar'):
-        return bn_verb_sondhi_active_suffix_okar(sondhi_word1[3:], sondhi_word2)
-
-    sondhi_wds_array1 = list(sondhi_word1)
-    sondhi_wds_array2 = list(sondhi_word2)
-
-    # Ex. 'de' => 'di'
-    if (check_bn_letter(sondhi_wds_array1[-2]) == 'consonant' and 
-        sondhi_wds_array1[-1] == get_bn_letter('ekar')):
-        sondhi_wds_array1[-1] = get_bn_letter('ikar')
-        sondhi_word1 = ''.join(sondhi_wds_array1)
-
-    # Ex. 'lekh' => 'likh'
-    if (len(sondhi_wds_array1) >= 3 and 
-        sondhi_wds_array1[-3] == get_bn_letter('LA') and 
-        sondhi_wds_array1[-2] == get_bn_letter('ekar') and 
-        check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-        sondhi_wds_array1[-2] = get_bn_letter('ikar')
-        sondhi_word1 = ''.join(sondhi_wds_array1)
-
-    # 3rd person, present simple - XX + 'ekar'
-    if sondhi_word2 == get_bn_letter('ekar'):
-        # Ex. 'likh' => 'lekh' (reversal)
-        if (len(sondhi_wds_array1) >= 3 and 
-            sondhi_wds_array1[-3] == get_bn_letter('LA') and 
-            sondhi_wds_array1[-2] == get_bn_letter('ikar') and 
-            check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            sondhi_wds_array1[-2] = get_bn_letter('ekar')
-            sondhi_word1 = ''.join(sondhi_wds_array1)
-        
-        # Ex. 'di' => 'de'
-        if (len(sondhi_wds_array1) >= 2 and 
-            check_bn_letter(sondhi_wds_array1[-2]) == 'consonant' and 
-            sondhi_wds_array1[-1] == get_bn_letter('ikar')):
-            sondhi_wds_array1[-1] = get_bn_letter('ekar')
-            sondhi_word1 = ''.join(sondhi_wds_array1)
-
-        if ((check_bn_letter(sondhi_wds_array1[-2]) == 'consonant' or 
-            check_bn_letter(sondhi_wds_array1[-2]) == 'matra') and 
-            check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            return sondhi_word1[3:] + sondhi_word2  # Remove padding
-        else:
-            return sondhi_word1[3:] + map_to_proper_bn_letter(sondhi_word2)
-
-    # 2nd person, present simple - XX + 'ekar NA'
-    if sondhi_word2 == get_bn_letter('ekar') + get_bn_letter('NA'):
-        # Ex. 'likh' => 'lekh' (reversal)
-        if (len(sondhi_wds_array1) >= 3 and 
-            sondhi_wds_array1[-3] == get_bn_letter('LA') and 
-            sondhi_wds_array1[-2] == get_bn_letter('ikar') and 
-            check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            sondhi_wds_array1[-2] = get_bn_letter('ekar')
-            sondhi_word1 = ''.join(sondhi_wds_array1)
-
-        if ((check_bn_letter(sondhi_wds_array1[-2]) == 'consonant' or 
-             check_bn_letter(sondhi_wds_array1[-2]) == 'vowel' or 
-             sondhi_wds_array1[-2] == get_bn_letter('ekar')) and 
-            check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            if imperative_sentence_ind == 1:
-                sondhi_wds_array2[0] = get_bn_letter('ukar')
-            return sondhi_word1[3:] + ''.join(sondhi_wds_array2)
-        elif (check_bn_letter(sondhi_wds_array1[-2]) == 'matra' and 
-              check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            return sondhi_word1[3:] + sondhi_word2
-        else:
-            return sondhi_word1[3:] + map_to_proper_bn_letter(sondhi_word2)
-
-    # Future simple - XX + 'BA', 'be', 'ben'
-    if len(sondhi_wds_array2) > 0 and sondhi_wds_array2[0] == get_bn_letter('BA'):
-        if len(sondhi_wds_array1) > 0 and sondhi_wds_array1[-1] == get_bn_letter('ikar'):
-            sondhi_wds_array1[-1] = get_bn_letter('ekar')
-            return ''.join(sondhi_wds_array1)[3:] + ''.join(sondhi_wds_array2)
-        else:
-            return sondhi_word1[3:] + sondhi_word2
-
-    # Past simple - XX + 'lam', 'len', 'la'
-    if (sondhi_word2 == get_bn_letter('LA') or 
-        sondhi_word2 == get_bn_letter('LA') + get_bn_letter('akar') + get_bn_letter('MA') or 
-        sondhi_word2 == get_bn_letter('LA') + get_bn_letter('ekar') + get_bn_letter('NA')):
-        # YA akar + LA = GA akar + LA
-        if (len(sondhi_wds_array1) >= 3 and 
-            sondhi_wds_array1[-3] == " " and 
-            sondhi_wds_array1[-2] == get_bn_letter('YA') and 
-            sondhi_wds_array1[-1] == get_bn_letter('akar')):
-            sondhi_wds_array1[-2] = get_bn_letter('GA')
-            sondhi_word1 = ''.join(sondhi_wds_array1)
-
-        if len(sondhi_wds_array1) > 0 and sondhi_wds_array1[-1] == get_bn_letter('akar'):
-            sondhi_wds_array1[-1] = get_bn_letter('ekar')
-            return ''.join(sondhi_wds_array1)[3:] + sondhi_word2
-        else:
-            return sondhi_word1[3:] + sondhi_word2
-
-    # 1st person, present simple - XX + 'ikar'
-    if sondhi_word2 == get_bn_letter('ikar'):
-        # Ex. 'lekh' => 'likh'
-        if (len(sondhi_wds_array1) >= 3 and 
-            sondhi_wds_array1[-3] == get_bn_letter('LA') and 
-            sondhi_wds_array1[-2] == get_bn_letter('ekar') and 
-            check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            sondhi_wds_array1[-2] = get_bn_letter('ikar')
-            sondhi_word1 = ''.join(sondhi_wds_array1)
-
-        if ((check_bn_letter(sondhi_wds_array1[-2]) == 'consonant' or 
-              check_bn_letter(sondhi_wds_array1[-2]) == 'matra') and 
-            check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            return sondhi_word1[3:] + sondhi_word2
-        else:  # Ex. kha + akar + ikar => kha + akar + I
-            return sondhi_word1[3:] + map_to_proper_bn_letter(sondhi_word2)
-
-    # Present/past continuous - XX + 'chi', 'che', 'chen'
-    if (len(sondhi_wds_array2) >= 2 and 
-        sondhi_wds_array2[0] == get_bn_letter('CHA') and 
-        (sondhi_wds_array2[1] == get_bn_letter('ikar') or 
-         sondhi_wds_array2[1] == get_bn_letter('ekar'))):
-        if (len(sondhi_wds_array1) >= 2 and 
-            sondhi_wds_array1[-2] != " " and 
-            check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            return sondhi_word1[3:] + sondhi_word2
-        else:
-            # ...kh+ akar + chh + ... => ...kh + akar + ch+ chh..
-            return (sondhi_word1[3:] + get_bn_letter('CA') + 
-                    get_bn_letter('hasant') + sondhi_word2)
-
-    # Present/past perfect - XX + 'echhi', 'echhe', 'echhen'
-    if (len(sondhi_wds_array2) >= 3 and 
-        sondhi_wds_array2[0] == get_bn_letter('ekar') and 
-        sondhi_wds_array2[1] == get_bn_letter('CHA') and 
-        (sondhi_wds_array2[2] == get_bn_letter('ekar') or 
-         sondhi_wds_array2[2] == get_bn_letter('ikar'))):
-        # YA akar + LA = GA ikar + LA
-        if (len(sondhi_wds_array1) >= 3 and 
-            sondhi_wds_array1[-3] == " " and 
-            sondhi_wds_array1[-2] == get_bn_letter('YA') and 
-            sondhi_wds_array1[-1] == get_bn_letter('akar')):
-            sondhi_wds_array1[-2] = get_bn_letter('GA')
-            sondhi_wds_array1[-1] = get_bn_letter('ikar')
-            sondhi_word1 = ''.join(sondhi_wds_array1)
-
-        # Ex. 'bas' => 'bes'
-        if (len(sondhi_wds_array1) >= 3 and 
-            check_bn_letter(sondhi_wds_array1[-3]) == 'consonant' and 
-            sondhi_wds_array1[-2] == get_bn_letter('akar') and 
-            check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            sondhi_wds_array1[-2] = get_bn_letter('ekar')
-            sondhi_word1 = ''.join(sondhi_wds_array1)
-
-        # ...ha + ekar ... => ...ha + Ya+ ekar ..
-        if (len(sondhi_wds_array1) >= 2 and 
-            sondhi_wds_array1[-2] == " " and 
-            check_bn_letter(sondhi_wds_array1[-1]) == 'consonant'):
-            return sondhi_word1[3:] + get_bn_letter('YYA') + sondhi_word2
-        elif (len(sondhi_wds_array1) >= 2 and 
-              check_bn_letter(sondhi_wds_array1[-2]) == 'consonant' and 
-              sondhi_wds_array1[-1] == get_bn_letter('ikar')):
-            return sondhi_word1[3:] + get_bn_letter('YYA') + sondhi_word2
-        elif (len(sondhi_wds_array1) >= 3 and 
-              (check_bn_letter(sondhi_wds_array1[-3]) == 'consonant' or 
-              check_bn_letter(sondhi_wds_array1[-3]) == 'matra') and 
-              check_bn_letter(sondhi_wds_array1[-2]) == 'consonant' and 
-              sondhi_wds_array1[-1] == get_bn_letter('akar')):
-            if len(sondhi_wds_array1) >= 3 and sondhi_wds_array1[-3] == get_bn_letter('okar'):
-                sondhi_wds_array1[-3] = get_bn_letter('ukar')
-            sondhi_wds_array1[-1] = get_bn_letter('ikar')
-            return (''.join(sondhi_wds_array1)[3:] + 
-                    get_bn_letter('YYA') + sondhi_word2)
-        elif len(sondhi_wds_array1) > 0 and sondhi_wds_array1[-1] == get_bn_letter('akar'):
-            sondhi_wds_array1[-1] = get_bn_letter('ekar')
-            return (''.join(sondhi_wds_array1)[3:] + 
-                    get_bn_letter('YYA') + sondhi_word2)
-        else:
-            return sondhi_word1[3:] + sondhi_word2
-
-    return sondhi_word1[3:] + sondhi_word2  # Remove padding before returning
+    # pad-up by 3 spaces so that rules see spaces before the word
+    joined = join_words("verb_active", "   " + sondhi_word1, sondhi_word2,
+                        imperative_sentence_ind == 1)
+    return joined[3:]  # Remove padding before returning
 
 
 def bn_verb_sondhi_active_suffix_okar(sondhi_word1: str, sondhi_word2: str) -> str:
     """
-    Apply Bengali sandhi rules when suffix is 'okar'
-    """
-    sondhi_wds_array1 = list(sondhi_word1)
-    sondhi_wds_array2 = list(sondhi_word2)
-    
-    if check_bn_letter(sondhi_wds_array1[-1]) == 'matra':
-        if sondhi_wds_array1[-1] == get_bn_letter('ekar'):
-            sondhi_wds_array1[-1] = get_bn_letter('akar')
-            sondhi_word1 = ''.join(sondhi_wds_array1)
-        return sondhi_word1 + get_bn_letter('O')
-    
-    return sondhi_word1 + sondhi_word2
+    Apply Bengali sandhi rules when suffix is 'okar'. A first word ending
+    in a matra takes 'O' whatever the second word is; others are simply
+    joined to it.
+    """
+    if check_bn_letter(sondhi_word1[-1:]) != 'matra':
+        return sondhi_word1 + sondhi_word2
+    return join_words("verb_active_okar", sondhi_word1, get_bn_letter('okar'))
 
 
 def map_to_proper_bn_letter(bn_letter: str) -> str:
     """
     Return corresponding Bengali letter for a given letter
     """
-    bn_letter_table = {
-        'ি': 'ই',
-        'ে': 'য়',
-        'েন': 'ন',
-    }
-    
-    return bn_letter_table.get(bn_letter, bn_letter)
+    return BN_PROPER_LETTERS.get(bn_letter, bn_letter)
 
 
 def get_bn_letter(bn_letter: str) -> str:
     """
     Return Unicode Bengali letter for the given key
     """
-    bn_letter_table = {
-        'chandrabindu': 'ঁ',
-        'anusvar': 'ং',
-        ':': '0',
-        
-        'A': 'অ',
-        'AA': 'আ',
-        'I': 'ই',
-        'II': 'ঈ',
-        'U': 'উ',
-        'UU': 'ঊ',
-        'RI': 'ঋ',
-        'E': 'এ',
-        'AI': 'ঐ',
-        'O': 'ও',
-        'AU': 'ঔ',
-        
-        'KA': 'ক',
-        'KHA': 'খ',
-        'GA': 'গ',
-        'GHA': 'ঘ',
-        'NGA': 'ঙ',
-        'CA': 'চ',
-        'CHA': 'ছ',
-        'JA': 'জ',
-        'JHA': 'ঝ',
-        'NYA': 'ঞ',
-        'TTA': 'ট',
-        'TTHA': 'ঠ',
-        'DDA': 'ড',
-        'DDHA': 'ঢ',
-        'NNA': 'ণ',
-        'TA': 'ত',
-        'THA': 'থ',
-        'DA': 'দ',
-        'DHA': 'ধ',
-        'NA': 'ন',
-        'PA': 'প',
-        'PHA': 'ফ',
-        'BA': 'ব',
-        'BHA': 'ভ',
-        'MA': 'ম',
-        'YA': 'য',
-        'RA': 'র',
-        'LA': 'ল',
-        'SHA': 'শ',
-        'SSA': 'ষ',
-        'SA': 'স',
-        'HA': 'হ',
-        'RRA': 'ড়',
-        'RHA': 'ঢ়',
-        'YYA': 'য়',
-        
-        'akar': 'া',
-        'ikar': 'ি',
-        'iikar': 'ী',
-        'ukar': 'ু',
-        'uukar': 'ূ',
-        'rikar': 'ৃ',
-        'ekar': 'ে',
-        'oikar': 'ৈ',
-        'okar': 'ো',
-        'aukar': 'ৌ',
-        
-        'hasant': '্'
-    }
-    
-    return bn_letter_table.get(bn_letter, bn_letter)
+    return BN_LETTERS.get(bn_letter, bn_letter)
 
 
 def check_bn_letter(bn_letter: str) -> str:
     """
     Check the type of Bengali letter (vowel, consonant, matra, hasant)
     """
-    bn_letter_table = {
-        'ঁ': '0',
-        'ং': '0',
-        ':': '0',
-        
-        'অ': '1',
-        'আ': '1',
-        'ই': '1',
-        'ঈ': '1',
-        'উ': '1',
-        'ঊ': '1',
-        'ঋ': '1',
-        'এ': '1',
-        'ঐ': '1',
-        'ও': '1',
-        'ঔ': '1',
-        
-        'ক': '2',
-        'খ': '2',
-        'গ': '2',
-        'ঘ': '2',
-        'ঙ': '2',
-        'চ': '2',
-        'ছ': '2',
-        'জ': '2',
-        'ঝ': '2',
-        'ঞ': '2',
-        'ট': '2',
-        'ঠ': '2',
-        'ড': '2',
-        'ঢ': '2',
-        'ণ': '2',
-        'ত': '2',
-        'থ': '2',
-        'দ': '2',
-        'ধ': '2',
-        'ন': '2',
-        'প': '2',
-        'ফ': '2',
-        'ব': '2',
-        'ভ': '2',
-        'ম': '2',
-        'য': '2',
-        'র': '2',
-        'ল': '2',
-        'শ': '2',
-        'ষ': '2',
-        'স': '2',
-        'হ': '2',
-        'ড়': '2',
-        'ঢ়': '2',
-        'য়': '2',
-        
-        'া': '3',
-        'ি': '3',
-        'ী': '3',
-        'ু': '3',
-        'ূ': '3',
-        'ৃ': '3',
-        'ে': '3',
-        'ৈ': '3',
-        'ো': '3',
-        'ৌ': '3',
-        
-        '্': '4'
-    }
-    
-    bn_lt = bn_letter_table.get(bn_letter, None)
-    
-    if bn_lt is None:
-        return bn_letter  # default
-    elif bn_lt == "1":
-        return 'vowel'
-    elif bn_lt == "2":
-        return 'consonant'
-    elif bn_lt == "3":
-        return 'matra'
-    elif bn_lt == "4":
-        return 'hasant'
-    return bn_letter
-    
-
+    return BN_LETTER_CLASS.get(bn_letter, bn_letter)
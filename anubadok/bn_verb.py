@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+
+
+import os
+import json
+import hashlib
+import tempfile
+import itertools
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from anubadok import settings
+from anubadok import bn_dict
+from anubadok import bn_dict_compiler
+from anubadok import bn_sondhi
+from anubadok.bn_table import BnTable
+
+###########################################
+#
+#  Verb forms
+#
+#  The form of the main verb of a sentence depends on its voice,
+#  person, tense, aspect, modal verb, negation, formality and mood
+#  (a VerbState). It is a suffix and the sandhi rules joining it to
+#  the root verb (a VerbForm).
+#
+###########################################
+
+# Sandhi rules joining a root verb and its suffix
+ACTIVE = "active"
+PASSIVE = "passive"
+PREPOSITION = "preposition"
+
+VERB_JOINS = {
+    ACTIVE: "verb_active",
+    PASSIVE: "verb_passive",
+    PREPOSITION: "verb_preposition",
+}
+
+
+class VerbState(NamedTuple):
+    """
+    Everything about a sentence its main verb is conjugated by
+    """
+    passive: bool
+    should_ought: bool
+    can_may: bool
+    modal: str
+    negation: bool
+    person: Any
+    tense: str
+    tense_sc: str
+    formality_2: bool
+    imperative: bool
+
+
+class VerbForm(NamedTuple):
+    """
+    Suffix of a verb form and the sandhi rules joining it to the root verb
+    """
+    join: str
+    suffix: str
+    imperative: bool = False
+
+
+class VerbChoice(NamedTuple):
+    """
+    Column of a verb form in the paradigm tables, and whether the form
+    expresses the negation itself (so the negation word is dropped)
+    """
+    column: int
+    form: VerbForm
+    negated: bool
+
+
+def verb_form_of(state: VerbState) -> Tuple[VerbForm, bool]:
+    """
+    Find out the form of the main verb from the verb tables. Returns the
+    form and whether it expresses the negation itself.
+
+    Raises:
+        KeyError: If the tables have no form for a modal verb
+    """
+    if state.passive:
+        return passive_verb_form_of(state)
+
+    if state.should_ought:
+        negated = state.negation and BnTable.modal_verb_table_2_active_negation.get(
+            state.tense_sc, {}).get(state.modal)
+        suffix = negated or BnTable.modal_verb_table_2_active[state.tense_sc][state.modal]
+        return VerbForm(PASSIVE, suffix), bool(negated)
+    elif state.can_may:
+        negated = state.negation and BnTable.modal_verb_table_1_active_negation.get(state.modal)
+        suffix = negated or BnTable.modal_verb_table_1_active[state.modal]
+        suffix = bn_sondhi.bn_verb_sondhi_active(
+            suffix,
+            BnTable.verb_mod_table_active.get(state.person, {}).get(state.tense, {}).get('s', "")
+        )
+        return VerbForm(PREPOSITION, suffix.lstrip()), bool(negated)
+
+    negated = state.negation and BnTable.verb_mod_table_active_negation.get(
+        state.person, {}).get(state.tense, {}).get(state.tense_sc)
+    if negated:
+        return VerbForm(ACTIVE, negated), True
+
+    if state.formality_2 and state.tense == 'present' and state.tense_sc == 's':
+        suffix = BnTable.verb_mod_table_active_formality_2
+    else:
+        suffix = BnTable.verb_mod_table_active.get(
+            state.person, {}).get(state.tense, {}).get(state.tense_sc, "")
+    return VerbForm(ACTIVE, suffix, state.imperative), False
+
+
+def passive_verb_form_of(state: VerbState) -> Tuple[VerbForm, bool]:
+    """
+    Find out the form of the main verb of a passive sentence
+    """
+    if state.should_ought or state.can_may:
+        negated = state.negation and BnTable.modal_verb_table_passive_negation.get(
+            state.tense_sc, {}).get(state.modal)
+        suffix = negated or BnTable.modal_verb_table_passive[state.tense_sc][state.modal]
+        return VerbForm(PASSIVE if state.should_ought else PREPOSITION, suffix), bool(negated)
+
+    negated = state.negation and BnTable.verb_suffix_table_passive_negation.get(
+        state.tense, {}).get(state.tense_sc, "")
+    suffix = negated or BnTable.verb_suffix_table_passive.get(
+        state.tense, {}).get(state.tense_sc, "")
+    return VerbForm(PASSIVE, suffix), bool(negated)
+
+
+def all_verb_forms() -> List[VerbForm]:
+    """
+    Every form the verb tables give, in a fixed order
+    """
+    tenses = sorted(set(BnTable.verb_suffix_table_passive) |
+                    {tense for table in BnTable.verb_mod_table_active.values() for tense in table})
+    tense_scs = sorted(BnTable.modal_verb_table_passive)
+    modals = sorted(set(BnTable.modal_verb_table_1_active) |
+                    {modal for table in BnTable.modal_verb_table_2_active.values() for modal in table} |
+                    {modal for table in BnTable.modal_verb_table_passive.values() for modal in table})
+    modal_kinds = [(False, False, [""]), (True, False, modals), (False, True, modals)]
+
+    forms = []
+    for passive, (should_ought, can_may, modal_words), negation, person, tense, tense_sc, \
+            formality_2, imperative in itertools.product(
+                [False, True], modal_kinds, [False, True], sorted(BnTable.verb_mod_table_active),
+                tenses, tense_scs, [False, True], [False, True]):
+        for modal in modal_words:
+            state = VerbState(passive, should_ought, can_may, modal, negation, person,
+                              tense, tense_sc, formality_2, imperative)
+            try:
+                form, _ = verb_form_of(state)
+            except KeyError:
+                continue
+            if form not in forms:
+                forms.append(form)
+    return forms
+
+
+# Forms generated ahead of time; forms of unusual states are added as
+# they are met
+VERB_FORMS = all_verb_forms()
+
+# The sandhi rules only look at this many letters at the end of a root
+# verb, so roots ending alike are conjugated alike
+VERB_ENDING_SIZE = max(bn_sondhi.SONDHI_RULE_TABLES[rules].word1_context
+                       for rules in VERB_JOINS.values())
+
+# Paradigms kept on disk are valid as long as the forms and the rules are
+VERB_PARADIGM_VERSION = hashlib.sha1(repr([
+    VERB_FORMS, VERB_ENDING_SIZE,
+    [bn_sondhi.SONDHI_RULE_TABLES[rules] for rules in sorted(VERB_JOINS.values())]
+]).encode('utf-8')).hexdigest()
+
+###########################################
+#
+#  Verb paradigms
+#
+#  Every form of each root verb ending (the last VERB_ENDING_SIZE
+#  letters of a root verb), by the column of the form. Paradigms of the
+#  verbs of the dictionaries are generated when they are loaded and kept
+#  on disk along with them; others are generated when first needed.
+#
+###########################################
+
+class VerbParadigms:
+    """
+    Verb forms (columns) and paradigms (rows) of this process
+    """
+    forms: List[VerbForm] = list(VERB_FORMS)
+    columns: Dict[VerbForm, int] = {form: column for column, form in enumerate(VERB_FORMS)}
+    choices: Dict[VerbState, VerbChoice] = {}
+    paradigms: Dict[str, List[str]] = {}
+    # Dictionary generation the paradigms were generated for
+    generation: int = -1
+    lock = threading.RLock()
+
+
+def verb_choice(state: VerbState) -> VerbChoice:
+    """
+    Form of the main verb of a sentence in the given state
+
+    Raises:
+        KeyError: If the tables have no form for a modal verb
+    """
+    choice = VerbParadigms.choices.get(state)
+    if choice is None:
+        form, negated = verb_form_of(state)
+        with VerbParadigms.lock:
+            column = VerbParadigms.columns.get(form)
+            if column is None:
+                column = VerbParadigms.columns[form] = len(VerbParadigms.forms)
+                VerbParadigms.forms.append(form)
+            choice = VerbParadigms.choices[state] = VerbChoice(column, form, negated)
+    return choice
+
+
+def conjugate_verb(bn_root_verb: str, choice: VerbChoice) -> str:
+    """
+    Conjugate a Bengali root verb into the chosen form
+    """
+    if VerbParadigms.generation != bn_dict.BnDict.generation:
+        load_verb_paradigms()
+
+    bn_root_verb = bn_root_verb.rstrip()
+    ending = bn_root_verb[-VERB_ENDING_SIZE:]
+    paradigm = VerbParadigms.paradigms.get(ending)
+    if paradigm is None or choice.column >= len(paradigm):
+        paradigm = add_verb_paradigm(ending)
+    return bn_root_verb[:-VERB_ENDING_SIZE] + paradigm[choice.column]
+
+
+def join_verb(bn_root_verb: str, form: VerbForm) -> str:
+    """
+    Join a root verb and the suffix of a form by sandhi rules
+    """
+    if form.join == ACTIVE:
+        return bn_sondhi.bn_verb_sondhi_active(bn_root_verb, form.suffix, 1 if form.imperative else 0)
+    elif form.join == PASSIVE:
+        return bn_sondhi.bn_verb_sondhi_passive(bn_root_verb, form.suffix)
+    return bn_sondhi.bn_verb_sondhi_preposition(bn_root_verb, form.suffix)
+
+
+def verb_paradigm(ending: str, forms: List[VerbForm],
+                  paradigm: Optional[List[str]] = None) -> List[str]:
+    """
+    All given forms of root verbs with the given ending (the forms
+    already in the given paradigm are kept)
+    """
+    paradigm = list(paradigm or [])
+    paradigm.extend(join_verb(ending, form) for form in forms[len(paradigm):])
+    return paradigm
+
+
+def add_verb_paradigm(ending: str) -> List[str]:
+    """
+    Generate the paradigm of a root verb ending, or the forms it lacks
+    """
+    with VerbParadigms.lock:
+        paradigm = verb_paradigm(ending, VerbParadigms.forms, VerbParadigms.paradigms.get(ending))
+        VerbParadigms.paradigms[ending] = paradigm
+        return paradigm
+
+
+def load_verb_paradigms(force: bool = False) -> None:
+    """
+    Generate the paradigms of the verbs of the dictionaries, or read
+    them from disk if they were generated before for the same ones
+    """
+    with VerbParadigms.lock:
+        generation = bn_dict.BnDict.generation
+        if not force and generation == VerbParadigms.generation:
+            return
+
+        path = verb_paradigm_path()
+        signature, paradigms = read_verb_paradigms(path) if settings.use_verb_paradigm_db else (None, {})
+
+        # Like the compiled dictionary, they are kept for the dictionaries
+        # other than the local one
+        sources_signature = [bn_dict_compiler.source_signature(source)
+                             for source in bn_dict.compiled_dictionary_sources()]
+        if signature != sources_signature:
+            for bn_root_verb in bn_dict.verb_roots():
+                ending = bn_root_verb.rstrip()[-VERB_ENDING_SIZE:]
+                if ending not in paradigms:
+                    paradigms[ending] = verb_paradigm(ending, VERB_FORMS)
+
+            if settings.use_verb_paradigm_db:
+                try:
+                    write_verb_paradigms(path, sources_signature, paradigms)
+                except OSError:
+                    pass
+
+        # Forms added since are generated again when needed
+        VerbParadigms.paradigms = paradigms
+        VerbParadigms.generation = generation
+
+
+def verb_paradigm_path() -> str:
+    """
+    Location of the verb paradigms of the dictionaries
+    """
+    digest = bn_dict_compiler.sources_digest(bn_dict.compiled_dictionary_sources())
+    return os.path.join(settings.compiled_dict_dir, f"verbs.{digest}.json")
+
+
+def read_verb_paradigms(path: str) -> Tuple[Optional[list], Dict[str, List[str]]]:
+    """
+    Read verb paradigms kept on disk, along with the signature of the
+    dictionaries they were generated for (None if there are none)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data["version"] != VERB_PARADIGM_VERSION:
+            return None, {}
+        return data["signature"], data["paradigms"]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None, {}
+
+
+def write_verb_paradigms(path: str, signature: Optional[list],
+                         paradigms: Dict[str, List[str]]) -> None:
+    """
+    Keep verb paradigms on disk
+    """
+    size = len(VERB_FORMS)
+    data = json.dumps({
+        "version": VERB_PARADIGM_VERSION,
+        "signature": signature,
+        "paradigms": {ending: paradigm[:size] for ending, paradigm in paradigms.items()}
+    }, ensure_ascii=False)
+
+    # Write to a temp file and move it in place, like the compiled dictionary
+    target_dir = os.path.dirname(os.path.abspath(path))
+    os.makedirs(target_dir, exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(prefix=".verbs.", dir=target_dir)
+    try:
+        with open(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_file, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+def verb_paradigm_info() -> dict:
+    """
+    Number of verb forms and of root verb endings generated
+    """
+    with VerbParadigms.lock:
+        return {
+            "forms": len(VerbParadigms.forms),
+            "endings": len(VerbParadigms.paradigms),
+        }
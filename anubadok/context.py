@@ -32,40 +32,36 @@
 #___________________________________________________________________
 
 
-from anubadok.en_tools import match_pattern_and_modify_as_directed
+from anubadok.en_tools import PatternRules
 
 
-def disambiguate_prepositions(sentence):
-    """
-    The function tries to disambiguate preposition meanings
-    by understanding the context
-    """
-    
-    # Match the pattern and modify them: about CD
-    sentence = match_pattern_and_modify_as_directed(
-        2, "\tIN\tabout", "\tCD\t", 
-        "\tIN\tabout_approx", "__KEEP__", *sentence)
-
-    # Match the pattern and modify them: by DT 
-    sentence = match_pattern_and_modify_as_directed(
-        2, "by\tIN\tby", "\tDT\t", 
-        "by\tIN\tby_NN", "__KEEP__", *sentence)
+# Contextual meanings of prepositions
+preposition_rules = PatternRules([
+    # about CD
+    (("\tIN\tabout", "\tCD\t"),
+     ("\tIN\tabout_approx", "__KEEP__")),
 
-    # Match the pattern and modify them:  CD TO CD 
-    sentence = match_pattern_and_modify_as_directed(
-        3, "\tCD\t", "\tTO\t", "\tCD\t", 
-        "__KEEP__", "to_from\tIN\tto_from", "__KEEP__", *sentence)
+    # by DT
+    (("by\tIN\tby", "\tDT\t"),
+     ("by\tIN\tby_NN", "__KEEP__")),
 
-    # Match the pattern and modify them: from NP TO NP
-    sentence = match_pattern_and_modify_as_directed(
-        4, "\t\tfrom", "\tNP\t", "\tTO\t", "\tNP\t", 
-        "\tIGNR\t", "__KEEP__", "\tIN\tto_from", "__KEEP__", *sentence)
+    # CD TO CD
+    (("\tCD\t", "\tTO\t", "\tCD\t"),
+     ("__KEEP__", "to_from\tIN\tto_from", "__KEEP__")),
 
-    # Match the pattern and modify them: NP TO NP
-    sentence = match_pattern_and_modify_as_directed(
-        3, "\tNP\t", "\tTO\t", "\tNP\t", 
-        "__KEEP__", "\tIN\tto_from", "__KEEP__", *sentence)
+    # from NP TO NP
+    (("\t\tfrom", "\tNP\t", "\tTO\t", "\tNP\t"),
+     ("\tIGNR\t", "__KEEP__", "\tIN\tto_from", "__KEEP__")),
 
-    return sentence
+    # NP TO NP
+    (("\tNP\t", "\tTO\t", "\tNP\t"),
+     ("__KEEP__", "\tIN\tto_from", "__KEEP__")),
+])
 
 
+def disambiguate_prepositions(sentence):
+    """
+    The function tries to disambiguate preposition meanings
+    by understanding the context
+    """
+    return preposition_rules.apply(sentence)
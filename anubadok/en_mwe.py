@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from anubadok import settings
+from anubadok import bn_dict_compiler
+from anubadok.en_token import Token
+
+###########################################
+#
+#  Multiword expressions
+#
+#  Sets of words which together mean something (e.g. "according to")
+#  are concatenated into a single word with a given tag. They are read
+#  from data/mwe.db and ~/.anubadok/mwe.user.db, one per line:
+#
+#    words separated by spaces<TAB>tag of the concatenated word
+#
+#  Where expressions overlap in a sentence, the one listed first wins.
+#
+###########################################
+
+
+class MultiwordExpressions:
+    """
+    Index of multiword expressions by their first word, so that a
+    sentence is matched against all of them in a single pass
+    """
+
+    def __init__(self):
+        # First word -> lengths of the expressions starting with it
+        self.first_words: Dict[str, List[int]] = {}
+        # (Lower case) words of an expression -> (precedence, tag)
+        self.expressions: Dict[Tuple[str, ...], Tuple[int, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.expressions)
+
+    def add(self, words: List[str], given_tag: str) -> None:
+        """
+        Add an expression. An expression added again keeps its place
+        but takes the new tag.
+        """
+        words = tuple(word.lower() for word in words)
+        if len(words) < 2:
+            return
+
+        precedence = self.expressions.get(words, (len(self.expressions), ""))[0]
+        self.expressions[words] = (precedence, given_tag)
+
+        lengths = self.first_words.setdefault(words[0], [])
+        if len(words) not in lengths:
+            lengths.append(len(words))
+
+    def apply(self, sentence: List[Token]) -> List[Token]:
+        """
+        Concatenate the multiword expressions found in the sentence.
+        
+        Words are matched by their lemma (case insensitive). This gives
+        the same result as matching the expressions one after the other
+        in their listed order: earlier expressions win, and every
+        expression is matched from left to right.
+        """
+        lemmas = [token.lemma.lower() for token in sentence]
+        total_words = len(lemmas)
+        found = []
+
+        for i, lemma in enumerate(lemmas):
+            lengths = self.first_words.get(lemma)
+            if not lengths:
+                continue
+            for length in lengths:
+                entry = self.expressions.get(tuple(lemmas[i:i + length]))
+                if entry:
+                    found.append((entry[0], i, length, entry[1]))
+
+        if not found:
+            return sentence
+
+        # Take the matches in order of precedence, skipping the ones
+        # overlapping a match already taken
+        found.sort()
+        taken = [False] * total_words
+        matches = {}
+        for _, i, length, given_tag in found:
+            if not any(taken[i:i + length]):
+                taken[i:i + length] = [True] * length
+                matches[i] = (length, given_tag)
+
+        sentence_output = []
+        i = 0
+        while i < total_words:
+            if i in matches:
+                length, given_tag = matches[i]
+                tokens = sentence[i:i + length]
+                sentence_output.append(Token(
+                    ".".join(token.word for token in tokens),
+                    given_tag,
+                    ".".join(token.lemma for token in tokens)
+                ))
+                i += length
+            else:
+                sentence_output.append(sentence[i])
+                i += 1
+
+        return sentence_output
+
+
+class MweTable:
+    """
+    Multiword expressions of this process
+    """
+    expressions = MultiwordExpressions()
+    # Signature (path, mtime, size) of the files last loaded
+    signature: Optional[list] = None
+    lock = threading.Lock()
+
+
+def multiword_expression_sources() -> List[str]:
+    """
+    All multiword expression files in order of precedence (highest first)
+    """
+    return [
+        settings.primary_mwe_db,
+        settings.user_mwe_db
+    ]
+
+
+def load_multiword_expressions(force: bool = False) -> MultiwordExpressions:
+    """
+    Load the multiword expressions. They are loaded once per process
+    and read again only if any of the files has changed since.
+
+    Raises:
+        IOError: If the primary file cannot be read
+    """
+    with MweTable.lock:
+        sources = multiword_expression_sources()
+        signature = [bn_dict_compiler.source_signature(path) for path in sources]
+
+        if force or signature != MweTable.signature:
+            expressions = MultiwordExpressions()
+            for i, path in enumerate(sources):
+                try:
+                    read_multiword_expressions(path, expressions)
+                except IOError:
+                    if i == 0:
+                        raise IOError(f"Error! Could not open {path}.")
+
+            MweTable.expressions = expressions
+            MweTable.signature = signature
+
+        return MweTable.expressions
+
+
+def read_multiword_expressions(path: str, expressions: MultiwordExpressions) -> int:
+    """
+    Read a multiword expression file (words<TAB>tag per line)
+    """
+    count = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for entry in f:
+            entry = entry.strip()
+            if not entry:
+                continue
+
+            db_data = entry.split('\t')
+            if len(db_data) >= 2:
+                expressions.add(db_data[0].split(), db_data[1])
+                count += 1
+    return count
@@ -31,23 +31,46 @@
 # 02110-1301, USA.
 #___________________________________________________________________
 
+from functools import partial
+from typing import Iterable, Iterator
 
 from anubadok import context
 from anubadok import ens_parser
 from anubadok import bn_dict
-from anubadok.en_tools import match_pattern_and_modify_as_directed
+from anubadok import en_mwe
+from anubadok.en_token import Token, as_token, tokens_to_text
+from anubadok.en_tools import PatternRules
 
 
 def english_sentence_preprocessor(input_text: str) -> list:
     """
     Top-level processor for English sentences
     """
-    sentence_input = input_text.rstrip('\n').split('\n')
+    sentence_input = prepare_sentence_input(input_text)
     sentence = []
     sentence_output = []
+
+    for sts in sentence_input:
+        if sts.tag == "SENT":
+            sentence.append(sts)
+            sentence_output.extend(
+                english_sentence_preprocessor_sub(sentence)
+            )
+            sentence = []
+        else:
+            sentence.append(sts)
     
-    wds_array = []
-    tmp_string = ""
+    sentence_output.extend(sentence)
+    return sentence_output
+
+
+def prepare_sentence_input(input_text: str) -> list:
+    """
+    Split tagged text into lines, make sure that it ends with a sentence
+    boundary, drop the portions marked for removal and make tokens of
+    the remaining lines
+    """
+    sentence_input = input_text.rstrip('\n').split('\n')
     empty_sent = "\tSENT\t"
     remove_ind = False
     
@@ -63,27 +86,31 @@ def english_sentence_preprocessor(input_text: str) -> list:
         elif "<__ANUBADOK__REMOVE__END__>" in sts:
             remove_ind = False
         elif not remove_ind:
-            temp_output.append(sts)
+            sts = sts.replace("<__ANUBADOK__EMPTY__SENT__>", empty_sent)
+            temp_output.append(Token.from_string(sts))
     
-    sentence_input = temp_output
+    return temp_output
 
-    for sts in sentence_input:
-        sts = sts.replace("<__ANUBADOK__EMPTY__SENT__>", empty_sent)
-        
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
+
+def split_into_sentence_blocks(input_text: str, block_size: int) -> list:
+    """
+    Split tagged text into blocks of whole sentences, each of them
+    at least block_size lines long (except the last one). Every block
+    can be pre-processed and translated independently.
+    """
+    blocks = []
+    block = []
+    
+    for sts in prepare_sentence_input(input_text):
+        block.append(sts)
         
-        if wds_array[1] == "SENT":
-            sentence.append(sts)
-            sentence_output.extend(
-                english_sentence_preprocessor_sub(sentence)
-            )
-            sentence = []
-        else:
-            sentence.append(sts)
+        if len(block) >= block_size and sts.tag == "SENT":
+            blocks.append(tokens_to_text(block))
+            block = []
     
-    sentence_output.extend(sentence)
-    return sentence_output
+    if block:
+        blocks.append(tokens_to_text(block))
+    return blocks
 
 
 def english_sentence_preprocessor_sub(sentence: list) -> list:
@@ -91,48 +118,17 @@ def english_sentence_preprocessor_sub(sentence: list) -> list:
     Process each sentence individually
     """
     # Treat known cases where words together mean something
-    sentence = concatenate_set_of_two_given_words(sentence)
-    sentence = concatenate_set_of_three_given_words(sentence)
+    sentence = concatenate_multiword_expressions(sentence)
     
     # Match patterns and modify them
-    sentence = match_pattern_and_modify_as_directed(
-        2, "\t\thow", "\t\tbe", "\t\thow.be", "__KEEP__", *sentence
-    )
-    sentence = match_pattern_and_modify_as_directed(
-        2, "\t\thow", "\t\tdo", "\t\thow.do", "__KEEP__", *sentence
-    )
-    sentence = match_pattern_and_modify_as_directed(
-        2, "\t\thow", "\tMD\t", "\t\thow.do", "__KEEP__", *sentence
-    )
-    sentence = match_pattern_and_modify_as_directed(
-        2, "\t\thow", "\t\tto", "\t\thow.to", "\t\tto", *sentence
-    )
-    sentence = match_pattern_and_modify_as_directed(
-        2, "\t\thow", "\t\tnot.to", "\t\thow.to", "\t\tnot.to", *sentence
-    )
-    sentence = match_pattern_and_modify_as_directed(
-        2, "\t\thave", "\t\tto", "\t\thave.to", "\t\tto", *sentence
-    )
+    sentence = how_and_have_rules.apply(sentence)
     
     # Disambiguate contextual meanings of preposition
     sentence = context.disambiguate_prepositions(sentence)
 
-    # Noun processing
-    sentence = process_for_adjective_noun_adjustment(sentence)
-    sentence = process_for_noun_concatenation("NP", "NPS", sentence)
-    sentence = concatenate_NP_of_NP_and_tag_it_NP(sentence)
-    
-    # Verb tag adjustments
-    sentence = process_for_vvg_tag_adjustment(sentence)
-    sentence = process_for_vvn_tag_adjustment(sentence)
-    
-    # Phrasal verb processing
-    sentence = process_for_phrasal_adjustment(sentence)
-    sentence = process_for_phrasal_verb(sentence)
-    
-    # Other adjustments
-    sentence = process_for_interrogation_adjustment(sentence)
-    sentence = process_for_make_verb_adjustment(sentence)
+    # Noun processing, verb tag adjustments, phrasal verb processing
+    # and other adjustments (in a single pass)
+    sentence = run_transducers(sentence, sentence_transducers)
     
     # Insert logical blocks and parse
     sentence = ens_parser.insert_logical_block_marker(sentence)
@@ -141,121 +137,64 @@ def english_sentence_preprocessor_sub(sentence: list) -> list:
     return sentence
 
 
-def concatenate_set_of_three_given_words(sentence: list) -> list:
-    """
-    Concatenate set of three given words and assign a new tag
-    """
-    wordlist_array = [
-        # Prepositions
-        "as", "far", "as", "IN",
-        "as", "well", "as", "IN",
-        "by", "mean", "of", "IN",
-        "by", "means", "of", "IN",
-        "in", "accordance", "with", "IN",
-        "in", "addition", "to", "IN",
-        "in", "case", "of", "IN",
-        "in", "front", "of", "IN",
-        "in", "lieu", "of", "IN",
-        "in", "place", "of", "IN",
-        "in", "spite", "of", "IN",
-        "on", "account", "of", "IN",
-        "on", "behalf", "of", "IN",
-        "on", "top", "of", "IN",
-        "with", "respect", "to", "IN",
-        # Others
-        "on", "the", "fly", "RB",
-    ]
-    
-    total_no = len(wordlist_array)
-    
-    for i in range(0, total_no - 3, 4):
-        word_1 = wordlist_array[i]
-        word_2 = wordlist_array[i + 1]
-        word_3 = wordlist_array[i + 2]
-        given_tag = wordlist_array[i + 3]
-        
-        sentence = match_pattern_and_modify_as_directed(
-            3, f"\t\t{word_1}", f"\t\t{word_2}", f"\t\t{word_3}",
-            "__REMOVE__", "__REMOVE__",
-            f"__CONCAT__\t{given_tag}\t3", *sentence
-        )
-    
-    return sentence
+# Known cases where words together mean something:
+# (how, be) -> how.be etc.
+how_and_have_rules = PatternRules([
+    (("\t\thow", "\t\tbe"), ("\t\thow.be", "__KEEP__")),
+    (("\t\thow", "\t\tdo"), ("\t\thow.do", "__KEEP__")),
+    (("\t\thow", "\tMD\t"), ("\t\thow.do", "__KEEP__")),
+    (("\t\thow", "\t\tto"), ("\t\thow.to", "\t\tto")),
+    (("\t\thow", "\t\tnot.to"), ("\t\thow.to", "\t\tnot.to")),
+    (("\t\thave", "\t\tto"), ("\t\thave.to", "\t\tto")),
+])
+
+
+def concatenate_multiword_expressions(sentence: list) -> list:
+    """
+    Concatenate sets of words which together mean something (see
+    data/mwe.db) and assign a new tag
+    """
+    return en_mwe.load_multiword_expressions().apply(sentence)
 
 
-def concatenate_set_of_two_given_words(sentence: list) -> list:
-    """
-    Concatenate set of two given words and assign a new tag
-    """
-    wordlist_array = [
-        # Prepositions
-        "about", "to", "IN",
-        "accord", "to", "IN",
-        "according", "to", "IN",
-        "ahead", "of", "IN",
-        "as", "to", "IN",
-        "aside", "from", "IN",
-        "because", "of", "IN",
-        "close", "to", "IN",
-        "consist", "of", "IN",
-        "due", "to", "IN",
-        "except", "for", "IN",
-        "far", "from", "IN",
-        "in", "to", "IN",
-        "inside", "of", "IN",
-        "instead", "of", "IN",
-        "near", "to", "IN",
-        "next", "to", "IN",
-        "on", "to", "IN",
-        "out", "from", "IN",
-        "out", "of", "IN",
-        "outside", "of", "IN",
-        "owing", "to", "IN",
-        "prior", "to", "IN",
-        "pursuant", "to", "IN",
-        "regardless", "of", "IN",
-        "subsequent", "to", "IN",
-        "similar", "to", "IN",
-        "with", "no", "IN",
-        #
-        "not", "to", "IN",
-        "up", "to", "IN",
-        "such", "as", "IN",
-        "no", "such", "DT",
-        "no", "more", "DT",
-        "no", "longer", "DT",
-        # Others
-        "to", "whom", "WP",
-        "each", "other", "PP",
-        "think", "tank", "NN",
-    ]
+def run_transducers(sentence: list, transducers: list) -> list:
+    """
+    Run the tokens of a sentence through a chain of transducers at once
     
-    total_no = len(wordlist_array)
+    Each transducer takes an iterator of tokens and yields the modified
+    tokens, holding back only those which it may still modify. Chaining
+    them makes a single pass over the sentence, with the same result as
+    running them one after the other. A transducer is left out of the
+    chain if the sentence has none of the tags it needs (counting the
+    tags which the transducers before it may introduce).
     
-    for i in range(0, total_no - 2, 3):
-        word_1 = wordlist_array[i]
-        word_2 = wordlist_array[i + 1]
-        given_tag = wordlist_array[i + 2]
+    Args:
+        sentence: Tokens of the sentence
+        transducers: (transducer, tags needed, tags introduced) in order
         
-        sentence = match_pattern_and_modify_as_directed(
-            2, f"\t\t{word_1}", f"\t\t{word_2}",
-            "__REMOVE__", f"__CONCAT__\t{given_tag}\t2",
-            *sentence
-        )
-    return sentence
+    Returns:
+        Modified tokens of the sentence
+    """
+    tags = {sts.tag for sts in sentence}
+    tokens = iter(sentence)
+    
+    for transducer, needed_tags, new_tags in transducers:
+        if not tags.isdisjoint(needed_tags):
+            tokens = transducer(tokens)
+            tags |= new_tags
+    
+    return list(tokens)
 
 
-def concatenate_NP_of_NP_and_tag_it_NP(sentence_input: list) -> list:
+def NP_of_NP(sentence_input: Iterable[Token]) -> Iterator[Token]:
     """
     Concatenate three successive words if they match NP of NP pattern
     """
-    sentence_output = []
+    pending = []  # Last two words, which may still be concatenated
     
-    word_1_tag_1 = "NP"
-    word_1_tag_2 = "NPS"
+    word_1_tags = {"NP", "NPS"}
     word_2 = "of"
-    word_3_tag_1 = "NP"
-    word_3_tag_2 = "NPS"
+    word_3_tags = {"NP", "NPS"}
     given_tag = "NP"
     
     word_position = 0
@@ -265,283 +204,215 @@ def concatenate_NP_of_NP_and_tag_it_NP(sentence_input: list) -> list:
     word_2_ind = False
     
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
-        
-        if not word_1_ind and (wds_array[1] == word_1_tag_1 or wds_array[1] == word_1_tag_2):
+        if not word_1_ind and sts.tag in word_1_tags:
             last_word_1_position = word_position
-            sentence_output.append(sts)
+            pending.append(sts)
             word_1_ind = True
         
-        elif word_1_ind and wds_array[0].lower() == word_2:
+        elif word_1_ind and sts.word.lower() == word_2:
             last_word_2_position = word_position
-            sentence_output.append(sts)
+            pending.append(sts)
             word_2_ind = True
         
-        elif word_1_ind and word_2_ind and (wds_array[1] == word_3_tag_1 or wds_array[1] == word_3_tag_2):
+        elif word_1_ind and word_2_ind and sts.tag in word_3_tags:
             word_1_ind = False  # reset
             word_2_ind = False  # reset
             
             if (word_position == last_word_1_position + 2 and 
                 word_position == last_word_2_position + 1):
                 
-                ppst = sentence_output[last_word_1_position]
-                wds_tmp_array_1 = ppst.split('\t')
-                
-                ppst = sentence_output[last_word_2_position]
-                wds_tmp_array_2 = ppst.split('\t')
+                tmp_token_1, tmp_token_2 = pending[-2], pending[-1]
                 
-                ppst = f"{wds_tmp_array_1[0]}.{wds_tmp_array_2[0]}.{wds_array[0]}"
+                ppst = f"{tmp_token_1.word}.{tmp_token_2.word}.{sts.word}"
                 
                 if bn_dict.dictionary_prelim_lookup(f"{ppst.lower()}:{given_tag}", 1):
-                    ppst = (
-                        f"{wds_tmp_array_1[0]}.{wds_tmp_array_2[0]}.{wds_array[0]}"
-                        f"\t{given_tag}\t"
-                        f"{wds_tmp_array_1[0].lower()}.{wds_tmp_array_2[0].lower()}.{wds_array[0].lower()}"
+                    ppst = Token(
+                        ppst,
+                        given_tag,
+                        f"{tmp_token_1.word.lower()}.{tmp_token_2.word.lower()}.{sts.word.lower()}"
                     )
                     
-                    # Replace the first word with concatenated version
-                    sentence_output[last_word_1_position] = ppst
-                    # Remove the "of" word
-                    del sentence_output[last_word_2_position]
+                    # Replace the first word and the "of" word with
+                    # concatenated version
+                    pending[-2:] = [ppst]
                     
                     word_position -= 2  # adjust position counter
                 else:
-                    sentence_output.append(sts)
+                    pending.append(sts)
             else:
-                sentence_output.append(sts)
+                pending.append(sts)
         else:
             word_1_ind = False  # reset
-            sentence_output.append(sts)
+            pending.append(sts)
         
         word_position += 1
+        
+        while len(pending) > 2:
+            yield pending.pop(0)
     
-    return sentence_output
+    yield from pending
 
 
-def process_for_adjective_noun_adjustment(sentence_input: list) -> list:
+def adjective_noun_adjustment(sentence_input: Iterable[Token]) -> Iterator[Token]:
     """
     Check for 'JJ and NN' patterns and concatenate them if present in dictionary
     """
-    sentence_output = []
-    word_position = 0
-    last_adj_position = 0
-    word_adj_ind = False
+    adjective = None  # Last word, if it is an adjective
 
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
-
-        if wds_array[1] == "JJ":
-            last_adj_position = word_position
-            sentence_output.append(sts)
-            word_adj_ind = True
-        elif word_adj_ind and wds_array[1] in {"NN", "NNS", "NP", "NPS"}:
-            word_adj_ind = False  # reset
-
-            if word_position == last_adj_position + 1:
-                ppst = sentence_output[last_adj_position]
-                wds_tmp_array = ppst.split('\t')
-                
+        if adjective is not None:
+            if sts.tag in {"NN", "NNS", "NP", "NPS"}:
                 # Check whether it's in dictionary
-                tag = wds_array[1]
+                tag = sts.tag
                 if tag == "NPS":
                     tag = "NP"
                 elif tag == "NNS":
                     tag = "NN"
                 
-                lookup_word = f"{wds_tmp_array[0].lower()}.{wds_array[0].lower()}:{tag}"
+                lookup_word = f"{adjective.word.lower()}.{sts.word.lower()}:{tag}"
                 
                 if bn_dict.dictionary_prelim_lookup(lookup_word, True):
-                    ppst = (
-                        f"{wds_tmp_array[0]}.{wds_array[0]}\t"
-                        f"{tag}\t"
-                        f"{wds_tmp_array[0].lower()}.{wds_array[0].lower()}"
-                    )
-                    
                     # Replace the adjective with concatenated version
-                    sentence_output[last_adj_position] = ppst
-                    word_position -= 1  # adjust position counter
-                else:
-                    sentence_output.append(sts)
-            else:
-                sentence_output.append(sts)
-        else:
-            sentence_output.append(sts)
+                    yield Token(
+                        f"{adjective.word}.{sts.word}",
+                        tag,
+                        f"{adjective.word.lower()}.{sts.word.lower()}"
+                    )
+                    adjective = None
+                    continue
+            
+            yield adjective
+            adjective = None
         
-        word_position += 1
+        if sts.tag == "JJ":
+            adjective = sts
+        else:
+            yield sts
     
-    return sentence_output
+    if adjective is not None:
+        yield adjective
 
 
-def process_for_noun_concatenation(noun_tag_1: str, noun_tag_2: str, sentence_input: list) -> list:
+def noun_concatenation(noun_tag_1: str, noun_tag_2: str,
+                       sentence_input: Iterable[Token]) -> Iterator[Token]:
     """
     Concatenate successive proper nouns (e.g., "Golam Mortuza Hossain" => "Golam.Mortuza.Hossain")
     """
-    sentence_output = []
-    word_position = 0
-    last_NP_position = 0
-    word_NP_ind = False
+    noun = None  # Nouns concatenated so far
 
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
-
-        if wds_array[1] == noun_tag_1 or wds_array[1] == noun_tag_2:
-            if not word_NP_ind:
-                last_NP_position = word_position
-                sentence_output.append(sts)
-                word_NP_ind = True
+        if sts.tag == noun_tag_1 or sts.tag == noun_tag_2:
+            if noun is None:
+                noun = sts
             else:
-                ppst = sentence_output[last_NP_position]
-                wds_tmp_array = ppst.split('\t')
-                
-                ppst = (
-                    f"{wds_tmp_array[0]}.{wds_array[0]}\t"
-                    f"{noun_tag_1}\t"
-                    f"{wds_tmp_array[0].lower()}.{wds_array[0].lower()}"
+                noun = Token(
+                    f"{noun.word}.{sts.word}",
+                    noun_tag_1,
+                    f"{noun.word.lower()}.{sts.word.lower()}"
                 )
-                
-                # Replace the first noun with concatenated version
-                sentence_output[last_NP_position] = ppst
-                word_position -= 1  # adjust position counter
         else:
-            sentence_output.append(sts)
-            word_NP_ind = False  # reset
-        
-        word_position += 1
+            if noun is not None:
+                yield noun
+                noun = None
+            yield sts
     
-    return sentence_output
+    if noun is not None:
+        yield noun
 
 
-def process_for_phrasal_adjustment(sentence_input: list) -> list:
+def phrasal_adjustment(sentence_input: Iterable[Token]) -> Iterator[Token]:
     """
     Check for two successive prepositions followed by a verb and adjust tags
     """
-    sentence_output = []
-    word_position = 0
+    previous = None  # Last word, which may still be tagged RP
     verb_preposition_ind = False
 
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
-
-        if (wds_array[1] in {"IN", "TO"} and 
-            wds_array[0].lower() != "because" and  # Exceptions should be listed here
-            ens_parser.check_for_mainverb(sentence_input[word_position-1])):
+        if (sts.tag in {"IN", "TO"} and 
+            sts.word.lower() != "because" and  # Exceptions should be listed here
+            previous is not None and ens_parser.check_for_mainverb(previous)):
             verb_preposition_ind = True
-            sentence_output.append(sts)
         elif (verb_preposition_ind and 
-              wds_array[1] in {"IN", "TO"}):
-            ppst = sentence_output[word_position-1]
-            wds_tmp_array = ppst.split('\t')
-            ppst = f"{wds_tmp_array[0]}\tRP\t{wds_tmp_array[0]}"
-            
+              sts.tag in {"IN", "TO"}):
             # Replace the preposition with RP tag
-            sentence_output[word_position-1] = ppst
+            previous = Token(previous.word, "RP", previous.word)
             verb_preposition_ind = False
-            sentence_output.append(sts)
         else:
-            sentence_output.append(sts)
             verb_preposition_ind = False
         
-        word_position += 1
+        if previous is not None:
+            yield previous
+        previous = sts
     
-    return sentence_output
+    if previous is not None:
+        yield previous
 
 
-def process_for_make_verb_adjustment(sentence_input: list) -> list:
+def make_verb_adjustment(sentence_input: Iterable[Token]) -> Iterator[Token]:
     """
     Check for 'make sure' pattern and concatenate them
     """
-    sentence_output = []
-    word_position = 0
-    last_make_position = 0
-    word_make_ind = False
+    make = None  # Last word, if it is the verb 'make'
 
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
-
-        if wds_array[0].lower() == 'make' and wds_array[1] == "VV":
-            last_make_position = word_position
-            sentence_output.append(sts)
-            word_make_ind = True
-        elif word_make_ind and wds_array[0].lower() == 'sure':
-            word_make_ind = False  # reset
-
-            if word_position == last_make_position + 1:
-                ppst = sentence_output[last_make_position]
-                wds_tmp_array = ppst.split('\t')
-                
-                ppst = (
-                    f"{wds_tmp_array[0]}.{wds_array[0]}\t"
-                    f"{wds_tmp_array[1]}\t"
-                    f"{wds_tmp_array[0].lower()}.{wds_array[0].lower()}"
-                )
-                
+        if make is not None:
+            if sts.word.lower() == 'sure':
                 # Replace "make" with "make.sure"
-                sentence_output[last_make_position] = ppst
-                word_position -= 1  # adjust position counter
-            else:
-                sentence_output.append(sts)
-        else:
-            sentence_output.append(sts)
+                yield Token(
+                    f"{make.word}.{sts.word}",
+                    make.tag,
+                    f"{make.word.lower()}.{sts.word.lower()}"
+                )
+                make = None
+                continue
+            
+            yield make
+            make = None
         
-        word_position += 1
+        if sts.word.lower() == 'make' and sts.tag == "VV":
+            make = sts
+        else:
+            yield sts
     
-    return sentence_output
+    if make is not None:
+        yield make
 
 
-def process_for_interrogation_adjustment(sentence_input: list) -> list:
+def interrogation_adjustment(sentence_input: Iterable[Token]) -> Iterator[Token]:
     """
     Check for 'how many' pattern and concatenate them
     """
-    sentence_output = []
-    word_position = 0
-    last_how_position = 0
-    word_how_ind = False
+    how = None  # Last word, if it is 'how'
 
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
-
-        if wds_array[1] == "WRB" and wds_array[0].lower() == 'how':
-            last_how_position = word_position
-            sentence_output.append(sts)
-            word_how_ind = True
-        elif word_how_ind and wds_array[1] in {"RB", "JJ"}:
-            word_how_ind = False  # reset
-
-            if word_position == last_how_position + 1:
-                ppst = sentence_output[last_how_position]
-                wds_tmp_array = ppst.split('\t')
-                
-                ppst = (
-                    f"{wds_tmp_array[0]}.{wds_array[0]}\t"
-                    f"{wds_tmp_array[1]}\t"
-                    f"{wds_tmp_array[0].lower()}.{wds_array[0].lower()}"
-                )
-                
+        if how is not None:
+            if sts.tag in {"RB", "JJ"}:
                 # Replace "how" with concatenated version
-                sentence_output[last_how_position] = ppst
-                word_position -= 1  # adjust position counter
-            else:
-                sentence_output.append(sts)
-        else:
-            sentence_output.append(sts)
+                yield Token(
+                    f"{how.word}.{sts.word}",
+                    how.tag,
+                    f"{how.word.lower()}.{sts.word.lower()}"
+                )
+                how = None
+                continue
+            
+            yield how
+            how = None
         
-        word_position += 1
+        if sts.tag == "WRB" and sts.word.lower() == 'how':
+            how = sts
+        else:
+            yield sts
     
-    return sentence_output
+    if how is not None:
+        yield how
 
 
-def process_for_vvn_tag_adjustment(sentence_input: list) -> list:
+def vvn_tag_adjustment(sentence_input: Iterable[Token]) -> Iterator[Token]:
     """
     Check for unaccompanied VVN and change their tag to JJ
     """
-    sentence_output = []
-    word_position = 0
+    previous = None
 
     verb_hhh_ind = False
     verb_aiaw_ind = False
@@ -549,49 +420,44 @@ def process_for_vvn_tag_adjustment(sentence_input: list) -> list:
     noun_ind = False
 
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
-
-        if wds_array[1] in {"VHP", "VH", "VHZ", "VHD"}:
+        word = sts
+        
+        if sts.tag in {"VHP", "VH", "VHZ", "VHD"}:
             verb_hhh_ind = True
-        elif wds_array[1] in {"PP", "WP"}:
+        elif sts.tag in {"PP", "WP"}:
             pp_ind = True
-        elif wds_array[1] in {"NN", "NNS", "NP", "NPS"}:
+        elif sts.tag in {"NN", "NNS", "NP", "NPS"}:
             noun_ind = True
-        elif wds_array[1] in {"VBP", "VBZ", "VBD", "VBN", "VB"}:
+        elif sts.tag in {"VBP", "VBZ", "VBD", "VBN", "VB"}:
             verb_aiaw_ind = True
-        elif wds_array[1] == "VVN":
-            if (check_for_given_tag("IN", sentence_input[word_position-1]) or
+        elif sts.tag == "VVN":
+            if ((previous is not None and previous.tag == "IN") or
                 (not verb_hhh_ind and not verb_aiaw_ind and not pp_ind and not noun_ind)):
-                sts = f"{wds_array[0]}\tJJ\t{wds_array[2]}"
+                sts = sts._replace(tag="JJ")
             elif (not verb_hhh_ind and not verb_aiaw_ind and (pp_ind or noun_ind)):
-                sts = f"{wds_array[0]}\tVVD\t{wds_array[2]}"
+                sts = sts._replace(tag="VVD")
             
             # Reset indicators
             verb_hhh_ind = verb_aiaw_ind = pp_ind = noun_ind = False
-        elif wds_array[1] in {"DT", "VVP", "VVZ", "VVD", "VVG", "VV"}:
+        elif sts.tag in {"DT", "VVP", "VVZ", "VVD", "VVG", "VV"}:
             # Reset indicators
             verb_hhh_ind = verb_aiaw_ind = pp_ind = noun_ind = False
         
-        word_position += 1
-        sentence_output.append(sts)
-    
-    return sentence_output
+        previous = word
+        yield sts
 
 
-def check_for_given_tag(tag: str, word: str) -> bool:
+def check_for_given_tag(tag: str, word) -> bool:
     """
-    Check whether the string contains the given tag
+    Check whether the token has the given tag
     """
-    words_array = word.split('\t')
-    return len(words_array) > 1 and words_array[1] == tag
+    return as_token(word).tag == tag
 
 
-def process_for_vvg_tag_adjustment(sentence_input: list) -> list:
+def vvg_tag_adjustment(sentence_input: Iterable[Token]) -> Iterator[Token]:
     """
     Check for unaccompanied VVG and change their tag to NN
     """
-    sentence_output = []
     word_position = 0
 
     verb_hhh_ind = False
@@ -599,38 +465,33 @@ def process_for_vvg_tag_adjustment(sentence_input: list) -> list:
     preposition_ind = False
 
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
-
-        if wds_array[1] == "IN":
+        if sts.tag == "IN":
             preposition_ind = True
-        elif wds_array[1] in {"VHP", "VHZ", "VHD"}:
+        elif sts.tag in {"VHP", "VHZ", "VHD"}:
             verb_hhh_ind = True
-        elif wds_array[1] in {"VBP", "VBZ", "VBD", "VBN", "VB"}:
+        elif sts.tag in {"VBP", "VBZ", "VBD", "VBN", "VB"}:
             verb_aiaw_ind = True
-        elif wds_array[1] == "VVG" and word_position != 0:
+        elif sts.tag == "VVG" and word_position != 0:
             if not verb_aiaw_ind and not preposition_ind:
-                new_tag = new_tag_for_unaccompanied_vvg(wds_array[0])
+                new_tag = new_tag_for_unaccompanied_vvg(sts.word)
                 
                 if new_tag == "IN":
-                    sts = f"{wds_array[0]}\t{new_tag}\t{wds_array[0]}"
+                    sts = Token(sts.word, new_tag, sts.word)
                 else:
-                    sts = f"{wds_array[0]}\t{new_tag}\t{wds_array[2]}"
+                    sts = sts._replace(tag=new_tag)
             else:
                 verb_aiaw_ind = preposition_ind = False
-        elif wds_array[1] in {"SENT", "DT"}:
+        elif sts.tag in {"SENT", "DT"}:
             verb_hhh_ind = verb_aiaw_ind = preposition_ind = False
-            if wds_array[1] == "SENT":
+            if sts.tag == "SENT":
                 word_position = 0
-        elif wds_array[1] and wds_array[1] not in {"RB", "RBR", "RBS"}:
+        elif sts.tag and sts.tag not in {"RB", "RBR", "RBS"}:
             preposition_ind = False
         
-        if wds_array[1]:
+        if sts.tag:
             word_position += 1
         
-        sentence_output.append(sts)
-    
-    return sentence_output
+        yield sts
 
 
 def new_tag_for_unaccompanied_vvg(word: str) -> str:
@@ -644,48 +505,123 @@ def new_tag_for_unaccompanied_vvg(word: str) -> str:
     return known_list_of_vvg.get(word.lower(), "NN")
 
 
-def process_for_phrasal_verb(sentence_input: list) -> list:
+def phrasal_verb(sentence_input: Iterable[Token]) -> Iterator[Token]:
     """
     Check for 'RP' particles and attach them to the last verb
     """
-    sentence_output = []
+    pending = []  # Words from the last verb on, while a particle may be attached to it
     word_position = 0
     last_SENT_position = 0
     last_verb_position = 0
 
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array.extend([''] * (3 - len(wds_array)))  # Ensure at least 3 elements
-
-        if wds_array[1] in {"SENT", "CC", ";", ","}:
+        if sts.tag in {"SENT", "CC", ";", ","}:
             last_SENT_position = word_position
-            sentence_output.append(sts)
-        elif wds_array[1] in {"VV", "VVD", "VVG", "VVN", "VVP", "VVZ"}:
+            yield from pending
+            pending = []
+            yield sts
+        elif sts.tag in {"VV", "VVD", "VVG", "VVN", "VVP", "VVZ"}:
             last_verb_position = word_position
-            sentence_output.append(sts)
-        elif wds_array[1] == "RP":
-            if last_verb_position > last_SENT_position:
-                ppst = sentence_output[last_verb_position]
-                wds_tmp_array = ppst.split('\t')
-                ppst = wds_tmp_array[2].strip()
-                
-                ppst = (
-                    f"{wds_tmp_array[0]}.{wds_array[0].lower()}\t"
-                    f"{wds_tmp_array[1]}\t"
-                    f"{ppst}.{wds_array[0].lower()}"
-                )
-                
-                # Replace the verb with verb.particle
-                sentence_output[last_verb_position] = ppst
-                last_verb_position = last_SENT_position  # reset
-                word_position -= 1  # adjust position counter
-            else:
-                sentence_output.append(sts)
+            yield from pending
+            pending = [sts]
+        elif sts.tag == "RP" and last_verb_position > last_SENT_position:
+            tmp_token = pending[0]
+            ppst = tmp_token.lemma.strip()
+            
+            # Replace the verb with verb.particle
+            pending[0] = Token(
+                f"{tmp_token.word}.{sts.word.lower()}",
+                tmp_token.tag,
+                f"{ppst}.{sts.word.lower()}"
+            )
+            last_verb_position = last_SENT_position  # reset
+            word_position -= 1  # adjust position counter
+            yield from pending
+            pending = []
+        elif pending:
+            pending.append(sts)
         else:
-            sentence_output.append(sts)
+            yield sts
         
         word_position += 1
     
-    return sentence_output
-    
+    yield from pending
+
+
+# Noun processing, verb tag adjustments, phrasal verb processing and
+# other adjustments of a sentence (in this order), each with the tags
+# it needs to change anything and the tags it may introduce
+sentence_transducers = [
+    (adjective_noun_adjustment, {"JJ"}, {"NN", "NP"}),
+    (partial(noun_concatenation, "NP", "NPS"), {"NP", "NPS"}, {"NP"}),
+    (NP_of_NP, {"NP", "NPS"}, {"NP"}),
+    (vvg_tag_adjustment, {"VVG"}, {"NN", "IN"}),
+    (vvn_tag_adjustment, {"VVN"}, {"JJ", "VVD"}),
+    (phrasal_adjustment, {"IN", "TO"}, {"RP"}),
+    (phrasal_verb, {"RP"}, set()),
+    (interrogation_adjustment, {"WRB"}, set()),
+    (make_verb_adjustment, {"VV"}, set()),
+]
+
+
+def concatenate_NP_of_NP_and_tag_it_NP(sentence_input: list) -> list:
+    """
+    Concatenate three successive words if they match NP of NP pattern
+    """
+    return list(NP_of_NP(sentence_input))
 
+
+def process_for_adjective_noun_adjustment(sentence_input: list) -> list:
+    """
+    Check for 'JJ and NN' patterns and concatenate them if present in dictionary
+    """
+    return list(adjective_noun_adjustment(sentence_input))
+
+
+def process_for_noun_concatenation(noun_tag_1: str, noun_tag_2: str, sentence_input: list) -> list:
+    """
+    Concatenate successive proper nouns (e.g., "Golam Mortuza Hossain" => "Golam.Mortuza.Hossain")
+    """
+    return list(noun_concatenation(noun_tag_1, noun_tag_2, sentence_input))
+
+
+def process_for_phrasal_adjustment(sentence_input: list) -> list:
+    """
+    Check for two successive prepositions followed by a verb and adjust tags
+    """
+    return list(phrasal_adjustment(sentence_input))
+
+
+def process_for_make_verb_adjustment(sentence_input: list) -> list:
+    """
+    Check for 'make sure' pattern and concatenate them
+    """
+    return list(make_verb_adjustment(sentence_input))
+
+
+def process_for_interrogation_adjustment(sentence_input: list) -> list:
+    """
+    Check for 'how many' pattern and concatenate them
+    """
+    return list(interrogation_adjustment(sentence_input))
+
+
+def process_for_vvn_tag_adjustment(sentence_input: list) -> list:
+    """
+    Check for unaccompanied VVN and change their tag to JJ
+    """
+    return list(vvn_tag_adjustment(sentence_input))
+
+
+def process_for_vvg_tag_adjustment(sentence_input: list) -> list:
+    """
+    Check for unaccompanied VVG and change their tag to NN
+    """
+    return list(vvg_tag_adjustment(sentence_input))
+
+
+def process_for_phrasal_verb(sentence_input: list) -> list:
+    """
+    Check for 'RP' particles and attach them to the last verb
+    """
+    return list(phrasal_verb(sentence_input))
@@ -38,7 +38,7 @@ def check_for_imperative_sentence(sentence_input):
     Check whether the sentence is imperative
     
     Args:
-        sentence_input: List of word\tTAG\tlemma strings
+        sentence_input: List of tokens
         
     Returns:
         bool: True if sentence is imperative
@@ -48,23 +48,21 @@ def check_for_imperative_sentence(sentence_input):
     last_word_was_you = False
 
     for word in sentence_input:
-        words_array = word.split('\t')
-        
-        if len(words_array) > 1 and words_array[1]:
+        if word.tag:
             word_position += 1
 
         if word_position == 1:
-            if (words_array[1] in ["VV", "VVP"] or 
-                words_array[0].lower() == "please"):
+            if (word.tag in ["VV", "VVP"] or 
+                word.word.lower() == "please"):
                 imperative_sentence_ind = True
                 break
-            elif words_array[0].lower() == "you":
+            elif word.word.lower() == "you":
                 last_word_was_you = True
             else:
                 break
         elif word_position == 2:
             if (last_word_was_you and 
-                words_array[1] in ["VV", "VVP"]):
+                word.tag in ["VV", "VVP"]):
                 imperative_sentence_ind = True
             break
 
@@ -75,7 +73,7 @@ def check_for_interrogative_sentence(sentence_input):
     Check whether the sentence is interrogative
     
     Args:
-        sentence_input: List of word\tTAG\tlemma strings
+        sentence_input: List of tokens
         
     Returns:
         tuple: (question_mark, non_wh_question_mark)
@@ -93,33 +91,29 @@ def check_for_interrogative_sentence(sentence_input):
     }
 
     for word in sentence_input:
-        words_array = word.split('\t')
-        if len(words_array) > 1 and words_array[1]:
+        if word.tag:
             word_position += 1
-        else:
-            words_array.append('')  # Ensure tag exists
 
         # Wh-interrogation
         if (word_position == 1 and 
-            words_array[1] in wh_tags):
+            word.tag in wh_tags):
             return (True, False)
 
         # Auxiliary verbs at the beginning
         elif (word_position == 1 and 
-              words_array[1] in aux_verbs):
+              word.tag in aux_verbs):
             return (True, True)
 
         # Do verb at the beginning
         elif (word_position == 1 and 
-              len(words_array) > 2 and 
-              words_array[2].lower() == 'do'):
-            if words_array[0].lower() != 'do':
+              word.lemma.lower() == 'do'):
+            if word.word.lower() != 'do':
                 return (True, True)
             else:
                 first_word_is_do = True
 
         elif (word_position == 2 and first_word_is_do and
-              words_array[0].lower() not in ['it', 'this']):
+              word.word.lower() not in ['it', 'this']):
             return (True, True)
 
         elif word_position > 2:
@@ -132,7 +126,7 @@ def find_out_tense_details(sentence_input):
     Determine tense and other grammatical features of a sentence
     
     Args:
-        sentence_input: List of word\tTAG\tlemma strings
+        sentence_input: List of tokens
         
     Returns:
         tuple: (tense, tense_desc, passive_sentence_ind)
@@ -152,15 +146,10 @@ def find_out_tense_details(sentence_input):
     passive_sentence_ind = False
 
     for wds in sentence_input:
-        wds_array = wds.split('\t')
-        
-        if len(wds_array) > 2 and wds_array[2] == "have.to":
+        if wds.lemma == "have.to":
             passive_sentence_ind = True
 
-        if len(wds_array) <= 1:
-            wds_array.append('')  # Ensure tag exists
-
-        tag = wds_array[1]
+        tag = wds.tag
 
         if tag == "TO":  # to
             continue
@@ -174,8 +163,7 @@ def find_out_tense_details(sentence_input):
                 tense_determined = True
         elif tag == "MD":  # shall, will, would, must
             if (not tense_determined and 
-                len(wds_array) > 2 and 
-                wds_array[2].lower() in ['shall', 'will', 'would', 'must']):
+                wds.lemma.lower() in ['shall', 'will', 'would', 'must']):
                 tense = 'future'
                 tense_determined = True
         elif tag in ["VVP", "VVZ"]:  # tell, tells
@@ -0,0 +1,635 @@
+# -*- coding: utf-8 -*-
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+
+import json
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from anubadok import settings
+from anubadok import bn_dict_compiler
+
+###########################################
+#
+#  Built-in Parts of Speech tagger
+#
+#  A second order hidden Markov model tagger in the style of TnT
+#  (Brants, 2000), used instead of an external tagger when
+#  settings.penn_treebank_tagger is NATIVE_TAGGER. It gives the same
+#  "word\tTAG\tlemma" lines as GPoSTTL and TreeTagger, and passes mark-up
+#  through untagged, one per line.
+#
+#  The model is trained on tagged text in that very form (e.g. the
+#  output of GPoSTTL on your own texts) with
+#  scripts/train_anubadok_tagger.py, and saved in settings.tagger_model.
+#
+###########################################
+
+NATIVE_TAGGER = "anubadok-hmm"
+TAGGER_MODEL_FORMAT = 1
+
+# Tag of the (virtual) words before and after every sentence
+SENTENCE_BOUNDARY = "<S>"
+
+# Words ending a sentence; the tagger starts over after them
+SENTENCE_END_WORDS = frozenset([".", "!", "?"])
+
+# Longest suffix, and most frequent words, used to guess unknown words
+SUFFIX_LENGTH = 10
+RARE_WORD_COUNT = 10
+
+# Paths scoring worse than the best one by more than this are dropped,
+# and unknown words get at most this many tag candidates
+BEAM_LOG_WIDTH = math.log(1000.0)
+UNKNOWN_WORD_TAGS = 10
+
+MARKUP_OR_WORD = re.compile(r'<[^<>\s][^<>]*>|[^\s<]+|<')
+NUMBER = re.compile(r'^[+-]?\d[\d,.:/-]*$')
+INITIALS = re.compile(r'^([A-Za-z]\.)+$')
+CLITIC = re.compile(r"^(.+?)(n't|'s|'re|'ve|'ll|'d|'m)$", re.IGNORECASE)
+
+OPENING_PUNCTUATION = "([{\"'`"
+CLOSING_PUNCTUATION = ")]}\"',;:!?"
+
+ABBREVIATIONS = frozenset([
+    "mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "jr.", "sr.", "vs.",
+    "etc.", "inc.", "ltd.", "co.", "corp.", "no.", "vol.", "fig.",
+    "jan.", "feb.", "mar.", "apr.", "jun.", "jul.", "aug.", "sep.",
+    "sept.", "oct.", "nov.", "dec.",
+])
+
+# Suffixes of inflected words by tag, with what replaces them in the
+# lemma, tried in order
+INFLECTION_SUFFIXES = {
+    "NNS": [("ies", "y"), ("sses", "ss"), ("xes", "x"), ("ches", "ch"),
+            ("shes", "sh"), ("s", "")],
+    "VVZ": [("ies", "y"), ("sses", "ss"), ("xes", "x"), ("ches", "ch"),
+            ("shes", "sh"), ("oes", "o"), ("s", "")],
+    "VVD": [("ied", "y"), ("ed", "")],
+    "VVN": [("ied", "y"), ("ed", "")],
+    "VVG": [("ing", "")],
+    "JJR": [("ier", "y"), ("er", "")],
+    "JJS": [("iest", "y"), ("est", "")],
+    "RBR": [("ier", "y"), ("er", "")],
+    "RBS": [("iest", "y"), ("est", "")],
+}
+
+# Endings of stems which (most likely) lost an e to the inflection
+DROPPED_E = re.compile(
+    r'(dg|[lr]g|[^aeiou][cvz]|[aeiou][cgsvz]|[^aeiou]u|[^aeiou]at|[^aeiou][aiou][kmp]|[^aeiou][aiu]n)$')
+
+# Tags whose lemma is the (lower case) word itself
+UNINFLECTED_TAGS = frozenset([
+    "NN", "JJ", "RB", "VV", "VVP", "IN", "CC", "DT", "UH", "FW", "RP",
+])
+
+
+class TaggerModel:
+    """
+    Counts of a trained tagger, and the probabilities derived from them
+    """
+
+    def __init__(self):
+        # Word -> tag -> count, and word -> tag -> lemma (where the lemma
+        # is not the word itself)
+        self.lexicon: Dict[str, Dict[str, int]] = {}
+        self.lemmas: Dict[str, Dict[str, str]] = {}
+        # Tag n-gram counts, sentences padded with SENTENCE_BOUNDARY
+        self.unigrams: Dict[str, int] = {}
+        self.bigrams: Dict[Tuple[str, str], int] = {}
+        self.trigrams: Dict[Tuple[str, str, str], int] = {}
+        # Suffix -> tag -> count of rare words, for lower and upper case
+        # words ("" holds all of them)
+        self.suffixes: Dict[bool, Dict[str, Dict[str, int]]] = {False: {}, True: {}}
+
+        self.lambdas = (1.0, 0.0, 0.0)
+        self.tag_count = 0
+        self.tags: List[str] = []
+        self.known_lemmas = frozenset()
+        self.transitions: Dict[Tuple[str, str, str], float] = {}
+        self.suffix_tags: Dict[Tuple[bool, str], List[Tuple[str, float]]] = {}
+        self.theta = {False: 0.0, True: 0.0}
+
+    @classmethod
+    def train(cls, sentences: Iterable[List[Tuple[str, str, str]]]) -> "TaggerModel":
+        """
+        Count the tags, words and lemmas of tagged sentences, each
+        a list of (word, tag, lemma)
+        """
+        model = cls()
+        lexicon = defaultdict(lambda: defaultdict(int))
+        unigrams = defaultdict(int)
+        bigrams = defaultdict(int)
+        trigrams = defaultdict(int)
+
+        for sentence in sentences:
+            tags = [SENTENCE_BOUNDARY, SENTENCE_BOUNDARY]
+            for word, tag, lemma in sentence:
+                lexicon[word][tag] += 1
+                if lemma and lemma != word:
+                    model.lemmas.setdefault(word, {})[tag] = lemma
+                tags.append(tag)
+            tags.append(SENTENCE_BOUNDARY)
+
+            for i in range(2, len(tags)):
+                unigrams[tags[i]] += 1
+                bigrams[(tags[i - 1], tags[i])] += 1
+                trigrams[(tags[i - 2], tags[i - 1], tags[i])] += 1
+            # Histories of the first word
+            bigrams[(SENTENCE_BOUNDARY, SENTENCE_BOUNDARY)] += 1
+
+        model.lexicon = {word: dict(tags) for word, tags in lexicon.items()}
+        model.unigrams = dict(unigrams)
+        model.bigrams = dict(bigrams)
+        model.trigrams = dict(trigrams)
+
+        for word, tags in model.lexicon.items():
+            if sum(tags.values()) > RARE_WORD_COUNT:
+                continue
+            table = model.suffixes[word[:1].isupper()]
+            for length in range(min(SUFFIX_LENGTH, len(word)) + 1):
+                suffix_tags = table.setdefault(word[len(word) - length:], {})
+                for tag, count in tags.items():
+                    suffix_tags[tag] = suffix_tags.get(tag, 0) + count
+
+        model.lambdas = model.deleted_interpolation()
+        model.prepare()
+        return model
+
+    def deleted_interpolation(self) -> Tuple[float, float, float]:
+        """
+        Weights of the unigram, bigram and trigram probabilities
+        """
+        weights = [0.0, 0.0, 0.0]
+        total = sum(self.unigrams.values())
+
+        for (t1, t2, t3), count in self.trigrams.items():
+            estimates = [
+                (self.unigrams.get(t3, 0) - 1) / (total - 1) if total > 1 else 0.0,
+                (self.bigrams.get((t2, t3), 0) - 1) / (self.unigrams.get(t2, 0) - 1)
+                if self.unigrams.get(t2, 0) > 1 else 0.0,
+                (count - 1) / (self.bigrams.get((t1, t2), 0) - 1)
+                if self.bigrams.get((t1, t2), 0) > 1 else 0.0,
+            ]
+            weights[estimates.index(max(estimates))] += count
+
+        total_weight = sum(weights) or 1.0
+        return tuple(weight / total_weight for weight in weights)
+
+    def prepare(self) -> None:
+        """
+        Derive what tagging needs from the counts
+        """
+        # The boundary counts as a tag only in the histories
+        self.tag_count = sum(
+            count for tag, count in self.unigrams.items() if tag != SENTENCE_BOUNDARY)
+        self.unigrams.setdefault(SENTENCE_BOUNDARY, 0)
+        self.unigrams[SENTENCE_BOUNDARY] += self.bigrams.get(
+            (SENTENCE_BOUNDARY, SENTENCE_BOUNDARY), 0)
+        self.tags = sorted(tag for tag in self.unigrams if tag != SENTENCE_BOUNDARY)
+        self.transitions = {}
+        self.suffix_tags = {}
+
+        self.known_lemmas = frozenset(
+            lemma for tags in self.lemmas.values() for lemma in tags.values()
+        ) | frozenset(
+            word.lower() for word, tags in self.lexicon.items()
+            if "VV" in tags or "NN" in tags or "JJ" in tags
+        )
+
+        # Weight of the shorter suffixes: the standard deviation of the
+        # tag probabilities of the rare words
+        for upper_case, table in self.suffixes.items():
+            tags = table.get("", {})
+            total = sum(tags.values())
+            if not tags or not total:
+                continue
+            mean = 1.0 / len(tags)
+            self.theta[upper_case] = math.sqrt(
+                sum((count / total - mean) ** 2 for count in tags.values())
+                / max(1, len(tags) - 1))
+
+    def to_dict(self) -> dict:
+        """
+        The counts of the model, to be saved as JSON
+        """
+        return {
+            "format": TAGGER_MODEL_FORMAT,
+            "lexicon": self.lexicon,
+            "lemmas": self.lemmas,
+            "unigrams": {
+                tag: count for tag, count in self.unigrams.items()
+                if tag != SENTENCE_BOUNDARY
+            },
+            "bigrams": {" ".join(tags): count for tags, count in self.bigrams.items()},
+            "trigrams": {" ".join(tags): count for tags, count in self.trigrams.items()},
+            "suffixes": {
+                "lower": self.suffixes[False],
+                "upper": self.suffixes[True],
+            },
+            "lambdas": list(self.lambdas),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TaggerModel":
+        """
+        Make a model of counts saved by to_dict
+        """
+        if data.get("format") != TAGGER_MODEL_FORMAT:
+            raise ValueError(f"unknown tagger model format {data.get('format')}")
+
+        model = cls()
+        model.lexicon = data["lexicon"]
+        model.lemmas = data["lemmas"]
+        model.unigrams = dict(data["unigrams"])
+        model.bigrams = {tuple(tags.split(" ")): count for tags, count in data["bigrams"].items()}
+        model.trigrams = {tuple(tags.split(" ")): count for tags, count in data["trigrams"].items()}
+        model.suffixes = {False: data["suffixes"]["lower"], True: data["suffixes"]["upper"]}
+        model.lambdas = tuple(data["lambdas"])
+        model.prepare()
+        return model
+
+    def transition(self, t1: str, t2: str, t3: str) -> float:
+        """
+        Log probability of tag t3 after the tags t1 and t2
+        """
+        key = (t1, t2, t3)
+        log_p = self.transitions.get(key)
+        if log_p is None:
+            l1, l2, l3 = self.lambdas
+            p = l1 * self.unigrams.get(t3, 0) / max(1, self.tag_count)
+            count = self.unigrams.get(t2, 0)
+            if count:
+                p += l2 * self.bigrams.get((t2, t3), 0) / count
+            count = self.bigrams.get((t1, t2), 0)
+            if count:
+                p += l3 * self.trigrams.get(key, 0) / count
+            log_p = math.log(p) if p > 0 else -1e9
+            self.transitions[key] = log_p
+        return log_p
+
+    def word_tags(self, word: str, sentence_start: bool) -> List[Tuple[str, float]]:
+        """
+        Candidate tags of a word with the log probability of the word
+        given the tag
+        """
+        counts = self.lexicon.get(word)
+        if word[:1].isupper() and (counts is None or sentence_start):
+            lower_counts = self.lexicon.get(word.lower())
+            if counts is None:
+                counts = lower_counts
+            elif lower_counts is not None:
+                counts = dict(counts)
+                for tag, count in lower_counts.items():
+                    counts[tag] = counts.get(tag, 0) + count
+
+        if counts is not None:
+            return [
+                (tag, math.log(count / self.unigrams[tag]))
+                for tag, count in counts.items() if self.unigrams.get(tag)
+            ]
+
+        if NUMBER.match(word) and self.unigrams.get("CD"):
+            return [("CD", 0.0)]
+
+        return self.unknown_word_tags(word)
+
+    def unknown_word_tags(self, word: str) -> List[Tuple[str, float]]:
+        """
+        Candidate tags of a word not seen in training, guessed from
+        its suffix as in TnT
+        """
+        upper_case = word[:1].isupper()
+        table = self.suffixes[upper_case]
+        if not table:
+            upper_case = not upper_case
+            table = self.suffixes[upper_case]
+
+        suffix = ""
+        for length in range(min(SUFFIX_LENGTH, len(word)), 0, -1):
+            if word[len(word) - length:] in table:
+                suffix = word[len(word) - length:]
+                break
+
+        key = (upper_case, suffix)
+        candidates = self.suffix_tags.get(key)
+        if candidates is not None:
+            return candidates
+
+        theta = self.theta[upper_case]
+        probabilities: Dict[str, float] = {}
+        for length in range(len(suffix) + 1):
+            tags = table.get(suffix[len(suffix) - length:], {})
+            total = sum(tags.values())
+            if not total:
+                continue
+            for tag in set(probabilities) | set(tags):
+                probabilities[tag] = (
+                    tags.get(tag, 0) / total + theta * probabilities.get(tag, 0.0)
+                ) / (1.0 + theta)
+
+        # P(word|tag) is proportional to P(tag|suffix) / P(tag)
+        ranked = sorted(probabilities.items(), key=lambda item: -item[1])[:UNKNOWN_WORD_TAGS]
+        candidates = [
+            (tag, math.log(p * self.tag_count / self.unigrams[tag]))
+            for tag, p in ranked if p > 0 and self.unigrams.get(tag)
+        ]
+        if not candidates:
+            candidates = [("NP" if word[:1].isupper() else "NN", 0.0)]
+
+        self.suffix_tags[key] = candidates
+        return candidates
+
+    def tag_sentence(self, words: List[str]) -> List[str]:
+        """
+        Most probable tags of the words of a sentence (Viterbi search)
+        """
+        # State: last two tags -> (log probability, tags so far in reverse)
+        states = {(SENTENCE_BOUNDARY, SENTENCE_BOUNDARY): (0.0, None)}
+
+        for i, word in enumerate(words):
+            candidates = self.word_tags(word, i == 0)
+            next_states = {}
+            for (t1, t2), (score, path) in states.items():
+                for t3, log_p in candidates:
+                    next_score = score + self.transition(t1, t2, t3) + log_p
+                    state = (t2, t3)
+                    best = next_states.get(state)
+                    if best is None or next_score > best[0]:
+                        next_states[state] = (next_score, (t3, path))
+
+            best_score = max(score for score, _ in next_states.values())
+            states = {
+                state: value for state, value in next_states.items()
+                if value[0] >= best_score - BEAM_LOG_WIDTH
+            }
+
+        path = None
+        if words:
+            _, (_, path) = max(
+                states.items(),
+                key=lambda item: item[1][0] + self.transition(*item[0], SENTENCE_BOUNDARY)
+            )
+
+        tags = []
+        while path is not None:
+            tags.append(path[0])
+            path = path[1]
+        tags.reverse()
+        return tags
+
+    def lemma(self, word: str, tag: str) -> str:
+        """
+        Lemma of a tagged word, guessed from its inflection if the word
+        was not seen with the tag in training
+        """
+        for form in (word, word.lower()):
+            tags = self.lexicon.get(form)
+            if tags is not None and tag in tags:
+                return self.lemmas.get(form, {}).get(tag, form)
+
+        if tag == "CD" and NUMBER.match(word):
+            return "@card@"
+        if tag in ("NP", "NPS"):
+            return word
+
+        lower = word.lower()
+        if tag in UNINFLECTED_TAGS:
+            return lower
+
+        for suffix, replacement in INFLECTION_SUFFIXES.get(tag, ()):
+            if lower.endswith(suffix) and len(lower) > len(suffix) + 1:
+                return self.guess_stem(lower[:len(lower) - len(suffix)] + replacement, suffix)
+
+        return "<unknown>"
+
+    def guess_stem(self, stem: str, suffix: str) -> str:
+        """
+        Undo the spelling changes of an inflection: doubled consonants
+        (stopped), dropped e (liked) and ie turned into y (dying)
+        """
+        if suffix not in ("ed", "ing", "er", "est") or stem in self.known_lemmas:
+            return stem
+        for lemma in (stem + "e", stem[:-1], stem[:-1] + "ie"):
+            if lemma in self.known_lemmas:
+                return lemma
+        if len(stem) > 2 and stem[-1] == stem[-2] and stem[-1] not in "aeioufls":
+            return stem[:-1]
+        if DROPPED_E.search(stem):
+            return stem + "e"
+        return stem
+
+
+class NativeTagger:
+    """
+    The loaded tagger model (see load_tagger_model)
+    """
+    model: Optional[TaggerModel] = None
+    signature: Optional[list] = None
+    lock = threading.Lock()
+
+
+def load_tagger_model(force: bool = False) -> TaggerModel:
+    """
+    Load the tagger model. It is loaded once per process and read again
+    only if the file has changed since.
+
+    Raises:
+        IOError: If the model cannot be read
+    """
+    with NativeTagger.lock:
+        path = settings.tagger_model
+        signature = bn_dict_compiler.source_signature(path)
+
+        if force or signature != NativeTagger.signature:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    model = TaggerModel.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError) as e:
+                raise IOError(
+                    f"Error! Could not open tagger model {path} (train one with "
+                    f"scripts/train_anubadok_tagger.py). Error: {e}"
+                )
+
+            NativeTagger.model = model
+            NativeTagger.signature = signature
+
+        return NativeTagger.model
+
+
+def save_tagger_model(model: TaggerModel, path: str) -> None:
+    """
+    Save a trained tagger model as JSON
+
+    Raises:
+        IOError: If the file cannot be written
+    """
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(model.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+    except OSError as e:
+        raise IOError(f"Error! Could not write tagger model {path}. Error: {e}")
+
+
+def tagger_model_version() -> str:
+    """
+    Path, mtime and size of the tagger model, which the tagging depends on
+    """
+    return json.dumps(bn_dict_compiler.source_signature(settings.tagger_model))
+
+
+def tag_text(text: str) -> str:
+    """
+    Tag a text with the built-in tagger, like an external tagger would
+
+    Returns:
+        The tagged output as a string
+
+    Raises:
+        IOError: If the tagger model cannot be loaded
+    """
+    model = load_tagger_model()
+    output = []
+    sentence: List[str] = []
+
+    def flush_sentence():
+        for word, tag in zip(sentence, model.tag_sentence(sentence)):
+            output.append(f"{word}\t{tag}\t{model.lemma(word, tag)}\n")
+        sentence.clear()
+
+    for token in tokenize(text):
+        if is_markup(token):
+            flush_sentence()
+            output.append(token + "\n")
+            continue
+
+        sentence.append(token)
+        if token in SENTENCE_END_WORDS:
+            flush_sentence()
+
+    flush_sentence()
+    return "".join(output)
+
+
+def is_markup(token: str) -> bool:
+    """
+    Whether a token is mark-up, which is passed through untagged
+    """
+    return len(token) > 2 and token[0] == "<" and token[-1] == ">"
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split a text into words, punctuation and mark-up the way TreeTagger
+    does (e.g. "don't" gives "do" and "n't")
+    """
+    tokens = []
+    for match in MARKUP_OR_WORD.finditer(text):
+        chunk = match.group(0)
+        if is_markup(chunk):
+            tokens.append(chunk)
+        else:
+            tokens.extend(split_word(chunk))
+    return tokens
+
+
+def split_word(chunk: str) -> List[str]:
+    """
+    Split the punctuation and clitics off a whitespace separated chunk
+    """
+    prefix = []
+    while len(chunk) > 1 and chunk[0] in OPENING_PUNCTUATION:
+        prefix.append(chunk[0])
+        chunk = chunk[1:]
+
+    suffix = []
+    while len(chunk) > 1:
+        if chunk.endswith("..."):
+            if len(chunk) == 3:
+                break
+            suffix.append("...")
+            chunk = chunk[:-3]
+        elif chunk[-1] in CLOSING_PUNCTUATION:
+            suffix.append(chunk[-1])
+            chunk = chunk[:-1]
+        elif chunk[-1] == "." and not is_abbreviation(chunk):
+            suffix.append(".")
+            chunk = chunk[:-1]
+        else:
+            break
+
+    match = CLITIC.match(chunk)
+    if match:
+        words = [match.group(1), match.group(2)]
+    else:
+        words = [chunk]
+
+    return prefix + words + suffix[::-1]
+
+
+def is_abbreviation(word: str) -> bool:
+    """
+    Whether the full stop at the end of a word belongs to it
+    """
+    if INITIALS.match(word) or word.lower() in ABBREVIATIONS:
+        return True
+    model = NativeTagger.model
+    return model is not None and word in model.lexicon
+
+
+def read_tagged_sentences(lines: Iterable[str]) -> Iterable[List[Tuple[str, str, str]]]:
+    """
+    Read tagged text (word\\tTAG\\tlemma per line) as sentences for
+    training. Sentences end at SENT tags, mark-up and blank lines.
+    """
+    sentence = []
+    for line in lines:
+        fields = line.rstrip('\n').split('\t')
+        if len(fields) < 2 or not fields[0]:
+            if sentence:
+                yield sentence
+                sentence = []
+            continue
+
+        word, tag = fields[0], fields[1]
+        lemma = fields[2] if len(fields) > 2 else word
+        sentence.append((word, tag, lemma))
+        if tag == "SENT" or word in SENTENCE_END_WORDS:
+            yield sentence
+            sentence = []
+
+    if sentence:
+        yield sentence
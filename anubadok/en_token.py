@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+
+import sys
+from typing import List, NamedTuple, Union
+
+###########################################
+#
+#  Tagged words
+#
+#  The tagger gives one "word\tTAG\tlemma" line per word. Each line is
+#  split once into a Token which is then passed through the pipeline.
+#  str(token) gives back the line form.
+#
+###########################################
+
+
+class Token(NamedTuple):
+    """
+    A tagged word: word, Penn Treebank tag and lemma
+    """
+    word: str = ""
+    tag: str = ""
+    lemma: str = ""
+
+    def __str__(self) -> str:
+        return f"{self.word}\t{self.tag}\t{self.lemma}"
+
+    @classmethod
+    def from_string(cls, sts: str) -> "Token":
+        """
+        Make a token of a word\\tTAG\\tlemma string; missing fields are empty
+        """
+        wds_array = sts.split('\t')
+        if len(wds_array) < 3:
+            wds_array.extend([''] * (3 - len(wds_array)))
+
+        # Tags come from a small set; interning them saves memory and
+        # makes comparing them cheap
+        return cls(wds_array[0], sys.intern(wds_array[1]), wds_array[2])
+
+
+def as_token(value: Union[Token, str]) -> Token:
+    """
+    Return the value as a token, converting word\\tTAG\\tlemma strings
+    """
+    if isinstance(value, Token):
+        return value
+    return Token.from_string(str(value))
+
+
+def tokens_to_text(tokens: List[Token]) -> str:
+    """
+    Join tokens into tagged text (one word\\tTAG\\tlemma per line)
+    """
+    return "\n".join(map(str, tokens))
@@ -31,6 +31,10 @@
 # 02110-1301, USA.
 #___________________________________________________________________
 
+import functools
+
+from anubadok.en_token import Token, as_token
+
 
 def match_pattern_and_modify_as_directed(no_p, *args):
     """
@@ -42,17 +46,31 @@ def match_pattern_and_modify_as_directed(no_p, *args):
             - First no_p elements: patterns to match
             - Next no_p elements: patterns to substitute
             - Remaining elements: sentence output to process
+        Patterns and words can be tokens or word\tTAG\tlemma strings.
             
     Returns:
-        Modified sentence as a list
+        Modified sentence as a list of tokens
     """
     # Split args into patterns to match, substitute, and sentence output
-    pattern_to_match = list(args[:no_p])
+    pattern_to_match = [pattern_token(pattern) for pattern in args[:no_p]]
     pattern_to_substitute = list(args[no_p:2*no_p])
-    sentence_output = list(args[2*no_p:])
+    sentence_output = [word if isinstance(word, Token) else Token.from_string(word)
+                       for word in args[2*no_p:]]
     
-    total_words = len(sentence_output)
+    apply_pattern_rule(pattern_to_match, pattern_to_substitute, sentence_output)
+    return sentence_output
+
+
+def apply_pattern_rule(pattern_to_match, pattern_to_substitute, sentence_output):
+    """
+    Match the patterns and modify the sentence (a list of tokens) in place
     
+    Returns:
+        bool: True if the patterns matched anywhere
+    """
+    no_p = len(pattern_to_match)
+    total_words = len(sentence_output)
+    matched = False
     
     i = 0
     while i <= total_words - no_p:
@@ -65,6 +83,8 @@ def match_pattern_and_modify_as_directed(no_p, *args):
                 break
         
         if match:
+            matched = True
+            
             # Process matched patterns
             for j in range(no_p - 1, -1, -1):  # Process in reverse order
                 sub_pattern = pattern_to_substitute[j] if j < len(pattern_to_substitute) else ""
@@ -94,7 +114,73 @@ def match_pattern_and_modify_as_directed(no_p, *args):
         
         i += 1
     
-    return sentence_output
+    return matched
+
+
+class PatternRules:
+    """
+    A list of match_pattern_and_modify_as_directed rules, compiled once
+    and applied one after the other to each sentence.
+    
+    Every rule is indexed by the words, tags and lemmas its patterns ask
+    for. A rule is only tried on a sentence which has all of them, so
+    most rules cost a set lookup instead of a scan of the sentence.
+    Rules still apply in their given order and see the changes made by
+    earlier rules, exactly as a series of match_pattern_and_modify_as_directed
+    calls would.
+    """
+
+    def __init__(self, rules):
+        """
+        Args:
+            rules: (patterns to match, patterns to substitute) pairs
+        """
+        self.rules = []
+        for pattern_to_match, pattern_to_substitute in rules:
+            pattern_to_match = [pattern_token(pattern) for pattern in pattern_to_match]
+            self.rules.append((
+                pattern_to_match,
+                list(pattern_to_substitute),
+                frozenset(token.word.lower() for token in pattern_to_match if token.word),
+                frozenset(token.tag for token in pattern_to_match if token.tag),
+                frozenset(token.lemma.lower() for token in pattern_to_match if token.lemma)
+            ))
+
+    def apply(self, sentence):
+        """
+        Apply all rules to the sentence and return the modified sentence
+        """
+        sentence_output = [word if isinstance(word, Token) else Token.from_string(word)
+                           for word in sentence]
+        index = None
+        
+        for pattern_to_match, pattern_to_substitute, words, tags, lemmas in self.rules:
+            if index is None:
+                index = sentence_index(sentence_output)
+            
+            if words <= index[0] and tags <= index[1] and lemmas <= index[2]:
+                if apply_pattern_rule(pattern_to_match, pattern_to_substitute, sentence_output):
+                    index = None  # sentence has changed
+        
+        return sentence_output
+
+
+def sentence_index(sentence):
+    """
+    Sets of the (lower case) words, tags and (lower case) lemmas of a sentence
+    """
+    return ({token.word.lower() for token in sentence},
+            {token.tag for token in sentence},
+            {token.lemma.lower() for token in sentence})
+
+
+@functools.lru_cache(maxsize=4096)
+def pattern_token(pattern):
+    """
+    Token of a rule pattern; rules use a small set of patterns over
+    and over, so each of them is split only once
+    """
+    return as_token(pattern)
 
 
 def compare_two_patterns(pattern1, pattern2):
@@ -102,29 +188,25 @@ def compare_two_patterns(pattern1, pattern2):
     Compare two given word\tTAG\tlemma patterns
     
     Args:
-        pattern1: First pattern to compare
+        pattern1: First pattern to compare (empty fields match anything)
         pattern2: Second pattern to compare
         
     Returns:
         bool: True if patterns match according to comparison rules
     """
-    words_array_1 = str(pattern1).split('\t')
-    words_array_2 = str(pattern2).split('\t')
-    
-    # Ensure array has at least 3 elements
-    words_array_1 += [''] * (3 - len(words_array_1))
-    words_array_2 += [''] * (3 - len(words_array_2))
+    token_1 = pattern1 if isinstance(pattern1, Token) else pattern_token(pattern1)
+    token_2 = pattern2 if isinstance(pattern2, Token) else Token.from_string(pattern2)
     
     # Compare word (case insensitive)
-    if words_array_1[0] and words_array_1[0].lower() != words_array_2[0].lower():
+    if token_1.word and token_1.word.lower() != token_2.word.lower():
         return False
     
     # Compare tag (case sensitive)
-    if words_array_1[1] and words_array_1[1] != words_array_2[1]:
+    if token_1.tag and token_1.tag != token_2.tag:
         return False
     
     # Compare lemma (case insensitive)
-    if words_array_1[2] and words_array_1[2].lower() != words_array_2[2].lower():
+    if token_1.lemma and token_1.lemma.lower() != token_2.lemma.lower():
         return False
     
     return True
@@ -140,19 +222,13 @@ def concatenate_given_two_patterns(pattern1, pattern2, given_tag):
         given_tag: Tag to use for the concatenated result
         
     Returns:
-        Concatenated pattern as string
+        Concatenated pattern as a token
     """
-    parts1 = str(pattern1).split('\t')
-    parts2 = str(pattern2).split('\t')
+    token_1 = as_token(pattern1)
+    token_2 = as_token(pattern2)
     
-    # Ensure we have at least word, tag, lemma for both patterns
-    parts1 += [''] * (3 - len(parts1))
-    parts2 += [''] * (3 - len(parts2))
-    
-    word1, tag1, lemma1 = parts1[0], parts1[1], parts1[2]
-    word2, tag2, lemma2 = parts2[0], parts2[1], parts2[2]
-    
-    return f"{word1}.{word2}\t{given_tag}\t{lemma1}.{lemma2}"
+    return Token(f"{token_1.word}.{token_2.word}", given_tag,
+                 f"{token_1.lemma}.{token_2.lemma}")
 
 
 def generate_final_pattern(original_pattern, modification_pattern):
@@ -164,22 +240,13 @@ def generate_final_pattern(original_pattern, modification_pattern):
         modification_pattern: Modification pattern (word\tTAG\tlemma)
         
     Returns:
-        Modified pattern as string
+        Modified pattern as a token
     """
-    orig_parts = str(original_pattern).split('\t')
-    mod_parts = str(modification_pattern).split('\t')
-    
-    # Ensure we have at least word, tag, lemma for original
-    orig_parts += [''] * (3 - len(orig_parts))
-    word, tag, lemma = orig_parts[0], orig_parts[1], orig_parts[2]
+    original = as_token(original_pattern)
+    modification = pattern_token(modification_pattern)
     
     # Apply modifications if specified
-    if len(mod_parts) > 0 and mod_parts[0]:
-        word = mod_parts[0]
-    if len(mod_parts) > 1 and mod_parts[1]:
-        tag = mod_parts[1]
-    if len(mod_parts) > 2 and mod_parts[2]:
-        lemma = mod_parts[2]
-    
-    return f"{word}\t{tag}\t{lemma}"
+    return Token(modification.word or original.word,
+                 modification.tag or original.tag,
+                 modification.lemma or original.lemma)
 
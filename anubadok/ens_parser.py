@@ -31,25 +31,24 @@
 # 02110-1301, USA.
 #___________________________________________________________________
 
+from anubadok.en_token import Token, as_token
+
 
 def english_sentence_parser(sentence_input):
     """
     Parse a given sentence into sub-sentences
     
     Args:
-        sentence_input: List of word\tTAG\tlemma strings
+        sentence_input: List of tokens
         
     Returns:
         List of parsed sentence components
     """
     sentence_block = []
     sentence_output = []
-    empty_sent = "\tSENT\t"
 
     for word in sentence_input:
-        words_array = word.split('\t')
-        
-        if len(words_array) > 1 and words_array[1] in ["SENT", "LBLM"]:
+        if word.tag in ["SENT", "LBLM"]:
             if sentence_block:
                 sentence_output.extend(english_sentence_parser_sub(sentence_block))
             sentence_output.append(word)
@@ -67,7 +66,7 @@ def english_sentence_parser_sub(sentence_input):
     Parse each block of the sentence into further blocks
     
     Args:
-        sentence_input: List of word\tTAG\tlemma strings
+        sentence_input: List of tokens
         
     Returns:
         List of parsed sentence components
@@ -80,32 +79,43 @@ def insert_logical_block_marker(sentence_input):
     Insert logical block markers into the sentence
     
     Args:
-        sentence_input: List of word\tTAG\tlemma strings
+        sentence_input: List of tokens
         
     Returns:
         List with logical block markers inserted
     """
     sentence_output = []
-    logical_block_marker = "\tLBLM\t"
-    empty_sent = "\tSENT\t"
+    logical_block_marker = Token(tag="LBLM")
+    empty_sent = Token(tag="SENT")
     word_position = 0
     no_of_penn_tag = 0
     preposition_ind = False
+    
+    # Strings in between each comma or CC and the next boundary
+    strings_in_between = None
+    
+    # Whether sentence_output has a verb without any preposition, as
+    # checked up to output_scanned (so it is not rescanned for every CC)
+    output_verb_ind = False
+    output_preposition_ind = False
+    output_scanned = 0
 
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        # Ensure array has at least 3 elements
-        wds_array += [''] * (3 - len(wds_array))
+        tag = sts.tag
+        word = sts.word.lower()
         
-        tag = wds_array[1]
-        word = wds_array[0].lower() if wds_array[0] else ''
+        if strings_in_between is None and tag in ["CC", ","]:
+            strings_in_between = index_strings_in_between(sentence_input)
 
         if tag == "CC":  # coordinating conjunction
-            tmp_array = get_string_in_between(
-                word_position + 1,
-                "SENT",
-                sentence_input
-            )
+            verb_ind, listed_ind = strings_in_between.get(word_position + 1, (False, False))
+            
+            while not output_verb_ind and output_scanned < len(sentence_output):
+                output_verb_ind, output_preposition_ind = scan_for_verb_without_preposition(
+                    sentence_output[output_scanned],
+                    output_preposition_ind
+                )
+                output_scanned += 1
             
             if check_for_verb(sentence_input[word_position + 1]):
                 sentence_output.extend([
@@ -113,9 +123,7 @@ def insert_logical_block_marker(sentence_input):
                     sts,
                     logical_block_marker
                 ])
-            elif (check_for_verb_without_preposition(sentence_output) and 
-                  (check_for_verb_without_preposition(tmp_array) or 
-                   check_for_listed_preposition(tmp_array))):
+            elif output_verb_ind and (verb_ind or listed_ind):
                 sentence_output.extend([
                     empty_sent,
                     sts,
@@ -125,11 +133,7 @@ def insert_logical_block_marker(sentence_input):
                 sentence_output.append(sts)
                 
         elif tag == ",":  # comma
-            tmp_array = get_string_in_between(
-                word_position + 1,
-                "SENT",
-                sentence_input
-            )
+            verb_ind, listed_ind = strings_in_between.get(word_position + 1, (False, False))
             
             if check_for_given_tag("CC", sentence_input[word_position + 1]):
                 sentence_output.extend([
@@ -137,8 +141,7 @@ def insert_logical_block_marker(sentence_input):
                     sts,
                     empty_sent
                 ])
-            elif (check_for_verb_without_preposition(tmp_array) or 
-                  check_for_listed_preposition(tmp_array)):
+            elif verb_ind or listed_ind:
                 sentence_output.extend([
                     logical_block_marker,
                     sts,
@@ -196,7 +199,7 @@ def check_for_verb_without_preposition(sentence_input):
     Check if the string contains any verb without any preposition
     
     Args:
-        sentence_input: List of word\tTAG\tlemma strings
+        sentence_input: List of tokens
         
     Returns:
         bool: True if verb without preposition is found
@@ -204,22 +207,38 @@ def check_for_verb_without_preposition(sentence_input):
     preposition_ind = False
     
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array += [''] * (3 - len(wds_array))
-        tag = wds_array[1]
-        
-        if tag in ["IN", "TO"]:
-            preposition_ind = True
-            
-        if tag in ["NN", "NNS", "NP", "NPS", "PP", "PPS", "DT", "CD"]:
-            preposition_ind = False
-        elif not preposition_ind and check_for_mainverb(sts):
-            return True
-        elif not preposition_ind and check_for_aux_verb(sts):
+        verb_ind, preposition_ind = scan_for_verb_without_preposition(sts, preposition_ind)
+        if verb_ind:
             return True
             
     return False
 
+def scan_for_verb_without_preposition(sts, preposition_ind):
+    """
+    Check one word of a string for a verb without any preposition
+    
+    Args:
+        sts: Token
+        preposition_ind: Whether a preposition precedes the word
+        
+    Returns:
+        (True if the word is a verb without preposition, preposition_ind
+        for the next word)
+    """
+    tag = sts.tag
+    
+    if tag in ["IN", "TO"]:
+        preposition_ind = True
+        
+    if tag in ["NN", "NNS", "NP", "NPS", "PP", "PPS", "DT", "CD"]:
+        return False, False
+    elif not preposition_ind and check_for_mainverb(sts):
+        return True, preposition_ind
+    elif not preposition_ind and check_for_aux_verb(sts):
+        return True, preposition_ind
+        
+    return False, preposition_ind
+
 def get_string_in_between(starting_position, end_TAG, sentence_input):
     """
     Return the string between the position and given TAG or SENT
@@ -227,7 +246,7 @@ def get_string_in_between(starting_position, end_TAG, sentence_input):
     Args:
         starting_position: Starting index
         end_TAG: Tag to look for
-        sentence_input: List of word\tTAG\tlemma strings
+        sentence_input: List of tokens
         
     Returns:
         List of words between positions
@@ -236,27 +255,74 @@ def get_string_in_between(starting_position, end_TAG, sentence_input):
     
     for word_position in range(starting_position, len(sentence_input)):
         sts = sentence_input[word_position]
-        wds_array = sts.split('\t')
-        tag = wds_array[1] if len(wds_array) > 1 else ''
-        word = wds_array[0].lower() if wds_array[0] else ''
+        sentence_output.append(sts)
         
-        if (tag in ["SENT", ","] or 
-            word in ["that", "then"] or 
-            tag == "CC" or 
-            tag == end_TAG):
-            sentence_output.append(sts)
+        if check_for_string_boundary(sts, end_TAG):
             return sentence_output
-            
-        sentence_output.append(sts)
         
     return sentence_output
 
+def check_for_string_boundary(sts, end_TAG="SENT"):
+    """
+    Check if the word ends a string (see get_string_in_between)
+    
+    Args:
+        sts: Token
+        end_TAG: Tag to look for
+        
+    Returns:
+        bool: True if the word ends a string
+    """
+    tag = sts.tag
+    
+    return (tag in ["SENT", ","] or 
+            sts.word.lower() in ["that", "then"] or 
+            tag == "CC" or 
+            tag == end_TAG)
+
+def index_strings_in_between(sentence_input):
+    """
+    Check the strings in between successive boundaries in a single pass
+    
+    Every comma and CC is a boundary, so the string in between one of
+    them and the next boundary (as given by get_string_in_between) is
+    one of these.
+    
+    Args:
+        sentence_input: List of tokens
+        
+    Returns:
+        Dict of starting position -> (True if the string has a verb
+        without preposition, True if it has a listed preposition)
+    """
+    strings_in_between = {}
+    starting_position = 0
+    verb_ind = False
+    listed_ind = False
+    preposition_ind = False
+    
+    for word_position, sts in enumerate(sentence_input):
+        if not verb_ind:
+            verb_ind, preposition_ind = scan_for_verb_without_preposition(sts, preposition_ind)
+        if not listed_ind:
+            listed_ind = check_for_listed_preposition([sts])
+        
+        if check_for_string_boundary(sts):
+            strings_in_between[starting_position] = (verb_ind, listed_ind)
+            starting_position = word_position + 1
+            verb_ind = listed_ind = preposition_ind = False
+    
+    if starting_position < len(sentence_input):
+        strings_in_between[starting_position] = (verb_ind, listed_ind)
+    
+    return strings_in_between
+
 def check_for_verb(word):
     """
     Check if the word is a verb (main or auxiliary)
     
     Args:
-        word: word\tTAG\tlemma string
+        word: Token (or word\tTAG\tlemma string)
         
     Returns:
         bool: True if word is a verb
@@ -268,7 +334,7 @@ def check_for_mainverb(word):
     Check if the word is a main verb
     
     Args:
-        word: word\tTAG\tlemma string
+        word: Token (or word\tTAG\tlemma string)
         
     Returns:
         bool: True if word is a main verb
@@ -276,16 +342,13 @@ def check_for_mainverb(word):
     if isinstance(word, list):
         sentence_input = word
     else:
-        sentence_input = [word]
+        sentence_input = [as_token(word)]
     
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        wds_array += [''] * (3 - len(wds_array))
-        
-        if len(wds_array) > 2 and wds_array[2] == "do":
+        if sts.lemma == "do":
             return False
             
-        if wds_array[1] in ["VV", "VVD", "VVG", "VVN", "VVP", "VVZ"]:
+        if sts.tag in ["VV", "VVD", "VVG", "VVN", "VVP", "VVZ"]:
             return True
             
     return False
@@ -295,7 +358,7 @@ def check_for_aux_verb(word):
     Check if the word is an auxiliary verb
     
     Args:
-        word: word\tTAG\tlemma string
+        word: Token (or word\tTAG\tlemma string)
         
     Returns:
         bool: True if word is an auxiliary verb
@@ -303,11 +366,10 @@ def check_for_aux_verb(word):
     if isinstance(word, list):
         sentence_input = word
     else:
-        sentence_input = [word]
+        sentence_input = [as_token(word)]
     
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        tag = wds_array[1] if len(wds_array) > 1 else ''
+        tag = sts.tag
         
         if tag in ["VB", "VBD", "VBG", "VBN", "VBP", "VBZ",
                    "VH", "VHD", "VHG", "VHN", "VHP", "VHZ"]:
@@ -320,14 +382,13 @@ def check_for_listed_preposition(sentence_input):
     Check if the string contains listed prepositions
     
     Args:
-        sentence_input: List of word\tTAG\tlemma strings
+        sentence_input: List of tokens
         
     Returns:
         bool: True if listed preposition is found
     """
     for sts in sentence_input:
-        wds_array = sts.split('\t')
-        word = wds_array[0].lower() if wds_array[0] else ''
+        word = sts.word.lower()
         
         if word in ["as", "since", "of", "consist.of"]:
             return True
@@ -340,12 +401,9 @@ def check_for_given_tag(tag, word):
     
     Args:
         tag: Tag to check for
-        word: word\tTAG\tlemma string
+        word: Token (or word\tTAG\tlemma string)
         
     Returns:
         bool: True if word has the specified tag
     """
-    words_array = word.split('\t')
-    word_tag = words_array[1] if len(words_array) > 1 else ''
-    
-    return word_tag == tag
+    return as_token(word).tag == tag
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+import sys
+import collections
+import concurrent.futures
+from typing import Iterable, Iterator, Optional
+
+import user_settings
+from anubadok import settings
+from anubadok import bn_dict
+from anubadok import bn_verb
+from anubadok import xml_pp
+from anubadok import pos_tagger
+from anubadok import translator
+from anubadok import translation_memory
+
+###########################################
+#
+#  Translation pipeline :: xml_pp -> PoS tagger -> translator -> xml_pp
+#
+###########################################
+
+
+def translate_text(input_text: str, debug: int = 0, jobs: Optional[int] = None,
+                   memory: Optional[bool] = None) -> str:
+    """
+    Translate a given English text (plain, HTML or XML) into Bengali.
+    With settings.use_translation_memory, a text translated before (with
+    the same dictionaries) is taken from the translation memory.
+
+    Args:
+        input_text: English text
+        debug: Debugging level for this text only (0 keeps the current one)
+        jobs: Number of processes to translate with (default: settings.translation_jobs)
+        memory: Whether to use the translation memory (default: settings.use_translation_memory)
+
+    Returns:
+        Translated text
+    """
+    if memory is None:
+        memory = settings.use_translation_memory
+    use_memory = (memory and
+                  not (debug or translator.Translator.turn_on_debugging))
+
+    if use_memory:
+        bn_dict.load_dictionary()
+        remembered = translation_memory.recall(input_text)
+        if remembered is not None:
+            output, new_words = remembered
+            for lookup_key in new_words:
+                bn_dict.add_new_word(lookup_key)
+            if user_settings.save_new_words_list:
+                bn_dict.save_new_words_list()
+            return output
+
+    with bn_dict.recording_new_words() as new_words:
+        processed = xml_pp.xml_pre_processor(input_text)
+        tagged = pos_tagger.penn_treebank_tagger(processed)
+        translated = translator.translate_in_bengali(tagged, debug or None, jobs)
+
+    output = xml_pp.xml_post_processor(translated)
+
+    if use_memory:
+        translation_memory.remember(input_text, output, new_words)
+    return output
+
+
+def translate_stream(input_pieces: Iterable[str], debug: int = 0) -> Iterator[str]:
+    """
+    Translate text that arrives in pieces (e.g. lines of a large file),
+    yielding the translation as it is produced. The text is cut into
+    chunks at mark-up and sentence boundaries, so memory use does not
+    grow with the size of the input.
+
+    Args:
+        input_pieces: English text in pieces of any size
+        debug: Debugging level for this text only (0 keeps the current one)
+
+    Yields:
+        Translated text in pieces
+    """
+    if user_settings.verbose:
+        print("Translating...", file=sys.stderr)
+
+    bn_dict.load_dictionary()
+
+    pre_processor = xml_pp.XmlPreProcessor()
+    chunker = xml_pp.PreProcessedTextChunker(settings.stream_chunk_size,
+                                             settings.stream_chunk_limit)
+    post_processor = xml_pp.XmlPostProcessor()
+
+    def chunks():
+        for piece in input_pieces:
+            yield from chunker.feed(pre_processor.feed(piece))
+        yield from chunker.feed(pre_processor.flush())
+        yield from chunker.flush()
+
+    # The next chunk is tagged while the current one is translated
+    is_it_first_print = True
+    tagged_chunks = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as tagging:
+        for chunk in chunks():
+            tagged_chunks.append(tagging.submit(pos_tagger.penn_treebank_tagger, chunk))
+            if len(tagged_chunks) < 2:
+                continue
+            yield post_processor.feed(translator.translate_tagged_text(
+                tagged_chunks.popleft().result(), debug or None, is_it_first_print))
+            is_it_first_print = False
+
+        while tagged_chunks:
+            yield post_processor.feed(translator.translate_tagged_text(
+                tagged_chunks.popleft().result(), debug or None, is_it_first_print))
+            is_it_first_print = False
+
+    yield post_processor.flush()
+
+    # Now saves the new words list
+    if user_settings.save_new_words_list:
+        bn_dict.save_new_words_list()
+
+    if user_settings.verbose:
+        print("Done...", file=sys.stderr)
+
+
+def warm_up():
+    """
+    Load dictionaries and verb paradigms and start the PoS tagger ahead
+    of the first translation
+    """
+    bn_dict.load_dictionary()
+    bn_verb.load_verb_paradigms()
+    if pos_tagger.tagger_backend() is not None:
+        try:
+            pos_tagger.tagger_backend().tag("")
+        except IOError:
+            pass
+    elif settings.penn_treebank_tagger_coprocess:
+        try:
+            pos_tagger.get_tagger_pool()
+        except IOError:
+            pos_tagger.TaggerCoprocess.failed = True
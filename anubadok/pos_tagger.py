@@ -32,10 +32,22 @@
 #___________________________________________________________________
 
 import os
-import random
+import re
+import atexit
+import hashlib
+import sqlite3
+import contextlib
+import queue
+import shutil
 import subprocess
+import tempfile
+import threading
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional
 
 from anubadok import settings
+from anubadok import en_tagger
 
 ###########################################
 #
@@ -45,14 +57,74 @@ from anubadok import settings
 
 POSTAGGER_VERSION = "GPoSTTL 0.9.6git"
 
+# Frame delimiter of the co-process protocol. The " . " in between forces
+# the tagger to close the current sentence so that every token of the
+# frame is flushed before the untagged end marker is echoed back.
+FRAME_START_MARKER = "<__ANUBADOK__FRAME__START__>"
+FRAME_END_MARKER = "<__ANUBADOK__FRAME__END__>"
+FRAME_DELIMITER = f"\n{FRAME_START_MARKER} . {FRAME_END_MARKER}\n"
+
+
+# The input is cut for the tagger cache at sentence ends: after every
+# standalone " . " (xml_pp puts one around every mark-up), and after a
+# word ending with ".", "!" or "?" that is followed by a capital letter
+# or mark-up. The pieces in between are tagged independently.
+TAGGER_SENTENCE_END = re.compile(r'(\S*?)([.!?])(?=\s+(\S)?)')
+
+# Delimiter of the pieces tagged together in one call, closing the
+# sentence of the delimiter itself as well
+PIECE_MARKER = "<__ANUBADOK__PIECE__>"
+PIECE_DELIMITER = f"\n{PIECE_MARKER} . \n"
+
+
+class TaggerBackend(NamedTuple):
+    """
+    A tagger run in-process instead of an external tagger: tag(text)
+    gives the same output as the external tagger, and version() what the
+    output depends on (e.g. the model file)
+    """
+    tag: Callable[[str], str]
+    version: Callable[[], str]
+
+
+# In-process taggers by the name given as settings.penn_treebank_tagger
+tagger_backends: Dict[str, TaggerBackend] = {}
+
+
+class TaggerCoprocess:
+    """
+    State of the long-lived tagger co-processes
+    """
+    pool = None
+    lock = threading.Lock()
+    failed = False
+
+
+class TaggerCache:
+    """
+    Tagged pieces of text (see TAGGER_SENTENCE_END) by the tagger and the
+    text, most recently used last. Pieces longer than
+    settings.tagger_cache_piece_size are not kept.
+    """
+    entries: "OrderedDict[tuple, str]" = OrderedDict()
+    hits: int = 0
+    misses: int = 0
+    lock = threading.Lock()
+    # On-disk store (settings.tagger_cache_db), opened once per process
+    connection: Optional[sqlite3.Connection] = None
+    path: Optional[str] = None
+
+
 def penn_treebank_tagger(text):
     """
     Calls the Penn Treebank tagger on the input text.
     
+    The text is cut into pieces at sentence ends. Pieces tagged before
+    are taken from the tagger cache, and the others are tagged together
+    in a single call of the tagger.
+    
     Args:
         text: The text to be tagged
-        anubadok_tmp_dir: Directory for temporary files (from Settings)
-        penn_treebank_tagger_path: Path to the tagger executable (from Settings)
         
     Returns:
         The tagged output as a string
@@ -60,53 +132,692 @@ def penn_treebank_tagger(text):
     Raises:
         IOError: If temp file cannot be created or tagger cannot be executed
     """
-    anubadok_tmp_dir = settings.anubadok_tmp_dir
-    penn_treebank_tagger_path = settings.penn_treebank_tagger
-
-    # Create a temporary file with random name
-    tmp_file = os.path.join(
-        anubadok_tmp_dir,
-        f"_{random.randint(0, 100000)}_tmp_tagger_input_file"
+    if settings.tagger_cache_size <= 0 and not settings.use_tagger_cache_db:
+        return run_penn_treebank_tagger(text)
+    
+    tagger = settings.penn_treebank_tagger
+    pieces = split_at_sentence_ends(text)
+    if not pieces:
+        return run_penn_treebank_tagger(text)
+    tagged_pieces: List[Optional[str]] = [lookup_tagged_piece(tagger, piece) for piece in pieces]
+    
+    missing = list(dict.fromkeys(
+        piece for piece, tagged in zip(pieces, tagged_pieces) if tagged is None
+    ))
+    if not missing:
+        return "".join(tagged_pieces)
+    
+    if len(missing) == 1:
+        tagged_missing = [run_penn_treebank_tagger(missing[0])]
+    else:
+        tagged_missing = split_tagged_pieces(
+            run_penn_treebank_tagger(PIECE_DELIMITER.join(missing)), len(missing))
+        if tagged_missing is None:
+            # The tagger did not keep the pieces apart
+            return run_penn_treebank_tagger(text)
+    
+    tagged_by_piece = dict(zip(missing, tagged_missing))
+    for piece, tagged in tagged_by_piece.items():
+        store_tagged_piece(tagger, piece, tagged)
+    
+    return "".join(
+        tagged if tagged is not None else tagged_by_piece[piece]
+        for piece, tagged in zip(pieces, tagged_pieces)
     )
+
+
+def split_at_sentence_ends(text):
+    """
+    Cut text into pieces at sentence ends (see TAGGER_SENTENCE_END). The
+    white space around the pieces, which the tagger ignores, is dropped,
+    so that a sentence is the same piece wherever it occurs.
+    """
+    pieces = []
+    start = 0
+    for match in TAGGER_SENTENCE_END.finditer(text):
+        if is_tagger_sentence_end(*match.groups()):
+            pieces.append(text[start:match.end()].strip())
+            start = match.end()
+    pieces.append(text[start:].strip())
+    return [piece for piece in pieces if piece]
+
+
+def is_tagger_sentence_end(word, mark, next_char):
+    """
+    Whether the tagger closes the sentence at the mark after a word. To be
+    safe, a full stop after an abbreviation, initials or a number is not
+    taken as a sentence end.
+    """
+    if not word and mark == ".":
+        return True
+    if next_char is None or not (next_char.isupper() or next_char == "<"):
+        return False
+    if mark != ".":
+        return True
+    return (word[-1].isalpha() and "." not in word and len(word) > 1 and
+            word.lower() + "." not in en_tagger.ABBREVIATIONS)
+
+
+def split_tagged_pieces(tagged_text, count):
+    """
+    Split the tagger output of pieces joined by PIECE_DELIMITER
+    
+    Returns:
+        List of tagged pieces, or None if there are not as many as expected
+    """
+    pieces = []
+    lines = []
+    skip_sentence_end = False
+    
+    for line in tagged_text.splitlines(keepends=True):
+        if skip_sentence_end:
+            skip_sentence_end = False
+            if line.startswith("."):
+                continue
+        
+        if line.rstrip('\n') == PIECE_MARKER:
+            pieces.append("".join(lines))
+            lines = []
+            skip_sentence_end = True
+        else:
+            lines.append(line)
+    
+    pieces.append("".join(lines))
+    return pieces if len(pieces) == count else None
+
+
+def lookup_tagged_piece(tagger, piece):
+    """
+    Tagged piece from the in-memory cache or the on-disk store (None if
+    it has not been tagged before)
+    """
+    key = (tagger, piece)
+    with TaggerCache.lock:
+        if len(piece) > settings.tagger_cache_piece_size:
+            TaggerCache.misses += 1
+            return None
+        
+        tagged = TaggerCache.entries.get(key)
+        if tagged is not None:
+            TaggerCache.entries.move_to_end(key)
+            TaggerCache.hits += 1
+            return tagged
+        
+        connection = open_tagger_cache_db()
+        if connection is not None:
+            try:
+                row = connection.execute(
+                    "SELECT output FROM tagged WHERE piece = ? AND tagger = ?",
+                    (piece_hash(piece), tagger_version(tagger))
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                TaggerCache.hits += 1
+                remember_tagged_piece(key, row[0])
+                return row[0]
+        
+        TaggerCache.misses += 1
+        return None
+
+
+def store_tagged_piece(tagger, piece, tagged):
+    """
+    Keep a tagged piece in the in-memory cache and the on-disk store
+    """
+    if len(piece) > settings.tagger_cache_piece_size:
+        return
+    
+    with TaggerCache.lock:
+        remember_tagged_piece((tagger, piece), tagged)
+        
+        connection = open_tagger_cache_db()
+        if connection is not None:
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO tagged VALUES (?, ?, ?)",
+                        (piece_hash(piece), tagger_version(tagger), tagged)
+                    )
+            except sqlite3.Error:
+                pass
+
+
+def remember_tagged_piece(key, tagged):
+    """
+    Add a tagged piece to the in-memory cache (TaggerCache.lock held)
+    """
+    if settings.tagger_cache_size <= 0:
+        return
+    TaggerCache.entries[key] = tagged
+    while len(TaggerCache.entries) > settings.tagger_cache_size:
+        TaggerCache.entries.popitem(last=False)
+
+
+def piece_hash(piece):
+    """
+    Hash of a piece of text for the on-disk store
+    """
+    return hashlib.sha256(piece.encode('utf-8')).hexdigest()
+
+
+def tagger_version(tagger):
+    """
+    Tagger (and its version) of the tagged pieces in the on-disk store
+    """
+    backend = tagger_backends.get(tagger)
+    if backend is not None:
+        return f"{tagger} ({backend.version()})"
+    return f"{tagger} ({POSTAGGER_VERSION})"
+
+
+def open_tagger_cache_db():
+    """
+    Open (or create) the on-disk store of tagged pieces once per process,
+    if it is turned on. Returns None otherwise or if that is not possible.
+    """
+    if not settings.use_tagger_cache_db:
+        return None
+    
+    path = settings.tagger_cache_db
+    if TaggerCache.path == path:
+        return TaggerCache.connection
     
     try:
-        # Write the input text to the temp file
-        with open(tmp_file, 'w', encoding='utf-8') as f:
-            f.write(text)
+        connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS tagged ("
+            " piece TEXT NOT NULL,"
+            " tagger TEXT NOT NULL,"
+            " output TEXT NOT NULL,"
+            " PRIMARY KEY (piece, tagger))"
+        )
+        connection.commit()
+    except sqlite3.Error:
+        connection = None
+    
+    TaggerCache.connection = connection
+    TaggerCache.path = path
+    return connection
+
+
+def tagger_cache_info():
+    """
+    Hits, misses and size of the (in-memory) tagger cache
+    """
+    with TaggerCache.lock:
+        return {
+            "hits": TaggerCache.hits,
+            "misses": TaggerCache.misses,
+            "size": len(TaggerCache.entries),
+            "max_size": settings.tagger_cache_size,
+        }
+
+
+def run_penn_treebank_tagger(text):
+    """
+    Calls the Penn Treebank tagger on the input text (without the cache).
+    
+    Taggers registered as backends are run in-process. Otherwise a warm
+    co-process from the tagger pool is used when co-process mode is
+    enabled. If the tagger cannot be driven through a pipe, it falls
+    back to one exec of the tagger per call.
+    
+    Args:
+        text: The text to be tagged
+        
+    Returns:
+        The tagged output as a string
         
-        # Call the tagger and capture its output
+    Raises:
+        IOError: If temp file cannot be created or tagger cannot be executed
+    """
+    backend = tagger_backend()
+    if backend is not None:
+        return backend.tag(text)
+
+    if settings.penn_treebank_tagger_coprocess and not TaggerCoprocess.failed:
+        try:
+            return get_tagger_pool().tag(text)
+        except IOError:
+            # Tagger does not speak the pipe protocol; stop trying
+            TaggerCoprocess.failed = True
+            shutdown_tagger_pool()
+
+    return penn_treebank_tagger_once(text)
+
+
+def register_tagger_backend(name, tag, version):
+    """
+    Make a tagger run in-process selectable as settings.penn_treebank_tagger
+    
+    Args:
+        name: Name to be given as settings.penn_treebank_tagger
+        tag: Function giving the tagged output (word\tTAG\tlemma per line,
+             mark-up passed through) of a text
+        version: Function giving what the output depends on
+    """
+    tagger_backends[name] = TaggerBackend(tag, version)
+
+
+def tagger_backend():
+    """
+    The in-process tagger selected by settings.penn_treebank_tagger, if any
+    """
+    return tagger_backends.get(settings.penn_treebank_tagger)
+
+
+register_tagger_backend(en_tagger.NATIVE_TAGGER, en_tagger.tag_text, en_tagger.tagger_model_version)
+
+
+def penn_treebank_tagger_once(text):
+    """
+    Calls the Penn Treebank tagger once on the input text.
+    
+    The text is piped through the tagger's stdin. Taggers which insist on
+    an input file are given an in-memory file instead, so that nothing is
+    written to anubadok_tmp_dir in the common case.
+    
+    Args:
+        text: The text to be tagged
+        
+    Returns:
+        The tagged output as a string
+        
+    Raises:
+        IOError: If input file cannot be created or tagger cannot be executed
+    """
+    if settings.penn_treebank_tagger_stdin and not TaggerInput.stdin_failed:
+        try:
+            return run_tagger_on_stdin(text)
+        except IOError:
+            # Tagger does not read its stdin; stop trying
+            TaggerInput.stdin_failed = True
+
+    return run_tagger_on_file(text)
+
+
+class TaggerInput:
+    """
+    How the one-shot tagger gets its input
+    """
+    stdin_failed = False
+
+
+def run_tagger_on_stdin(text):
+    """
+    Run the tagger with the text piped through its stdin
+    """
+    penn_treebank_tagger_path = settings.penn_treebank_tagger
+
+    try:
         result = subprocess.run(
-            [penn_treebank_tagger_path, tmp_file],
-            check=True,
+            [penn_treebank_tagger_path],
+            input=text,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True
+            text=True,
+            encoding='utf-8'
         )
-        
-        # Clean up the temp file
-        try:
-            os.unlink(tmp_file)
-        except:
-            pass
-        
+    except OSError as e:
+        raise IOError(
+            f"Error! Could not execute Penn Treebank tagger ({penn_treebank_tagger_path}). "
+            f"Error: {e}"
+        )
+
+    if result.returncode != 0 or (text.strip() and not result.stdout.strip()):
+        raise IOError(
+            f"Error! Penn Treebank tagger failed ({penn_treebank_tagger_path}). "
+            f"Error: {result.stderr}"
+        )
+
+    return result.stdout
+
+
+def run_tagger_on_file(text):
+    """
+    Run the tagger with the text given as an input file
+    """
+    penn_treebank_tagger_path = settings.penn_treebank_tagger
+
+    try:
+        with tagger_input_file(text) as (input_file, pass_fds):
+            # Call the tagger and capture its output
+            result = subprocess.run(
+                [penn_treebank_tagger_path, input_file],
+                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding='utf-8',
+                pass_fds=pass_fds
+            )
         return result.stdout
-        
+
     except subprocess.CalledProcessError as e:
-        # Clean up temp file if it exists
-        try:
-            os.unlink(tmp_file)
-        except:
-            pass
         raise IOError(
             f"Error! Penn Treebank tagger failed ({penn_treebank_tagger_path}). "
             f"Error: {e.stderr}"
         )
     except IOError as e:
-        # Clean up temp file if it exists
+        raise IOError(f"Error! Could not open temp file: {str(e)}")
+
+
+@contextlib.contextmanager
+def tagger_input_file(text):
+    """
+    Provide the text as a file path for the tagger.
+    
+    An anonymous in-memory file is used where the platform supports it.
+    Otherwise a uniquely named temp file is created in anubadok_tmp_dir
+    (or the system temp dir if that is not writable) and removed after use.
+    
+    Yields:
+        Tuple of (file path, file descriptors to pass to the tagger)
+    """
+    if hasattr(os, 'memfd_create') and os.path.isdir("/dev/fd"):
+        fd = os.memfd_create("anubadok_tagger_input")
+        try:
+            with open(os.dup(fd), 'w', encoding='utf-8') as f:
+                f.write(text)
+            yield f"/dev/fd/{fd}", (fd,)
+        finally:
+            os.close(fd)
+        return
+
+    anubadok_tmp_dir = settings.anubadok_tmp_dir
+    if not os.access(anubadok_tmp_dir, os.W_OK):
+        anubadok_tmp_dir = None   # system temp dir
+
+    fd, tmp_file = tempfile.mkstemp(
+        prefix="_", suffix="_tmp_tagger_input_file", dir=anubadok_tmp_dir)
+    try:
+        with open(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        yield tmp_file, ()
+    finally:
         try:
             os.unlink(tmp_file)
-        except:
+        except OSError:
             pass
-        raise IOError(f"Error! Could not open temp file: {str(e)}")
 
 
+###########################################
+#
+#  Tagger co-process pool
+#
+###########################################
+
+class TaggerWorker:
+    """
+    A long-lived tagger process which is fed through its stdin and read
+    back through its stdout, one frame per tagging request.
+    """
+
+    def __init__(self, command):
+        self.command = command
+        self.process = None
+        self.output_lines = None
+        self.start()
+
+    def start(self):
+        """
+        Start (or restart) the tagger process
+        """
+        try:
+            self.process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                bufsize=1
+            )
+        except OSError as e:
+            raise IOError(
+                f"Error! Could not start Penn Treebank tagger ({self.command[-1]}). "
+                f"Error: {e}"
+            )
+
+        # A reader thread drains stdout so that large frames cannot
+        # deadlock and reads can time out.
+        self.output_lines = queue.Queue()
+        reader = threading.Thread(
+            target=read_tagger_output,
+            args=(self.process.stdout, self.output_lines),
+            daemon=True
+        )
+        reader.start()
+        self.probe()
+
+    def probe(self):
+        """
+        Check with an empty frame that the tagger answers each frame as it
+        is sent. A tagger which waits for the end of its input cannot be
+        used as a co-process, which is then known without a long timeout.
+        
+        Raises:
+            IOError: If the tagger does not answer the frame in time
+        """
+        try:
+            self.tag("", settings.penn_treebank_tagger_probe_timeout)
+        except IOError:
+            # A tagger still running has not crashed but waits for more input
+            if self.process.poll() is None:
+                self.process.kill()
+                self.process.wait()
+                remember_no_pipe_tagger()
+            self.process = None
+            raise IOError("Error! Penn Treebank tagger does not answer through a pipe.")
+
+    def stop(self):
+        """
+        Stop the tagger process
+        """
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+    def restart(self):
+        """
+        Replace a crashed or stalled tagger process by a fresh one
+        """
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+        self.start()
+
+    def tag(self, text, timeout=None):
+        """
+        Send one frame to the tagger and collect its tagged output.
+        
+        Args:
+            text: The text to be tagged
+            timeout: Seconds to wait for each line of output
+                (default: settings.penn_treebank_tagger_timeout)
+            
+        Returns:
+            The tagged output as a string
+            
+        Raises:
+            IOError: If the tagger died, stalled or broke the protocol
+        """
+        if self.process.poll() is not None:
+            raise IOError("Error! Penn Treebank tagger co-process has exited.")
+
+        try:
+            self.process.stdin.write(text + FRAME_DELIMITER)
+            self.process.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise IOError(f"Error! Could not write to tagger co-process: {e}")
+
+        if timeout is None:
+            timeout = settings.penn_treebank_tagger_timeout
+
+        output = []
+        while True:
+            try:
+                line = self.output_lines.get(timeout=timeout)
+            except queue.Empty:
+                raise IOError("Error! Penn Treebank tagger co-process timed out.")
+
+            if line is None:
+                raise IOError("Error! Penn Treebank tagger co-process has exited.")
+            if line.rstrip('\n') == FRAME_END_MARKER:
+                break
+            output.append(line)
+
+        # Drop the frame start marker and the forced sentence end
+        for i in range(len(output) - 1, -1, -1):
+            if output[i].rstrip('\n') == FRAME_START_MARKER:
+                return "".join(output[:i])
+
+        raise IOError("Error! Penn Treebank tagger co-process lost frame marker.")
+
+    def tag_with_restart(self, text):
+        """
+        Tag the text, restarting the tagger once if it crashed or stalled
+        """
+        try:
+            return self.tag(text)
+        except IOError:
+            self.restart()
+            return self.tag(text)
+
+
+class TaggerWorkerPool:
+    """
+    Fixed size pool of tagger workers shared by all callers
+    """
+
+    def __init__(self, command, size):
+        self.workers = []
+        self.idle_workers = queue.Queue()
+
+        try:
+            for _ in range(max(1, size)):
+                worker = TaggerWorker(command)
+                self.workers.append(worker)
+                self.idle_workers.put(worker)
+        except IOError:
+            self.close()
+            raise
+
+    def tag(self, text):
+        """
+        Tag the text with the next idle worker
+        """
+        worker = self.idle_workers.get()
+        try:
+            return worker.tag_with_restart(text)
+        finally:
+            self.idle_workers.put(worker)
+
+    def close(self):
+        """
+        Stop all workers
+        """
+        for worker in self.workers:
+            worker.stop()
+
+
+def read_tagger_output(stream, output_lines):
+    """
+    Forward every line of the tagger output to the given queue.
+    None is queued when the tagger closes its output.
+    """
+    try:
+        for line in stream:
+            output_lines.put(line)
+    except (OSError, ValueError):
+        pass
+    output_lines.put(None)
+
+
+def tagger_coprocess_command():
+    """
+    Command line of the tagger co-process. Output is line buffered with
+    stdbuf (when available) as stdio would otherwise hold it back.
+    """
+    command = [settings.penn_treebank_tagger]
+    if shutil.which("stdbuf"):
+        command = ["stdbuf", "-oL"] + command
+    return command
+
+
+def get_tagger_pool():
+    """
+    Return the process wide tagger pool, starting it on first use
+
+    Raises:
+        IOError: If the tagger is known not to answer through a pipe,
+            or does not do so when started
+    """
+    with TaggerCoprocess.lock:
+        if TaggerCoprocess.pool is None:
+            if no_pipe_tagger_signature() in read_no_pipe_taggers():
+                raise IOError("Error! Penn Treebank tagger does not answer through a pipe.")
+            TaggerCoprocess.pool = TaggerWorkerPool(
+                tagger_coprocess_command(),
+                settings.penn_treebank_tagger_pool_size
+            )
+        return TaggerCoprocess.pool
+
+
+def no_pipe_tagger_signature():
+    """
+    Path and mtime of the tagger, so that an updated tagger is tried again
+    """
+    path = shutil.which(settings.penn_treebank_tagger) or settings.penn_treebank_tagger
+    try:
+        mtime = int(os.path.getmtime(path))
+    except OSError:
+        mtime = 0
+    return f"{os.path.abspath(path)}\t{mtime}"
+
+
+def read_no_pipe_taggers():
+    """
+    Taggers found not to answer through a pipe (see tagger_no_pipe_list)
+    """
+    try:
+        with open(settings.tagger_no_pipe_list, 'r', encoding='utf-8') as f:
+            return {line.rstrip('\n') for line in f}
+    except IOError:
+        return set()
+
+
+def remember_no_pipe_tagger():
+    """
+    Note that the tagger does not answer through a pipe, so that later
+    runs do not wait for it again
+    """
+    try:
+        with open(settings.tagger_no_pipe_list, 'a', encoding='utf-8') as f:
+            f.write(no_pipe_tagger_signature() + "\n")
+    except IOError:
+        pass
+
+
+def shutdown_tagger_pool():
+    """
+    Stop all tagger co-processes
+    """
+    with TaggerCoprocess.lock:
+        if TaggerCoprocess.pool is not None:
+            TaggerCoprocess.pool.close()
+            TaggerCoprocess.pool = None
+
+
+atexit.register(shutdown_tagger_pool)
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+
+import os
+import sys
+import json
+import signal
+import socket
+import threading
+import traceback
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import user_settings
+from anubadok import bn_dict
+from anubadok import bn_sondhi
+from anubadok import pipeline
+from anubadok import pos_tagger
+from anubadok import translator
+
+###########################################
+#
+#  Translation server
+#
+#  Keeps dictionaries and the PoS tagger resident and translates
+#  requests received over a Unix socket and/or localhost HTTP.
+#
+#  Unix socket: one JSON object per line in each direction
+#    -> {"text": "..."}            <- {"output": "..."}
+#       ("debug": N turns on debugging, printed by the server, for the text;
+#        "memory": true is the -m option of anubadok; the threads serving
+#        requests share one connection to the translation memory, which
+#        is used by one of them at a time)
+#    -> {"command": "version"}     <- {"version": "..."}
+#    -> {"command": "cache"}       <- {"cache": {"hits": N, "misses": N, ...},
+#                                      "tagger_cache": {...},
+#                                      "sondhi_cache": {...},
+#                                      "unknown_words": {...}}
+#    <- {"error": "..."} on failure
+#
+#  HTTP: POST /translate with the same JSON request body
+#        GET  /version, GET /cache
+#
+###########################################
+
+
+def handle_request(request):
+    """
+    Serve a single decoded request
+
+    Args:
+        request: Request object (see above)
+
+    Returns:
+        Response object
+    """
+    if not isinstance(request, dict):
+        return {"error": "Request must be a JSON object."}
+
+    if request.get("command") == "version":
+        return {"version": translator.version}
+
+    if request.get("command") == "cache":
+        return {"cache": translator.translation_cache_info(),
+                "tagger_cache": pos_tagger.tagger_cache_info(),
+                "sondhi_cache": bn_sondhi.sondhi_cache_info(),
+                "unknown_words": bn_dict.unknown_words_info()}
+
+    text = request.get("text")
+    if not isinstance(text, str):
+        return {"error": "Request has no text to translate."}
+
+    debug = 0
+    try:
+        debug = int(request.get("debug") or 0)
+        # Requests are translated by threads of their own. The pool of
+        # processes is never used, as forking a process with other threads
+        # running may leave locks held in the forked process.
+        return {"output": pipeline.translate_text(
+            text, debug, jobs=1,
+            memory=True if request.get("memory") else None)}
+    except Exception as e:
+        if user_settings.verbose or debug:
+            traceback.print_exc(file=sys.stderr)
+        return {"error": f"Translation failed: {e}"}
+
+
+def decode_request(data):
+    """
+    Decode a JSON request (None if it is malformed)
+    """
+    try:
+        return json.loads(data.decode('utf-8'))
+    except (UnicodeDecodeError, ValueError):
+        return None
+
+
+class UnixRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Serve JSON line requests until the client closes the connection
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            request = decode_request(line)
+            if request is None:
+                response = {"error": "Malformed request."}
+            else:
+                response = handle_request(request)
+
+            try:
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+                self.wfile.flush()
+            except OSError:
+                break
+
+
+class UnixTranslationServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class HttpRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serve POST /translate, GET /version and GET /cache
+    """
+
+    def do_GET(self):
+        if self.path == "/version":
+            self.send_json(200, handle_request({"command": "version"}))
+        elif self.path == "/cache":
+            self.send_json(200, handle_request({"command": "cache"}))
+        else:
+            self.send_json(404, {"error": "Not found."})
+
+    def do_POST(self):
+        if self.path != "/translate":
+            self.send_json(404, {"error": "Not found."})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.send_json(400, {"error": "Invalid Content-Length."})
+            return
+
+        request = decode_request(self.rfile.read(length))
+        if request is None:
+            self.send_json(400, {"error": "Malformed request."})
+            return
+
+        response = handle_request(request)
+        self.send_json(500 if "error" in response else 200, response)
+
+    def send_json(self, status, response):
+        body = json.dumps(response, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if user_settings.verbose:
+            super().log_message(format, *args)
+
+
+class HttpTranslationServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+def remove_stale_socket(socket_path):
+    """
+    Remove a socket file left behind by a server that is no longer running
+
+    Raises:
+        IOError: If another server is still listening on the socket
+    """
+    if not os.path.exists(socket_path):
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+    else:
+        raise IOError(f"Error! Anubadok server is already running at {socket_path}.")
+    finally:
+        probe.close()
+
+
+def run_server(socket_path=None, host=None, port=None):
+    """
+    Run the translation server until interrupted
+
+    Args:
+        socket_path: Unix socket to listen on (None to disable)
+        host: Address for the HTTP server
+        port: Port for the HTTP server (None or 0 to disable)
+    """
+    servers = []
+
+    if socket_path:
+        remove_stale_socket(socket_path)
+
+    try:
+        if socket_path:
+            servers.append(UnixTranslationServer(socket_path, UnixRequestHandler))
+            os.chmod(socket_path, 0o600)
+        if port:
+            servers.append(HttpTranslationServer((host, port), HttpRequestHandler))
+    except OSError as e:
+        for server in servers:
+            server.server_close()
+        if servers and socket_path:
+            os.unlink(socket_path)
+        raise IOError(f"Error! Could not start Anubadok server. Error: {e}")
+
+    if not servers:
+        raise IOError("Error! Neither a socket nor a port is given for Anubadok server.")
+
+    pipeline.warm_up()
+
+    # Clean up on SIGTERM as well as on Ctrl-C
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    threads = []
+    for server in servers:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    if user_settings.verbose:
+        if socket_path:
+            print(f"Anubadok server is listening on {socket_path}", file=sys.stderr)
+        if port:
+            print(f"Anubadok server is listening on http://{host}:{port}", file=sys.stderr)
+
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
@@ -41,9 +41,27 @@ import sys
 
 primary_dict_db = "__PREFIX__/share/anubadok/bdict.db"
 primary_dict_db = "./data/bdict.db"   # REMOVE THIS LINE during installation 
+primary_mwe_db = "__PREFIX__/share/anubadok/mwe.db"
+primary_mwe_db = "./data/mwe.db"   # REMOVE THIS LINE during installation 
 user_anubadok_dir = os.path.expanduser("~/.anubadok")
 anubadok_tmp_dir = "."
 penn_treebank_tagger = "gposttl"
+# To tag with the built-in tagger instead (after training its model with
+# scripts/train_anubadok_tagger.py) use
+# penn_treebank_tagger = "anubadok-hmm"
+
+# Keep the tagger running as a co-process instead of one exec per call
+# (turned on by anubadok --server and --stream). A tagger which does not
+# answer the first (empty) frame in time is listed in tagger_no_pipe_list
+# and run once per call from then on.
+penn_treebank_tagger_coprocess = False
+penn_treebank_tagger_pool_size = 1
+penn_treebank_tagger_timeout = 30   # Seconds without any tagger output
+penn_treebank_tagger_probe_timeout = 5   # Seconds to answer the first frame
+tagger_no_pipe_list = os.path.join(user_anubadok_dir, "tagger.nopipe")
+
+# Pipe input through the tagger's stdin rather than an input file
+penn_treebank_tagger_stdin = True
 
 #____________________________________________________________________
 #
@@ -56,10 +74,68 @@ if user_anubadok_dir not in sys.path:
 
 secondary_dict_db = os.path.join(user_anubadok_dir, "bdict.new.db")
 user_dict_db = os.path.join(user_anubadok_dir, "bdict.user.db")
+user_mwe_db = os.path.join(user_anubadok_dir, "mwe.user.db")
+tagger_model = os.path.join(user_anubadok_dir, "tagger.model")
 user_settings_py = os.path.join(user_anubadok_dir, "user_settings.py")
 user_info_py = os.path.join(user_anubadok_dir, "user_info.py")
 
 local_dict_db = os.path.join(anubadok_tmp_dir, "bdict.local.db")
 new_words_list = os.path.join(anubadok_tmp_dir, "new_words.list")
 
+# Compiled (memory mapped) form of the primary, secondary and user
+# dictionaries (the local one is read on top of it)
+use_compiled_dictionary = True
+compiled_dict_dir = user_anubadok_dir
+
+# Write numbers in Indian digit grouping (lakh and crore), e.g. ১২,৩৪,৫৬৭
+# for 1,234,567. Only numbers already grouped, or of six digits or more,
+# are regrouped, so that years etc. are left alone.
+indian_digit_grouping = False
+
+# Number of processes for translating large documents, and the least
+# number of tagged lines given to each of them at a time (no more
+# processes than CPUs are used; the server always uses one per input)
+translation_jobs = 1
+translation_block_lines = 500
+
+# Most sentences (translations of sentence blocks) remembered, so that
+# repeated sentences are not translated again (0 turns it off)
+translation_cache_size = 4096
+
+# Translations of whole input texts (e.g. PO msgids) kept across runs,
+# so that unchanged ones are not tagged and translated again
+use_translation_memory = False
+translation_memory_db = os.path.join(user_anubadok_dir, "memory.db")
+
+# Most tagged sentences remembered, so that sentences are not tagged
+# again (0 turns it off), and whether to keep them across runs as well.
+# Longer pieces of text (in characters) than tagger_cache_piece_size are
+# tagged without being kept.
+tagger_cache_size = 16384
+tagger_cache_piece_size = 4096
+use_tagger_cache_db = False
+tagger_cache_db = os.path.join(user_anubadok_dir, "tagger.db")
+
+# Most lookups of words not in the dictionary remembered, so that they
+# are not looked up again (0 turns it off)
+unknown_words_cache_size = 16384
+
+# Most sandhi joins remembered by the letters around the word boundary
+# (read at start-up)
+sondhi_cache_size = 8192
+
+# Keep the conjugated forms of the verbs of the dictionaries in
+# compiled_dict_dir, so that they are not generated again each run
+use_verb_paradigm_db = True
+
+# Size (in characters of pre-processed text) from which streamed input
+# is cut into chunks, the size at which it is cut even without a line
+# break after a sentence end, and the most read from the input at a time
+stream_chunk_size = 8192
+stream_chunk_limit = 262144
+stream_read_size = 65536
 
+# Translation server (anubadok --server) and its client
+server_socket = os.path.join(user_anubadok_dir, "anubadok.sock")
+server_host = "127.0.0.1"
+server_port = 8479
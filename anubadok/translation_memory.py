@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+
+import json
+import hashlib
+import sqlite3
+import threading
+from typing import List, Optional, Tuple
+
+from anubadok import settings
+from anubadok import bn_dict
+from anubadok import bn_dict_compiler
+from anubadok import en_mwe
+from anubadok import pos_tagger
+from anubadok import translator
+
+###########################################
+#
+#  Translation memory
+#
+#  Translations of whole input texts (segments, e.g. PO msgids) kept
+#  across runs in an sqlite database, so that unchanged segments are
+#  not tagged and translated again. Entries are keyed by a hash of the
+#  segment, of the dictionaries (and other data and settings the
+#  translation depends on) and of translator.version.
+#
+###########################################
+
+
+class TranslationMemory:
+    # Threads (e.g. of the server) share one connection and use it under
+    # the lock; other processes are kept apart by the locking of sqlite
+    connection: Optional[sqlite3.Connection] = None
+    # Path of the open database (None if it could not be opened)
+    path: Optional[str] = None
+    lock = threading.Lock()
+
+
+def segment_hash(segment: str) -> str:
+    """
+    Hash of an English segment
+    """
+    return hashlib.sha256(segment.encode('utf-8')).hexdigest()
+
+
+def dictionary_version() -> str:
+    """
+    Hash of the (loaded) dictionaries, multiword expressions, PoS tagger
+    and settings which the translation of a segment depends on
+    """
+    signature = [
+        bn_dict.BnDict.signature,
+        [bn_dict_compiler.source_signature(path) for path in en_mwe.multiword_expression_sources()],
+        pos_tagger.tagger_version(settings.penn_treebank_tagger),
+        settings.indian_digit_grouping,
+    ]
+    return hashlib.sha256(json.dumps(signature).encode('utf-8')).hexdigest()
+
+
+def open_translation_memory() -> Optional[sqlite3.Connection]:
+    """
+    Open (or create) the translation memory database once per process.
+    Returns None if that is not possible.
+    """
+    path = settings.translation_memory_db
+    if TranslationMemory.path == path:
+        return TranslationMemory.connection
+
+    try:
+        connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS memory ("
+            " segment TEXT NOT NULL,"
+            " dictionary TEXT NOT NULL,"
+            " version TEXT NOT NULL,"
+            " output TEXT NOT NULL,"
+            " new_words TEXT NOT NULL,"
+            " PRIMARY KEY (segment, dictionary, version))"
+        )
+        connection.commit()
+    except sqlite3.Error:
+        connection = None
+
+    TranslationMemory.connection = connection
+    TranslationMemory.path = path
+    return connection
+
+
+def recall(segment: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    Look up the translation of a segment
+
+    Args:
+        segment: English text
+
+    Returns:
+        Translation and new words found in it, or None if the segment
+        has not been translated with the current dictionaries and version
+    """
+    with TranslationMemory.lock:
+        connection = open_translation_memory()
+        if connection is None:
+            return None
+
+        try:
+            row = connection.execute(
+                "SELECT output, new_words FROM memory"
+                " WHERE segment = ? AND dictionary = ? AND version = ?",
+                (segment_hash(segment), dictionary_version(), translator.version)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+    if row is None:
+        return None
+    output, new_words = row
+    return output, new_words.split('\n') if new_words else []
+
+
+def remember(segment: str, output: str, new_words: List[str]) -> None:
+    """
+    Store the translation of a segment, replacing those made with other
+    dictionaries or versions
+    """
+    with TranslationMemory.lock:
+        connection = open_translation_memory()
+        if connection is None:
+            return
+
+        key = segment_hash(segment)
+        try:
+            with connection:
+                connection.execute("DELETE FROM memory WHERE segment = ?", (key,))
+                connection.execute(
+                    "INSERT INTO memory VALUES (?, ?, ?, ?, ?)",
+                    (key, dictionary_version(), translator.version,
+                     output, '\n'.join(new_words))
+                )
+        except sqlite3.Error:
+            pass
+
@@ -32,14 +32,22 @@
 #___________________________________________________________________
 
 
+import os
 import sys,re
-from typing import List, Tuple, Dict, Any
+import threading
+import multiprocessing
+import concurrent.futures
+from collections import OrderedDict
+from typing import List, Tuple, Dict, Any, Optional
 
 import user_settings
+from anubadok import settings
 from anubadok import bn_dict
 from anubadok import en_pp
 from anubadok import en_ss
+from anubadok.en_token import Token, tokens_to_text
 from anubadok import bn_sondhi
+from anubadok import bn_verb
 from anubadok.bn_table import BnTable
 
 version = "Anubadok 0.3.0 : (C) 2005-2025, Golam Mortuza Hossain (gmhossain at gmail.com)"
@@ -49,7 +57,9 @@ version = "Anubadok 0.3.0 : (C) 2005-2025, Golam Mortuza Hossain (gmhossain at g
 
 class Translator:
     """
-    All Sentence level indicators
+    State of a single translation: all sentence level indicators.
+    Class attributes hold the defaults; translate_in_bengali works on
+    its own instance, so translations can run concurrently.
     """
     is_it_first_print = True  # To avoid printing 'space' at the beginning
     object_or_subject_ind = 0
@@ -92,133 +102,343 @@ class Translator:
     bn_verb_sondhi_ind = 0
     bn_sub_obj_hhh_suffix = ""
     bn_mainverb = ""
+    bn_mainverb_suffix = ""
     bn_adverb = ""
     bn_sub_obj = ""
     bn_sub_obj_verb = ""
 
+    def __init__(self, turn_on_debugging: Optional[int] = None):
+        self.en_subject = []
+        self.en_object = []
+        self.en_verb = []
+        if turn_on_debugging is not None:
+            self.turn_on_debugging = turn_on_debugging
+
+
+# Indicators which bangla_translate depends on besides the sentence
+# (all the others are set by it before use)
+sentence_context_fields = (
+    "is_it_first_print",
+    "interrogative_sentence_ind",
+    "non_wh_question_ind",
+    "imperative_sentence_ind",
+    "passive_sentence_ind",
+    "pp_in_subject_ind",
+    "person",
+    "person_determined",
+    "formality",
+    "formality_determined",
+    "logical_block_ind",
+    "modal_should_ought_ind",
+    "modal_can_may_ind",
+    "beginning_of_sentence_ind",
+    "end_of_sentence_ind",
+    "bn_negation_preposition",
+    "bn_negation_determiner",
+    "anubadok_mode",
+)
+
+# All indicators, as restored from the cache
+translator_fields = tuple(
+    name for name, value in vars(Translator).items()
+    if not name.startswith('__') and not callable(value)
+)
+
+
+class TranslationCache:
+    """
+    Translations made by bangla_translate: the (most recently used)
+    sentences along with the indicators they depend on, mapped to the
+    translation, the indicators after it and the new words found.
+    Emptied whenever the dictionary changes.
+    """
+    entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+    generation: int = -1
+    hits: int = 0
+    misses: int = 0
+    lock = threading.Lock()
+
+
+def translation_cache_info() -> Dict[str, int]:
+    """
+    Hits, misses and size of the translation cache
+    """
+    with TranslationCache.lock:
+        return {
+            "hits": TranslationCache.hits,
+            "misses": TranslationCache.misses,
+            "size": len(TranslationCache.entries),
+            "max_size": settings.translation_cache_size,
+        }
+
+def clear_translation_cache() -> None:
+    """
+    Empty the translation cache and reset its counters
+    """
+    with TranslationCache.lock:
+        TranslationCache.entries.clear()
+        TranslationCache.hits = 0
+        TranslationCache.misses = 0
 
-def translate_in_bengali(input_text: str) -> str:
+def translate_in_bengali(input_text: str, turn_on_debugging: Optional[int] = None,
+                         jobs: Optional[int] = None) -> str:
     """
     Main translation function
+
+    Args:
+        input_text: Tagged text (word\tTAG\tlemma per line)
+        turn_on_debugging: Debugging level for this translation only
+            (default: Translator.turn_on_debugging)
+        jobs: Number of processes to translate with (default: settings.translation_jobs)
+
+    Returns:
+        Translated text
     """
-    
     if user_settings.verbose:
         print("Translating...", file=sys.stderr)
     
     # First, load dictionary
     bn_dict.load_dictionary()
     
+    if jobs is None:
+        jobs = settings.translation_jobs
+    jobs = min(jobs, os.cpu_count() or 1)
+    
+    if jobs > 1:
+        bengali_output = translate_in_parallel(input_text, jobs, turn_on_debugging)
+    else:
+        bengali_output = translate_tagged_text(input_text, turn_on_debugging)
+    
+    # Now saves the new words list
+    if user_settings.save_new_words_list:
+        bn_dict.save_new_words_list()
+    
+    # Print to world
+    if user_settings.verbose:
+        print("Done...", file=sys.stderr)
+    
+    # Return Bengali output
+    return bengali_output
+
+def translate_tagged_text(input_text: str, turn_on_debugging: Optional[int] = None,
+                          is_it_first_print: bool = True) -> str:
+    """
+    Translate tagged text with already loaded dictionaries
+
+    Args:
+        input_text: Tagged text (word\tTAG\tlemma per line)
+        turn_on_debugging: Debugging level for this translation only
+        is_it_first_print: Whether this is the beginning of the output
+
+    Returns:
+        Translated text
+    """
+    tr = Translator(turn_on_debugging)
+    
     # Preprocessing
     input_lines = en_pp.english_sentence_preprocessor(input_text)
     
-    if Translator.turn_on_debugging:
-        print("\n".join(input_lines), file=sys.stderr)
+    # Numbers of the whole text are translated at once
+    bn_dict.translate_numbers([sts.word + ":CD" for sts in input_lines
+                               if sts.tag == 'CD' or sts.lemma == "@card@"])
+    
+    if tr.turn_on_debugging:
+        print(tokens_to_text(input_lines), file=sys.stderr)
     
     sentence = []
     bengali_output = ""
     
     # Indicators
-    Translator.is_it_first_print = True  # To avoid printing 'space' at the beginning
-    reset_sentence_level_indicators()
+    tr.is_it_first_print = is_it_first_print  # To avoid printing 'space' at the beginning
+    reset_sentence_level_indicators(tr)
     
     for sts in input_lines:
-        if not re.search(r'\t', sts):
-            sts = sts.replace('__ANUBADOK__SPACE__', ' ')
-            sts = sts + "\t\t\n"
-        
-        wds_array = sts.split('\t')
+        if not sts.tag and not sts.lemma:
+            # Untagged words (e.g. mark-ups) are kept as they are
+            sts = sts._replace(word=sts.word.replace('__ANUBADOK__SPACE__', ' '))
         
-        if wds_array[1] == "SENT":  # sentence boundary
+        if sts.tag == "SENT":  # sentence boundary
             sentence.append(sts)
-            bengali_output += bangla_translate(sentence)
-            Translator.end_of_sentence_ind = 1
+            bengali_output += bangla_translate(tr, sentence)
+            tr.end_of_sentence_ind = 1
             sentence = []
-            sts = ""  # reset
-            reset_sentence_level_indicators()
-        elif wds_array[1] == "LBLM":  # Logical block marker
-            Translator.end_of_sentence_ind = 0
-            Translator.logical_block_ind = 1
-            bengali_output += bangla_translate(sentence)
+            reset_sentence_level_indicators(tr)
+        elif sts.tag == "LBLM":  # Logical block marker
+            tr.end_of_sentence_ind = 0
+            tr.logical_block_ind = 1
+            bengali_output += bangla_translate(tr, sentence)
             sentence = []
-            sts = ""  # reset
-            Translator.beginning_of_sentence_ind = 0
+            tr.beginning_of_sentence_ind = 0
         else:
             sentence.append(sts)
     
-    # Now saves the new words list
-    if user_settings.save_new_words_list:
-        bn_dict.save_new_words_list()
+    return bengali_output
+
+def translate_in_parallel(input_text: str, jobs: int,
+                          turn_on_debugging: Optional[int] = None) -> str:
+    """
+    Split tagged text into blocks of sentences and translate them in a
+    pool of processes. Sentences are translated independently of each
+    other, so the output is the same as that of translate_tagged_text.
+    """
+    block_size = max(settings.translation_block_lines,
+                     input_text.count('\n') // (jobs * 4) + 1)
+    blocks = en_pp.split_into_sentence_blocks(input_text, block_size)
     
-    # Print to world
-    if user_settings.verbose:
-        print("Done...", file=sys.stderr)
+    if len(blocks) < 2:
+        return translate_tagged_text(input_text, turn_on_debugging)
     
-    # Return Bengali output
-    return bengali_output
+    # Workers are forked where possible, so that they share the already
+    # loaded dictionary with this process
+    if "fork" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("fork")
+    else:
+        mp_context = None
+    
+    tasks = [(block, turn_on_debugging, i == 0) for i, block in enumerate(blocks)]
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(jobs, len(blocks)),
+            mp_context=mp_context,
+            initializer=initialize_translation_worker) as executor:
+        results = list(executor.map(translate_block, tasks))
+    
+    for _, new_words in results:
+        for key, count in new_words:
+            bn_dict.add_new_word(key, count)
+    
+    return "".join(output for output, _ in results)
+
+def initialize_translation_worker():
+    """
+    Prepare a worker process of translate_in_parallel
+    """
+    if bn_dict.BnDict.signature is None:
+        bn_dict.load_dictionary()
+
+def translate_block(task: Tuple[str, Optional[int], bool]) -> Tuple[str, List[Tuple[str, int]]]:
+    """
+    Translate a block of sentences in a worker process and return the
+    translation along with the new words found in it (and their counts)
+    """
+    block, turn_on_debugging, is_it_first_print = task
+    bn_dict.BnDict.new_words_table = {}
+    output = translate_tagged_text(block, turn_on_debugging, is_it_first_print)
+    return output, list(bn_dict.BnDict.new_words_table.items())
 
-def reset_sentence_level_indicators():
+def reset_sentence_level_indicators(tr):
     """
     Reset all sentence level indicators
     """
-    Translator.interrogative_sentence_ind = 0  # By default a sentence is not interrogative
-    Translator.non_wh_question_ind = 0
-    Translator.imperative_sentence_ind = 0  # By default a sentence is not imperative
-    Translator.passive_sentence_ind = 0  # By default a sentence is active
-    Translator.pp_in_subject_ind = False
+    tr.interrogative_sentence_ind = 0  # By default a sentence is not interrogative
+    tr.non_wh_question_ind = 0
+    tr.imperative_sentence_ind = 0  # By default a sentence is not imperative
+    tr.passive_sentence_ind = 0  # By default a sentence is active
+    tr.pp_in_subject_ind = False
+    
+    tr.person = 3  # default: 3rd person
+    tr.person_determined = 0  # reset
+    tr.formality = 1  # default: Most formal "Aapni"
+    tr.formality_determined = 0  # reset
+    tr.logical_block_ind = 0
+    
+    tr.modal_should_ought_ind = 0
+    tr.modal_can_may_ind = 0
+    tr.bn_negation_preposition = ""
+    
+    tr.beginning_of_sentence_ind = 1
+    tr.end_of_sentence_ind = 1
+    
+
+def bangla_translate(tr: Translator, sentence: List[Token]) -> str:
+    """
+    Main Bangla translation function
+    
+    A sentence translated before with the same indicators is taken from
+    the translation cache (unless debugging, as nothing would be printed)
+    """
+    max_size = settings.translation_cache_size
+    if tr.turn_on_debugging or max_size <= 0:
+        return bangla_translate_sub(tr, sentence)
+    
+    key = (tuple(sentence), tuple(getattr(tr, name) for name in sentence_context_fields))
+    
+    with TranslationCache.lock:
+        if TranslationCache.generation != bn_dict.BnDict.generation:
+            TranslationCache.entries.clear()
+            TranslationCache.generation = bn_dict.BnDict.generation
+        generation = TranslationCache.generation
+        
+        entry = TranslationCache.entries.get(key)
+        if entry is not None:
+            TranslationCache.entries.move_to_end(key)
+            TranslationCache.hits += 1
+        else:
+            TranslationCache.misses += 1
+    
+    if entry is not None:
+        bn_sentence, state, new_words = entry
+        for name, value in zip(translator_fields, state):
+            setattr(tr, name, list(value) if isinstance(value, list) else value)
+        for lookup_key in new_words:
+            bn_dict.add_new_word(lookup_key)
+        return bn_sentence
     
-    Translator.person = 3  # default: 3rd person
-    Translator.person_determined = 0  # reset
-    Translator.formality = 1  # default: Most formal "Aapni"
-    Translator.formality_determined = 0  # reset
-    Translator.logical_block_ind = 0
+    with bn_dict.recording_new_words() as new_words:
+        bn_sentence = bangla_translate_sub(tr, sentence)
     
-    Translator.modal_should_ought_ind = 0
-    Translator.modal_can_may_ind = 0
+    state = tuple(
+        list(value) if isinstance(value, list) else value
+        for value in (getattr(tr, name) for name in translator_fields)
+    )
     
-    Translator.beginning_of_sentence_ind = 1
-    Translator.end_of_sentence_ind = 1
+    with TranslationCache.lock:
+        if generation == TranslationCache.generation:
+            TranslationCache.entries[key] = (bn_sentence, state, tuple(new_words))
+            while len(TranslationCache.entries) > max_size:
+                TranslationCache.entries.popitem(last=False)
     
+    return bn_sentence
 
-def bangla_translate(sentence: List[str]) -> str:
-    """Main Bangla translation function"""
+def bangla_translate_sub(tr: Translator, sentence: List[Token]) -> str:
+    """Translate a sentence (or a logical block of it)"""
     
-    Translator.en_subject = []
-    Translator.en_object = []
-    Translator.en_verb = []
+    tr.en_subject = []
+    tr.en_object = []
+    tr.en_verb = []
     
-    Translator.bn_punctuation = ""
-    Translator.bn_word_ki_added_ind = 0
-    Translator.object_or_subject_ind = 0  # subject-object indicator
-    Translator.verb_hhh_ind = 0  # have, has, had indicator
+    tr.bn_punctuation = ""
+    tr.bn_word_ki_added_ind = 0
+    tr.object_or_subject_ind = 0  # subject-object indicator
+    tr.verb_hhh_ind = 0  # have, has, had indicator
     verb_should_ought_ind = 0  # 'Should' 'ought'
-    Translator.verb_mainverb_ind = 0  # main verb 'VV' indicator
+    tr.verb_mainverb_ind = 0  # main verb 'VV' indicator
     
-    Translator.verb_mainverb_do_ind = 0
-    Translator.verb_mainverb_be_ind = 0
-    Translator.bn_negation_word = ""
-    Translator.existential_there_ind = 0
-    Translator.modal_eng_word = ""
+    tr.verb_mainverb_do_ind = 0
+    tr.verb_mainverb_be_ind = 0
+    tr.bn_negation_word = ""
+    tr.existential_there_ind = 0
+    tr.modal_eng_word = ""
     
     # Now determine subject, object and verb
-    determine_subject_object_verb_new(sentence)
+    determine_subject_object_verb_new(tr, sentence)
     
     # Check whether it's an interrogative sentence
-    determine_sentence_type(sentence)
+    determine_sentence_type(tr, sentence)
     
     # Now determine tense
-    determine_tense()
+    determine_tense(tr)
     
     # For most interrogative sentences, subject and object needs to be swapped
-    if (Translator.interrogative_sentence_ind and 
-        not Translator.non_wh_question_ind):
-        swap_subject_object()
+    if (tr.interrogative_sentence_ind and 
+        not tr.non_wh_question_ind):
+        swap_subject_object(tr)
     
-    bn_subject = translate_subject()
-    bn_object = translate_object()
-    bn_verb = translate_verb()
+    bn_subject = translate_subject(tr)
+    bn_object = translate_object(tr)
+    bn_verb = translate_verb(tr)
     
     # In this case verb comes before object
-    if False and not Translator.verb_mainverb_ind and not Translator.end_of_sentence_ind:
+    if False and not tr.verb_mainverb_ind and not tr.end_of_sentence_ind:
         bn_sentence = f"{bn_subject} {bn_verb} {bn_object}"
     else:
         bn_sentence = f"{bn_subject} {bn_object} {bn_verb}"
@@ -228,21 +448,21 @@ def bangla_translate(sentence: List[str]) -> str:
     bn_sentence = re.sub(r' ,', ',', bn_sentence)
     bn_sentence = re.sub(r' $', '', bn_sentence)
     
-    if Translator.is_it_first_print:
+    if tr.is_it_first_print:
         bn_sentence = re.sub(r'^ ', '', bn_sentence)
-        Translator.is_it_first_print = False
+        tr.is_it_first_print = False
     
-    return bn_sentence + Translator.bn_punctuation
+    return bn_sentence + tr.bn_punctuation
 
 
-def determine_subject_object_verb_new(sentence: List[str]) -> None:
+def determine_subject_object_verb_new(tr: Translator, sentence: List[Token]) -> None:
     """
     Determine subject, object and verb
     """
     
-    Translator.en_subject = []
-    Translator.en_object = []
-    Translator.en_verb = []
+    tr.en_subject = []
+    tr.en_object = []
+    tr.en_verb = []
     adverb_array = []
     adv_follow_verb = 0
     word_position = 0
@@ -250,141 +470,140 @@ def determine_subject_object_verb_new(sentence: List[str]) -> None:
     object_ind = 0
     
     for wds in sentence:
-        wds_array = wds.split('\t')
         
-        if wds_array[1] != "":
+        if wds.tag != "":
             word_position += 1
         
-        if wds_array[1] in ["TO", "IN"]:
+        if wds.tag in ["TO", "IN"]:
             if adv_follow_verb:
-                Translator.en_verb.extend(adverb_array)
+                tr.en_verb.extend(adverb_array)
                 adverb_array = []
             
             adverb_array.append(wds)
             if not object_ind:
-                Translator.en_subject.extend(adverb_array)
+                tr.en_subject.extend(adverb_array)
             else:
-                Translator.en_object.extend(adverb_array)
+                tr.en_object.extend(adverb_array)
             
             adv_follow_verb = 0
             adverb_array = []  # reset
             preposition_ind = 1
         
-        elif wds_array[1] in ["RB", "RBR", "RBS"]:
+        elif wds.tag in ["RB", "RBR", "RBS"]:
             adverb_array.append(wds)
         
-        elif wds_array[1] in ["JJ", "JJR", "JJS", "CD"] or wds_array[2] == "@card@":
+        elif wds.tag in ["JJ", "JJR", "JJS", "CD"] or wds.lemma == "@card@":
             adverb_array.append(wds)
             if not object_ind:
-                Translator.en_subject.extend(adverb_array)
+                tr.en_subject.extend(adverb_array)
             else:
-                Translator.en_object.extend(adverb_array)
+                tr.en_object.extend(adverb_array)
             
             adv_follow_verb = 0
             adverb_array = []  # reset
         
-        elif wds_array[1] in ["VB", "VBG", "VBN", "VBP", "VBZ", "VBD"]:
-            if wds_array[0].lower() in ["be", "been"]:
-                Translator.verb_mainverb_be_ind = 1
+        elif wds.tag in ["VB", "VBG", "VBN", "VBP", "VBZ", "VBD"]:
+            if wds.word.lower() in ["be", "been"]:
+                tr.verb_mainverb_be_ind = 1
             
             adverb_array.append(wds)
             
             if preposition_ind:
                 if not object_ind:
-                    Translator.en_subject.extend(adverb_array)
+                    tr.en_subject.extend(adverb_array)
                 else:
-                    Translator.en_object.extend(adverb_array)
+                    tr.en_object.extend(adverb_array)
                 preposition_ind = 0  # reset
             else:
-                Translator.en_verb.extend(adverb_array)
+                tr.en_verb.extend(adverb_array)
             
             adverb_array = []
             if word_position != 1:
                 object_ind = 1
             adv_follow_verb = 1
         
-        elif wds_array[1] == "MD":
+        elif wds.tag == "MD":
             adverb_array.append(wds)
             
             if preposition_ind:
                 if not object_ind:
-                    Translator.en_subject.extend(adverb_array)
+                    tr.en_subject.extend(adverb_array)
                 else:
-                    Translator.en_object.extend(adverb_array)
+                    tr.en_object.extend(adverb_array)
                 preposition_ind = 0  # reset
             else:
-                Translator.en_verb.extend(adverb_array)
+                tr.en_verb.extend(adverb_array)
             
             adverb_array = []
             
-            if wds_array[0].lower() in ["should", "ought", "must"]:
-                Translator.modal_should_ought_ind = 1
-            elif wds_array[0].lower() in ["can", "may", "could", "might"]:
-                Translator.modal_can_may_ind = 1
+            if wds.word.lower() in ["should", "ought", "must"]:
+                tr.modal_should_ought_ind = 1
+            elif wds.word.lower() in ["can", "may", "could", "might"]:
+                tr.modal_can_may_ind = 1
             
             if word_position != 1:
                 object_ind = 1
             adv_follow_verb = 1
         
-        elif wds_array[1] in ["VV", "VVZ", "VVD", "VVG", "VVP", "VVN"]:
-            eng_word = wds_array[2].strip()
+        elif wds.tag in ["VV", "VVZ", "VVD", "VVG", "VVP", "VVN"]:
+            eng_word = wds.lemma.strip()
             
             if (word_position != 1 or eng_word != 'do') and not preposition_ind:
                 object_ind = 1
                 adv_follow_verb = 1
                 
                 if eng_word == 'do':
-                    Translator.verb_mainverb_do_ind = 1
+                    tr.verb_mainverb_do_ind = 1
                 else:
-                    Translator.verb_mainverb_ind = 1
+                    tr.verb_mainverb_ind = 1
             
             adverb_array.append(wds)
             
             if preposition_ind:
                 if not object_ind:
-                    Translator.en_subject.extend(adverb_array)
+                    tr.en_subject.extend(adverb_array)
                 else:
-                    Translator.en_object.extend(adverb_array)
+                    tr.en_object.extend(adverb_array)
                 preposition_ind = 0  # reset
             else:
-                Translator.en_verb.extend(adverb_array)
+                tr.en_verb.extend(adverb_array)
                 # If 'be' verb has already appeared then treat it as non-mainverb
-                if Translator.verb_mainverb_be_ind:
-                    Translator.verb_mainverb_be_ind = 0
+                if tr.verb_mainverb_be_ind:
+                    tr.verb_mainverb_be_ind = 0
             
             adverb_array = []
         
-        elif wds_array[1] in ["VHZ", "VHP", "VHD", "VHN", "VHG", "VH"]:
+        elif wds.tag in ["VHZ", "VHP", "VHD", "VHN", "VHG", "VH"]:
             if word_position != 1:
                 object_ind = 1
             
-            Translator.verb_hhh_ind = 1
+            tr.verb_hhh_ind = 1
             
             # If 'do' verb has already appeared then treat it as non-mainverb
-            if Translator.verb_mainverb_do_ind:
-                Translator.verb_mainverb_do_ind = 0
+            if tr.verb_mainverb_do_ind:
+                tr.verb_mainverb_do_ind = 0
             
             adverb_array.append(wds)
             
             if preposition_ind:
                 if not object_ind:
-                    Translator.en_subject.extend(adverb_array)
+                    tr.en_subject.extend(adverb_array)
                 else:
-                    Translator.en_object.extend(adverb_array)
+                    tr.en_object.extend(adverb_array)
                 preposition_ind = 0  # reset
             else:
-                Translator.en_verb.extend(adverb_array)
+                tr.en_verb.extend(adverb_array)
             
             adverb_array = []
         
-        elif wds_array[1] == "":  # without any Penn tag but can have contents
+        elif wds.tag == "":  # without any Penn tag but can have contents
             if not object_ind:
-                Translator.en_subject.append(wds)
+                tr.en_subject.append(wds)
             else:
-                Translator.en_object.append(wds)
+                tr.en_object.append(wds)
         else:
             if adv_follow_verb == 1:
-                Translator.en_verb.extend(adverb_array)
+                tr.en_verb.extend(adverb_array)
                 adverb_array = []
             
             adverb_array.append(wds)
@@ -394,359 +613,358 @@ def determine_subject_object_verb_new(sentence: List[str]) -> None:
                 preposition_ind = 0  # reset
             
             if not object_ind:
-                Translator.en_subject.extend(adverb_array)
+                tr.en_subject.extend(adverb_array)
             else:
-                Translator.en_object.extend(adverb_array)
+                tr.en_object.extend(adverb_array)
             adverb_array = []
     
     if preposition_ind:
         if not object_ind:
-            Translator.en_subject.extend(adverb_array)
+            tr.en_subject.extend(adverb_array)
         else:
-            Translator.en_object.extend(adverb_array)
+            tr.en_object.extend(adverb_array)
         preposition_ind = 0  # reset
     else:
-        Translator.en_verb.extend(adverb_array)
+        tr.en_verb.extend(adverb_array)
     
     adverb_array = []
    
     # Print details for debugging
-    if Translator.turn_on_debugging >= 3:
-        print("\n==Sentence==\n" + "\n".join(sentence) + 
-              "\n==Subject==\n" + "\n".join(Translator.en_subject) +
-              "\n==Object==\n" + "\n".join(Translator.en_object) +
-              "\n==Verb==\n" + "\n".join(Translator.en_verb), file=sys.stderr)
+    if tr.turn_on_debugging >= 3:
+        print("\n==Sentence==\n" + tokens_to_text(sentence) + 
+              "\n==Subject==\n" + tokens_to_text(tr.en_subject) +
+              "\n==Object==\n" + tokens_to_text(tr.en_object) +
+              "\n==Verb==\n" + tokens_to_text(tr.en_verb), file=sys.stderr)
 
-def determine_sentence_type(sentence: List[str]) -> int:
+def determine_sentence_type(tr: Translator, sentence: List[Token]) -> int:
     """Determine the sentence type"""
     
-    if Translator.beginning_of_sentence_ind:
-        (Translator.interrogative_sentence_ind, 
-         Translator.non_wh_question_ind) = en_ss.check_for_interrogative_sentence(sentence)
+    if tr.beginning_of_sentence_ind:
+        (tr.interrogative_sentence_ind, 
+         tr.non_wh_question_ind) = en_ss.check_for_interrogative_sentence(sentence)
     else:
-        Translator.interrogative_sentence_ind = 0
-        Translator.non_wh_question_ind = 0
+        tr.interrogative_sentence_ind = 0
+        tr.non_wh_question_ind = 0
     
-    if not Translator.interrogative_sentence_ind:
-        Translator.imperative_sentence_ind = en_ss.check_for_imperative_sentence(sentence)
+    if not tr.interrogative_sentence_ind:
+        tr.imperative_sentence_ind = en_ss.check_for_imperative_sentence(sentence)
     
-    if Translator.turn_on_debugging >= 2:
+    if tr.turn_on_debugging >= 2:
         print("\n -: Sentence Type :-", file=sys.stderr)
-        print(f"Question Mark={Translator.interrogative_sentence_ind}", file=sys.stderr)
-        print(f"Non-Wh question={Translator.non_wh_question_ind}", file=sys.stderr)
-        print(f"Imperative Sentence={Translator.imperative_sentence_ind}", file=sys.stderr)
+        print(f"Question Mark={tr.interrogative_sentence_ind}", file=sys.stderr)
+        print(f"Non-Wh question={tr.non_wh_question_ind}", file=sys.stderr)
+        print(f"Imperative Sentence={tr.imperative_sentence_ind}", file=sys.stderr)
     
     return 0
 
-def determine_tense() -> int:
+def determine_tense(tr: Translator) -> int:
     """Determine tense"""
-    Translator.tense, Translator.tense_sc, Translator.passive_sentence_ind = en_ss.find_out_tense_details(Translator.en_verb)
+    tr.tense, tr.tense_sc, tr.passive_sentence_ind = en_ss.find_out_tense_details(tr.en_verb)
     
-    if Translator.turn_on_debugging >= 2:
+    if tr.turn_on_debugging >= 2:
         print("\n -: Tense Details :-", file=sys.stderr)
-        print(f"Tense=({Translator.tense}, {Translator.tense_sc})", file=sys.stderr)
-        print(f"Passive sentence={Translator.passive_sentence_ind}", file=sys.stderr)
+        print(f"Tense=({tr.tense}, {tr.tense_sc})", file=sys.stderr)
+        print(f"Passive sentence={tr.passive_sentence_ind}", file=sys.stderr)
     
     return 0
 
-def swap_subject_object():
+def swap_subject_object(tr):
     """
     Swap subject and object
     """
-    new_sub = Translator.en_object
-    Translator.en_object = Translator.en_subject
-    Translator.en_subject = new_sub
+    new_sub = tr.en_object
+    tr.en_object = tr.en_subject
+    tr.en_subject = new_sub
 
-def translate_subject() -> str:
+def translate_subject(tr: Translator) -> str:
     """
     Translates the subject and finds out the 'person'
     """
-    Translator.object_or_subject_ind = 0  # set it to 'subject' and call general sub_obj
-    return construct_sub_obj(Translator.en_subject)
+    tr.object_or_subject_ind = 0  # set it to 'subject' and call general sub_obj
+    return construct_sub_obj(tr, tr.en_subject)
 
-def translate_object() -> str:
+def translate_object(tr: Translator) -> str:
     """
     Translate the object
     """
-    Translator.object_or_subject_ind = 1  # set it to 'object' and call general sub_obj
-    return construct_sub_obj(Translator.en_object)
+    tr.object_or_subject_ind = 1  # set it to 'object' and call general sub_obj
+    return construct_sub_obj(tr, tr.en_object)
 
-def construct_sub_obj(en_sub_obj: List[str]) -> str:
+def construct_sub_obj(tr: Translator, en_sub_obj: List[Token]) -> str:
     """
     Translates and constructs the subject/object and finds out the 'person' of subject
     """
-    Translator.bn_sub_obj = ""
-    Translator.bn_determiner_suffix = ""
+    tr.bn_sub_obj = ""
+    tr.bn_determiner_suffix = ""
     number_of_nouns_in_object = 0
 
-    Translator.bn_after_preposition = ""
-    Translator.bn_pre_determiner = ""
+    tr.bn_after_preposition = ""
+    tr.bn_pre_determiner = ""
 
-    Translator.bn_adverb = ""
-    Translator.bn_sub_obj_verb = ""
+    tr.bn_adverb = ""
+    tr.bn_sub_obj_verb = ""
 
-    Translator.bn_verb_sondhi_ind = 0
-    Translator.snd_final_word = ""
+    tr.bn_verb_sondhi_ind = 0
+    tr.snd_final_word = ""
 
-    Translator.bn_sub_obj_hhh_suffix = ""
+    tr.bn_sub_obj_hhh_suffix = ""
 
     # This tests whether has/have/had is the only verb
-    if (Translator.object_or_subject_ind == 0 and ((Translator.verb_hhh_ind and not Translator.verb_mainverb_ind 
-                        and not Translator.verb_mainverb_do_ind
-                        and not Translator.verb_mainverb_be_ind)
-                       or Translator.modal_should_ought_ind)):
-        Translator.bn_sub_obj_hhh_suffix = BnTable.bn_subject_hhh_suffix
+    if (tr.object_or_subject_ind == 0 and ((tr.verb_hhh_ind and not tr.verb_mainverb_ind 
+                        and not tr.verb_mainverb_do_ind
+                        and not tr.verb_mainverb_be_ind)
+                       or tr.modal_should_ought_ind)):
+        tr.bn_sub_obj_hhh_suffix = BnTable.bn_subject_hhh_suffix
 
     for wds in en_sub_obj:
-        wds_array = wds.split('\t')
 
-        if wds_array[1] == "IGNR":  # Just ignore it
+        if wds.tag == "IGNR":  # Just ignore it
             pass
 
-        elif wds_array[1] in [',', ';', ':']:
-            Translator.bn_sub_obj += wds_array[0]
+        elif wds.tag in [',', ';', ':']:
+            tr.bn_sub_obj += wds.word
 
-        elif (':' in wds_array[0] or '|' in wds_array[0] or 
-              ('%' in wds_array[0] and wds_array[1] != "CD") or 
-              '&' in wds_array[0] or '(' in wds_array[0] or ')' in wds_array[0]):
-            Translator.bn_sub_obj += " " + wds_array[0]
+        elif (':' in wds.word or '|' in wds.word or 
+              ('%' in wds.word and wds.tag != "CD") or 
+              '&' in wds.word or '(' in wds.word or ')' in wds.word):
+            tr.bn_sub_obj += " " + wds.word
 
-        elif wds_array[1] == "UH":
-            en_word = wds_array[0]
+        elif wds.tag == "UH":
+            en_word = wds.word
             bn_wd = bn_dict.dictionary_lookup(en_word)
-            Translator.bn_sub_obj += " " + bn_wd
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] == "FW":
-            en_word = wds_array[0] + ":NP"
+        elif wds.tag == "FW":
+            en_word = wds.word + ":NP"
             bn_wd = bn_dict.dictionary_lookup(en_word)
-            Translator.bn_sub_obj += " " + bn_wd
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] in ["LS", "SYM"]:
-            en_word = wds_array[0]
+        elif wds.tag in ["LS", "SYM"]:
+            en_word = wds.word
             bn_wd = bn_dict.dictionary_lookup(en_word)
-            Translator.bn_sub_obj += " " + bn_wd
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] == 'SENT':
-            en_word = wds_array[0]
-            Translator.bn_punctuation = BnTable.bn_punctuation_table.get(en_word, "")
+        elif wds.tag == 'SENT':
+            en_word = wds.word
+            tr.bn_punctuation = BnTable.bn_punctuation_table.get(en_word, "")
 
-        elif wds_array[1] == 'CD' or wds_array[2] == "@card@":
-            en_word = wds_array[0] + ":CD"  # ask for Number
+        elif wds.tag == 'CD' or wds.lemma == "@card@":
+            en_word = wds.word + ":CD"  # ask for Number
             bn_wd = bn_dict.dictionary_lookup(en_word)
-            bn_wd = Translator.bn_adverb + " " + bn_wd
-            Translator.bn_adverb = ""  # reset
-            Translator.bn_sub_obj += " " + bn_wd
+            bn_wd = tr.bn_adverb + " " + bn_wd
+            tr.bn_adverb = ""  # reset
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] == 'POS':
-            Translator.bn_sub_obj = bn_sondhi.bn_sondhi_possessive(Translator.bn_sub_obj, BnTable.bn_word_er)
+        elif wds.tag == 'POS':
+            tr.bn_sub_obj = bn_sondhi.bn_sondhi_possessive(tr.bn_sub_obj, BnTable.bn_word_er)
 
-        elif wds_array[1] == 'EX':
-            Translator.existential_there_ind = 1
+        elif wds.tag == 'EX':
+            tr.existential_there_ind = 1
             bn_wd = ""
 
-        elif wds_array[1] == 'PDT':
-            en_word = wds_array[0].lower()
-            Translator.bn_pre_determiner = bn_dict.dictionary_lookup(en_word)
-            Translator.bn_pre_determiner = Translator.bn_adverb + " " + Translator.bn_pre_determiner
-            Translator.bn_adverb = ""  # Reset
+        elif wds.tag == 'PDT':
+            en_word = wds.word.lower()
+            tr.bn_pre_determiner = bn_dict.dictionary_lookup(en_word)
+            tr.bn_pre_determiner = tr.bn_adverb + " " + tr.bn_pre_determiner
+            tr.bn_adverb = ""  # Reset
 
-        elif wds_array[1] == 'DT':
-            en_word = wds_array[0].lower()
-            if not process_and_translate_determiner(en_word):
-                en_word = wds_array[0]
+        elif wds.tag == 'DT':
+            en_word = wds.word.lower()
+            if not process_and_translate_determiner(tr, en_word):
+                en_word = wds.word
                 bn_wd = bn_dict.dictionary_lookup(en_word)
-                Translator.bn_sub_obj += " " + bn_wd
+                tr.bn_sub_obj += " " + bn_wd
 
-            if (en_word != "the" and Translator.object_or_subject_ind == 0 
-                and not Translator.person_determined):
-                Translator.person = 3
-                Translator.person_determined = 1
+            if (en_word != "the" and tr.object_or_subject_ind == 0 
+                and not tr.person_determined):
+                tr.person = 3
+                tr.person_determined = 1
 
-        elif wds_array[1] in ['IN', 'TO']:  # check prepositions and TO
-            en_word = wds_array[2].lower()
-            if not process_and_translate_preposition(en_word):
+        elif wds.tag in ['IN', 'TO']:  # check prepositions and TO
+            en_word = wds.lemma.lower()
+            if not process_and_translate_preposition(tr, en_word):
                 en_word = en_word + ":IN"
                 bn_wd = bn_dict.dictionary_lookup(en_word)
-                Translator.bn_sub_obj += " " + bn_wd
+                tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] in ['RB', 'RBR', 'RBS']:
-            en_word = wds_array[2].strip().lower()
+        elif wds.tag in ['RB', 'RBR', 'RBS']:
+            en_word = wds.lemma.strip().lower()
             
             if en_word in BnTable.bn_adverb_negation_table:
-                Translator.bn_negation_word = BnTable.bn_adverb_negation_table[en_word]
+                tr.bn_negation_word = BnTable.bn_adverb_negation_table[en_word]
                 bn_wd = ""
             else:
-                en_word = wds_array[0] + ":RB"
+                en_word = wds.word + ":RB"
                 bn_wd = bn_dict.dictionary_lookup(en_word)
 
-            Translator.bn_adverb += " " + bn_wd
+            tr.bn_adverb += " " + bn_wd
 
-        elif wds_array[1] in ['JJ', 'JJR', 'JJS']:
-            en_word = wds_array[0] + ":JJ"  # ask for adjective
+        elif wds.tag in ['JJ', 'JJR', 'JJS']:
+            en_word = wds.word + ":JJ"  # ask for adjective
             bn_wd = bn_dict.dictionary_lookup(en_word)
-            bn_wd = Translator.bn_adverb + " " + bn_wd
-            Translator.bn_adverb = ""  # reset
-            Translator.bn_sub_obj += " " + bn_wd
+            bn_wd = tr.bn_adverb + " " + bn_wd
+            tr.bn_adverb = ""  # reset
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] == 'NNS':
-            en_word = wds_array[0]
+        elif wds.tag == 'NNS':
+            en_word = wds.word
             bn_wd = bn_dict.dictionary_lookup(en_word)
             
-            if Translator.object_or_subject_ind == 0 and not Translator.person_determined:
-                Translator.person = 3
+            if tr.object_or_subject_ind == 0 and not tr.person_determined:
+                tr.person = 3
 
             if bn_wd != en_word:
-                Translator.bn_determiner_suffix = ""  # no need of suffix
+                tr.bn_determiner_suffix = ""  # no need of suffix
             else:
-                if wds_array[2] != "<unknown>":
-                    en_word = wds_array[2]
+                if wds.lemma != "<unknown>":
+                    en_word = wds.lemma
                     bn_wd = bn_dict.dictionary_lookup(en_word)
                     if bn_wd == en_word:
-                        bn_wd = wds_array[0]
+                        bn_wd = wds.word
             
-            bn_wd += Translator.bn_determiner_suffix
-            Translator.bn_determiner_suffix = ""  # reset
-            Translator.bn_sub_obj += " " + bn_wd
+            bn_wd += tr.bn_determiner_suffix
+            tr.bn_determiner_suffix = ""  # reset
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] in ['WDT', 'WRB', 'WP$', 'WP']:
-            en_word = wds_array[2]
-            bn_wd = bengali_wh_words(en_word)
-            Translator.bn_sub_obj += " " + bn_wd
+        elif wds.tag in ['WDT', 'WRB', 'WP$', 'WP']:
+            en_word = wds.lemma
+            bn_wd = bengali_wh_words(tr, en_word)
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] in ['PP', 'PP$']:
-            en_word = wds_array[0]
-            bn_wd = find_out_pronoun(en_word)
+        elif wds.tag in ['PP', 'PP$']:
+            en_word = wds.word
+            bn_wd = find_out_pronoun(tr, en_word)
 
             # From subject
-            if Translator.object_or_subject_ind == 0:
-                Translator.pp_in_subject_ind = True
-                if not Translator.person_determined:
-                    Translator.person = find_out_person(en_word)
-                    Translator.person_determined = 1
+            if tr.object_or_subject_ind == 0:
+                tr.pp_in_subject_ind = True
+                if not tr.person_determined:
+                    tr.person = find_out_person(tr, en_word)
+                    tr.person_determined = 1
             
             # From object
-            if Translator.object_or_subject_ind == 1 and not Translator.person_determined:
-                Translator.person = guess_person_from_object(en_word)
+            if tr.object_or_subject_ind == 1 and not tr.person_determined:
+                tr.person = guess_person_from_object(tr, en_word)
                 
-                if Translator.anubadok_mode == "PO_MODE":
-                    Translator.formality_determined = 1  # TBC
+                if tr.anubadok_mode == "PO_MODE":
+                    tr.formality_determined = 1  # TBC
 
-            if (Translator.non_wh_question_ind 
-                and not Translator.bn_word_ki_added_ind):  # add 'ki'
+            if (tr.non_wh_question_ind 
+                and not tr.bn_word_ki_added_ind):  # add 'ki'
                 bn_wd += BnTable.bn_word_ki
-                Translator.bn_word_ki_added_ind = 1
+                tr.bn_word_ki_added_ind = 1
             
-            Translator.bn_sub_obj += " " + bn_wd
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] == 'NN':
-            en_word = wds_array[0] + ":NN"
+        elif wds.tag == 'NN':
+            en_word = wds.word + ":NN"
             bn_wd = bn_dict.dictionary_lookup(en_word)
             
-            if Translator.object_or_subject_ind == 0 and not Translator.person_determined:
-                Translator.person = 3
+            if tr.object_or_subject_ind == 0 and not tr.person_determined:
+                tr.person = 3
 
-            if Translator.object_or_subject_ind == 1:
-                bn_wd += Translator.bn_determiner_suffix
-                Translator.bn_determiner_suffix = ""  # reset
+            if tr.object_or_subject_ind == 1:
+                bn_wd += tr.bn_determiner_suffix
+                tr.bn_determiner_suffix = ""  # reset
 
-            if (Translator.non_wh_question_ind == 1 
-                and Translator.bn_word_ki_added_ind == 0):  # add 'ki'
+            if (tr.non_wh_question_ind == 1 
+                and tr.bn_word_ki_added_ind == 0):  # add 'ki'
                 bn_wd += BnTable.bn_word_ki
-                Translator.bn_word_ki_added_ind = 1
+                tr.bn_word_ki_added_ind = 1
             
-            Translator.bn_sub_obj += " " + bn_wd
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] in ['NP', 'NPS']:
-            en_word = wds_array[0] + ":NP"
+        elif wds.tag in ['NP', 'NPS']:
+            en_word = wds.word + ":NP"
             bn_wd = bn_dict.dictionary_lookup(en_word)
             
-            if (Translator.object_or_subject_ind == 0 and Translator.person_determined == 0):
-                Translator.person = 3
-                Translator.person_determined = 1
+            if (tr.object_or_subject_ind == 0 and tr.person_determined == 0):
+                tr.person = 3
+                tr.person_determined = 1
 
-            if Translator.object_or_subject_ind == 1 and number_of_nouns_in_object == 0:
+            if tr.object_or_subject_ind == 1 and number_of_nouns_in_object == 0:
                 number_of_nouns_in_object += 1
 
-            if (Translator.non_wh_question_ind == 1 
-                and Translator.bn_word_ki_added_ind == 0):  # add 'ki'
+            if (tr.non_wh_question_ind == 1 
+                and tr.bn_word_ki_added_ind == 0):  # add 'ki'
                 bn_wd += BnTable.bn_word_ki
-                Translator.bn_word_ki_added_ind = 1
+                tr.bn_word_ki_added_ind = 1
             
-            Translator.bn_sub_obj += " " + bn_wd
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] == "CC":
-            en_word = wds_array[0].lower()
+        elif wds.tag == "CC":
+            en_word = wds.word.lower()
             bn_wd = BnTable.bn_conjunction_table.get(en_word, "")
             if not bn_wd:
                 bn_wd = bn_dict.dictionary_lookup(en_word)
-            Translator.bn_sub_obj += " " + bn_wd
+            tr.bn_sub_obj += " " + bn_wd
 
-        elif wds_array[1] == "":
-            bn_wd = wds_array[0]
-            Translator.bn_sub_obj += bn_wd
+        elif wds.tag == "":
+            bn_wd = wds.word
+            tr.bn_sub_obj += bn_wd
 
-        elif check_for_verb_tag(wds_array[1]):
-            en_word = wds_array[2].strip()
+        elif check_for_verb_tag(wds.tag):
+            en_word = wds.lemma.strip()
             
             if en_word == "<unknown>":
-                en_word = wds_array[0]
+                en_word = wds.word
             
             en_word = en_word + ":VV"
-            bn_wd = bn_final_rootverb_after_preposition(en_word)
+            bn_wd = bn_final_rootverb_after_preposition(tr, en_word)
 
-            Translator.bn_sub_obj_verb += " " + Translator.bn_adverb + " " + bn_wd
-            Translator.bn_adverb = ""
-            Translator.bn_verb_sondhi_ind = 1
+            tr.bn_sub_obj_verb += " " + tr.bn_adverb + " " + bn_wd
+            tr.bn_adverb = ""
+            tr.bn_verb_sondhi_ind = 1
 
         else:
-            bn_wd = wds_array[0]
-            Translator.bn_sub_obj += " " + bn_wd
+            bn_wd = wds.word
+            tr.bn_sub_obj += " " + bn_wd
 
-    Translator.bn_sub_obj += " " + Translator.bn_adverb + " " + Translator.bn_sub_obj_verb
+    tr.bn_sub_obj += " " + tr.bn_adverb + " " + tr.bn_sub_obj_verb
 
-    if Translator.bn_verb_sondhi_ind:
-        Translator.snd_final_word = bn_sondhi.bn_verb_sondhi_preposition(
-            Translator.bn_sub_obj, Translator.bn_after_preposition) + Translator.bn_determiner_suffix
-        Translator.bn_verb_sondhi_ind = 0
+    if tr.bn_verb_sondhi_ind:
+        tr.snd_final_word = bn_sondhi.bn_verb_sondhi_preposition(
+            tr.bn_sub_obj, tr.bn_after_preposition) + tr.bn_determiner_suffix
+        tr.bn_verb_sondhi_ind = 0
     else:
-        Translator.snd_final_word = bn_sondhi.bn_sondhi_preposition(
+        tr.snd_final_word = bn_sondhi.bn_sondhi_preposition(
             bn_sondhi.bn_sondhi_preposition(
-                Translator.bn_sub_obj, Translator.bn_after_preposition), Translator.bn_determiner_suffix)
+                tr.bn_sub_obj, tr.bn_after_preposition), tr.bn_determiner_suffix)
 
     # Check whether hhh suffix is non-empty
-    if Translator.bn_sub_obj_hhh_suffix:
-        return bn_sondhi.bn_sondhi_preposition(Translator.snd_final_word, Translator.bn_sub_obj_hhh_suffix)
+    if tr.bn_sub_obj_hhh_suffix:
+        return bn_sondhi.bn_sondhi_preposition(tr.snd_final_word, tr.bn_sub_obj_hhh_suffix)
     else:
-        return Translator.snd_final_word
+        return tr.snd_final_word
 
-def process_and_translate_determiner(eng_word: str) -> bool:
+def process_and_translate_determiner(tr: Translator, eng_word: str) -> bool:
     """
     Process determiner: a, an, the, these, those...
     """
     bn_word_determiner = BnTable.bn_determiner_table_1.get(eng_word)
     
     if bn_word_determiner:
-        Translator.bn_sub_obj += " " + bn_word_determiner + " " + Translator.bn_pre_determiner
-        Translator.bn_determiner_suffix = BnTable.bn_determiner_suffix_table_1.get(eng_word, "")
-        Translator.bn_pre_determiner = ""  # reset
+        tr.bn_sub_obj += " " + bn_word_determiner + " " + tr.bn_pre_determiner
+        tr.bn_determiner_suffix = BnTable.bn_determiner_suffix_table_1.get(eng_word, "")
+        tr.bn_pre_determiner = ""  # reset
         return True
 
     # Preposition with negation suffix
     bn_word_determiner = BnTable.bn_determiner_table_2.get(eng_word)
     
     if bn_word_determiner:
-        Translator.bn_sub_obj += " " + bn_word_determiner + " " + Translator.bn_pre_determiner
-        Translator.bn_negation_determiner = BnTable.bn_determiner_suffix_table_2.get(eng_word, "")
-        Translator.bn_pre_determiner = ""  # reset
+        tr.bn_sub_obj += " " + bn_word_determiner + " " + tr.bn_pre_determiner
+        tr.bn_negation_determiner = BnTable.bn_determiner_suffix_table_2.get(eng_word, "")
+        tr.bn_pre_determiner = ""  # reset
         return True
 
     return False
 
-def bengali_wh_words(eng_word: str) -> str:
+def bengali_wh_words(tr: Translator, eng_word: str) -> str:
     """Find out the appropriate translation for wh.. words"""
     eng_word = eng_word.lower()
     
-    if Translator.interrogative_sentence_ind:
+    if tr.interrogative_sentence_ind:
         bng_word = BnTable.wh_table_question.get(eng_word)
         if not bng_word:
             bng_word = bn_dict.dictionary_lookup(eng_word)
@@ -758,87 +976,87 @@ def bengali_wh_words(eng_word: str) -> str:
         return bng_word
 
 # process preposition and subordinating conjunction
-def process_and_translate_preposition(eng_word):
+def process_and_translate_preposition(tr, eng_word):
     bn_word_preposition = BnTable.bn_preposition_table_1.get(eng_word, "")
-    Translator.snd_final_word = ""
+    tr.snd_final_word = ""
 
-    if not Translator.bn_negation_preposition:
-        Translator.bn_negation_preposition = BnTable.bn_preposition_negation_table.get(eng_word, "")
+    if not tr.bn_negation_preposition:
+        tr.bn_negation_preposition = BnTable.bn_preposition_negation_table.get(eng_word, "")
 
     if bn_word_preposition:
-        Translator.snd_final_word = f"{Translator.bn_adverb} {Translator.bn_sub_obj_verb}"
-        Translator.bn_sub_obj = bn_sondhi.bn_verb_sondhi_preposition(Translator.bn_sub_obj, Translator.bn_determiner_suffix) + " " + Translator.snd_final_word
+        tr.snd_final_word = f"{tr.bn_adverb} {tr.bn_sub_obj_verb}"
+        tr.bn_sub_obj = bn_sondhi.bn_verb_sondhi_preposition(tr.bn_sub_obj, tr.bn_determiner_suffix) + " " + tr.snd_final_word
 
-        Translator.bn_sub_obj_verb = ""
-        Translator.bn_determiner_suffix = ""
-        Translator.bn_adverb = ""
+        tr.bn_sub_obj_verb = ""
+        tr.bn_determiner_suffix = ""
+        tr.bn_adverb = ""
 
-        if Translator.bn_verb_sondhi_ind == 1:
-            Translator.snd_final_word = bn_sondhi.bn_verb_sondhi_preposition(Translator.bn_sub_obj, Translator.bn_after_preposition)
-            Translator.bn_verb_sondhi_ind = 0
+        if tr.bn_verb_sondhi_ind == 1:
+            tr.snd_final_word = bn_sondhi.bn_verb_sondhi_preposition(tr.bn_sub_obj, tr.bn_after_preposition)
+            tr.bn_verb_sondhi_ind = 0
         else:
-            Translator.snd_final_word = bn_sondhi.bn_sondhi_preposition(Translator.bn_sub_obj, Translator.bn_after_preposition)
+            tr.snd_final_word = bn_sondhi.bn_sondhi_preposition(tr.bn_sub_obj, tr.bn_after_preposition)
 
-        Translator.bn_after_preposition = f"{bn_word_preposition} {Translator.snd_final_word}"
-        Translator.bn_sub_obj = ""
+        tr.bn_after_preposition = f"{bn_word_preposition} {tr.snd_final_word}"
+        tr.bn_sub_obj = ""
         return 1
 
     # preposition of 2nd kind
     bn_word_preposition = BnTable.bn_preposition_table_2.get(eng_word, "")
     if bn_word_preposition:
-        Translator.bn_sub_obj = bn_sondhi.bn_verb_sondhi_preposition(Translator.bn_sub_obj, Translator.bn_determiner_suffix)
-        Translator.bn_determiner_suffix = ""
-        Translator.bn_sub_obj = f"{Translator.bn_sub_obj} {bn_word_preposition}"
+        tr.bn_sub_obj = bn_sondhi.bn_verb_sondhi_preposition(tr.bn_sub_obj, tr.bn_determiner_suffix)
+        tr.bn_determiner_suffix = ""
+        tr.bn_sub_obj = f"{tr.bn_sub_obj} {bn_word_preposition}"
         return 1
 
     # preposition of 3rd kind
     bn_word_preposition = BnTable.bn_preposition_table_3.get(eng_word, "")
     if bn_word_preposition:
-        Translator.bn_negation_determiner = bn_word_preposition
+        tr.bn_negation_determiner = bn_word_preposition
         return 1
 
     return 0
 
 # Find out appropriate pronoun
-def find_out_pronoun(eng_word):
+def find_out_pronoun(tr, eng_word):
     # When in object
-    if Translator.object_or_subject_ind == 1:
+    if tr.object_or_subject_ind == 1:
         if eng_word.lower() == 'you':
             eng_word = 'you_obj'
         if eng_word.lower() == 'her':
             eng_word = 'him'
 
-    if Translator.passive_sentence_ind:
-        return find_out_pronoun_passive(eng_word)
+    if tr.passive_sentence_ind:
+        return find_out_pronoun_passive(tr, eng_word)
     else:
-        return find_out_pronoun_active(eng_word)
+        return find_out_pronoun_active(tr, eng_word)
 
 # Find out appropriate translation for personal pronoun in passive sentences
-def find_out_pronoun_passive(eng_word):
+def find_out_pronoun_passive(tr, eng_word):
     if BnTable.pronoun_active_to_passive_table.get(eng_word.lower()):
         eng_word = BnTable.pronoun_active_to_passive_table[eng_word.lower()]
     
     # Now reset as for Pronouns as it is taken care of.
-    Translator.bn_sub_obj_hhh_suffix = ""
+    tr.bn_sub_obj_hhh_suffix = ""
     return get_basic_pronoun_translation(eng_word)
 
 # Find out appropriate translation for personal pronoun, PP
-def find_out_pronoun_active(eng_word):
+def find_out_pronoun_active(tr, eng_word):
     
     eng_word = eng_word.lower()
     
     # This tests, whether has/have/had is the only verb
-    if (Translator.object_or_subject_ind == 0 and 
-        ((Translator.verb_hhh_ind and not Translator.verb_mainverb_ind 
-          and not Translator.verb_mainverb_do_ind
-          and not Translator.verb_mainverb_be_ind) 
-         or Translator.modal_should_ought_ind)
+    if (tr.object_or_subject_ind == 0 and 
+        ((tr.verb_hhh_ind and not tr.verb_mainverb_ind 
+          and not tr.verb_mainverb_do_ind
+          and not tr.verb_mainverb_be_ind) 
+         or tr.modal_should_ought_ind)
         and BnTable.pronoun_active_to_modal_table.get(eng_word)):
         eng_word = BnTable.pronoun_active_to_modal_table[eng_word]
-        Translator.bn_sub_obj_hhh_suffix = ""
+        tr.bn_sub_obj_hhh_suffix = ""
 
     # In bengali, gender does not matter.
-    if (Translator.non_wh_question_ind and eng_word == 'her' and Translator.object_or_subject_ind == 0):
+    if (tr.non_wh_question_ind and eng_word == 'her' and tr.object_or_subject_ind == 0):
         eng_word = 'him'
 
     return get_basic_pronoun_translation(eng_word)
@@ -849,8 +1067,8 @@ def get_basic_pronoun_translation(eng_word):
     return bng_word if bng_word else eng_word
 
 # Try to guess 'person' from the object when the subject is not specified.
-def guess_person_from_object(eng_word):
-    object_person = find_out_person(eng_word)
+def guess_person_from_object(tr, eng_word):
+    object_person = find_out_person(tr, eng_word)
     if object_person == 1:
         return 2
     elif object_person == 2:
@@ -859,211 +1077,209 @@ def guess_person_from_object(eng_word):
         return 3
 
 # find out 'person' of the subject 
-def find_out_person(eng_word):
+def find_out_person(tr, eng_word):
     eng_word = eng_word.lower()
     person = BnTable.person_table.get(eng_word, "")
-    return Translator.person if not person else person
+    return tr.person if not person else person
 
 # Translate and construct the verb
-def translate_verb():
-    Translator.bn_adverb = ""
-    Translator.bn_mainverb = ""
-    Translator.bn_mainverb_suffix = ""
+def translate_verb(tr):
+    tr.bn_adverb = ""
+    tr.bn_mainverb = ""
+    tr.bn_mainverb_suffix = ""
 
-    if not Translator.bn_negation_word:
-        Translator.bn_negation_word = Translator.bn_negation_determiner
-        Translator.bn_negation_determiner = ""
+    if not tr.bn_negation_word:
+        tr.bn_negation_word = tr.bn_negation_determiner
+        tr.bn_negation_determiner = ""
 
     # We need to know whether 'not' is present 
-    if not Translator.bn_negation_word:
-        for wds in Translator.en_verb:
-            wds_array = wds.split('\t')
-            en_word = wds_array[2].lower().strip()
+    if not tr.bn_negation_word:
+        for wds in tr.en_verb:
+            en_word = wds.lemma.lower().strip()
             
-            if (BnTable.bn_adverb_negation_table.get(en_word) and wds_array[1] == "RB"):
-                Translator.bn_negation_word = BnTable.bn_adverb_negation_table[en_word]
+            if (BnTable.bn_adverb_negation_table.get(en_word) and wds.tag == "RB"):
+                tr.bn_negation_word = BnTable.bn_adverb_negation_table[en_word]
 
     # Imperative sentence implies second person.
-    if Translator.imperative_sentence_ind:
-        Translator.person = 2
+    if tr.imperative_sentence_ind:
+        tr.person = 2
 
-    for wds in Translator.en_verb:
-        wds_array = wds.split('\t')
+    for wds in tr.en_verb:
         bn_wd = ""
 
         # Translate start constructing
-        if wds_array[1] == "IGNR":    # Just ignore it
+        if wds.tag == "IGNR":    # Just ignore it
             pass
-        elif wds_array[1] in ["RB", "RBR", "RBS"]:  # adverb
-            en_word = wds_array[2].lower().strip()
+        elif wds.tag in ["RB", "RBR", "RBS"]:  # adverb
+            en_word = wds.lemma.lower().strip()
             
             if BnTable.bn_adverb_negation_table.get(en_word):
                 bn_wd = ""
             else:
-                en_word = f"{wds_array[0]}:RB"
+                en_word = f"{wds.word}:RB"
                 bn_wd = bn_dict.dictionary_lookup(en_word)
 
-            Translator.bn_adverb = f"{Translator.bn_adverb} {bn_wd}"
-        elif wds_array[1] == 'MD':
-            process_modal_verb(wds_array[0])
-        elif wds_array[1] in ["VV", "VVD", "VVG", "VVN", "VVP", "VVZ"]:
-            en_word = wds_array[2].strip()
+            tr.bn_adverb = f"{tr.bn_adverb} {bn_wd}"
+        elif wds.tag == 'MD':
+            process_modal_verb(tr, wds.word)
+        elif wds.tag in ["VV", "VVD", "VVG", "VVN", "VVP", "VVZ"]:
+            en_word = wds.lemma.strip()
             
             if (en_word.lower() == 'do' and 
-                (Translator.verb_mainverb_ind or 
-                 (not Translator.verb_mainverb_do_ind and not Translator.imperative_sentence_ind) 
-                 or Translator.non_wh_question_ind)):
+                (tr.verb_mainverb_ind or 
+                 (not tr.verb_mainverb_do_ind and not tr.imperative_sentence_ind) 
+                 or tr.non_wh_question_ind)):
                 en_word = ""
             elif en_word == "<unknown>":
-                en_word = wds_array[0]
+                en_word = wds.word
             
             if en_word:
                 en_word = f"{en_word}:VV"
-                bn_wd = bn_final_rootverb(en_word)
-                Translator.bn_mainverb = f"{Translator.bn_mainverb} {bn_wd}"
-        elif wds_array[1] in ["VB", "VBD", "VBG", "VBN", "VBP", "VBZ"]:
-            en_word = wds_array[0].lower()
+                bn_wd = bn_final_rootverb(tr, en_word)
+                tr.bn_mainverb = f"{tr.bn_mainverb} {bn_wd}"
+        elif wds.tag in ["VB", "VBD", "VBG", "VBN", "VBP", "VBZ"]:
+            en_word = wds.word.lower()
             
-            if Translator.verb_mainverb_ind or Translator.verb_mainverb_do_ind:
+            if tr.verb_mainverb_ind or tr.verb_mainverb_do_ind:
                 bn_wd = ""
-            elif (Translator.verb_mainverb_be_ind and 
+            elif (tr.verb_mainverb_be_ind and 
                   (en_word in ['be', 'been'])):
-                bn_wd = process_be_as_mainverb(en_word)
+                bn_wd = process_be_as_mainverb(tr, en_word)
             elif en_word in ['be', 'been']:
                 bn_wd = ""
             else:
-                bn_wd = bn_non_mainverb(en_word)
+                bn_wd = bn_non_mainverb(tr, en_word)
             
-            Translator.bn_mainverb = f"{Translator.bn_mainverb} {bn_wd}"
-        elif wds_array[1] in ["VH", "VHD", "VHG", "VHN", "VHP", "VHZ"]:
-            if (not Translator.verb_mainverb_ind and not Translator.verb_mainverb_do_ind 
-                and not Translator.verb_mainverb_be_ind):
-                en_word = wds_array[2].strip()
-                bn_wd = process_hhh_as_main_verb(en_word)
+            tr.bn_mainverb = f"{tr.bn_mainverb} {bn_wd}"
+        elif wds.tag in ["VH", "VHD", "VHG", "VHN", "VHP", "VHZ"]:
+            if (not tr.verb_mainverb_ind and not tr.verb_mainverb_do_ind 
+                and not tr.verb_mainverb_be_ind):
+                en_word = wds.lemma.strip()
+                bn_wd = process_hhh_as_main_verb(tr, en_word)
             else:
                 bn_wd = ""
             
-            Translator.bn_mainverb = f"{Translator.bn_mainverb} {bn_wd}"
+            tr.bn_mainverb = f"{tr.bn_mainverb} {bn_wd}"
         else:
-            if wds_array[1]:
-                bn_wd = bn_dict.dictionary_lookup(wds_array[0])
+            if wds.tag:
+                bn_wd = bn_dict.dictionary_lookup(wds.word)
             else:
-                bn_wd = wds_array[0]
+                bn_wd = wds.word
             
-            Translator.bn_mainverb = f"{Translator.bn_mainverb} {bn_wd}"
+            tr.bn_mainverb = f"{tr.bn_mainverb} {bn_wd}"
 
-    if Translator.bn_negation_word:
-        Translator.bn_mainverb = f"{Translator.bn_adverb} {Translator.bn_mainverb} {Translator.bn_negation_word}"
+    if tr.bn_negation_word:
+        tr.bn_mainverb = f"{tr.bn_adverb} {tr.bn_mainverb} {tr.bn_negation_word}"
     else:
-        Translator.bn_mainverb = f"{Translator.bn_adverb} {Translator.bn_mainverb}"
+        tr.bn_mainverb = f"{tr.bn_adverb} {tr.bn_mainverb}"
 
-    Translator.bn_negation_word = ""
-    Translator.bn_mainverb_suffix = f"{Translator.bn_mainverb_suffix} {Translator.bn_negation_determiner}"
-    Translator.bn_negation_determiner = ""
+    tr.bn_negation_word = ""
+    tr.bn_mainverb_suffix = f"{tr.bn_mainverb_suffix} {tr.bn_negation_determiner}"
+    tr.bn_negation_determiner = ""
     
-    return bn_sondhi.bn_verb_sondhi_preposition(Translator.bn_mainverb, Translator.bn_mainverb_suffix)
+    return bn_sondhi.bn_verb_sondhi_preposition(tr.bn_mainverb, tr.bn_mainverb_suffix)
 
 # Process for have,has,had as main verb 
-def process_hhh_as_main_verb(eng_word):
+def process_hhh_as_main_verb(tr, eng_word):
     bng_word = ""
     
-    if Translator.modal_should_ought_ind:
-        Translator.modal_should_ought_ind = 0  # reset
+    if tr.modal_should_ought_ind:
+        tr.modal_should_ought_ind = 0  # reset
         
-        if (Translator.bn_negation_word and 
-            BnTable.modal_hhh_table_active_negation.get(Translator.tense, {}).get(Translator.modal_eng_word)):
-            Translator.bn_negation_word = ""
-            bng_word = BnTable.modal_hhh_table_active_negation[Translator.tense][Translator.modal_eng_word]
+        if (tr.bn_negation_word and 
+            BnTable.modal_hhh_table_active_negation.get(tr.tense, {}).get(tr.modal_eng_word)):
+            tr.bn_negation_word = ""
+            bng_word = BnTable.modal_hhh_table_active_negation[tr.tense][tr.modal_eng_word]
         else:
-            bng_word = BnTable.modal_hhh_table_active[Translator.tense][Translator.modal_eng_word]
+            bng_word = BnTable.modal_hhh_table_active[tr.tense][tr.modal_eng_word]
         return bng_word
-    elif Translator.modal_can_may_ind:
-        Translator.modal_can_may_ind = 0  # reset
+    elif tr.modal_can_may_ind:
+        tr.modal_can_may_ind = 0  # reset
         
-        if (Translator.bn_negation_word and 
-            BnTable.modal_hhh_table_active_negation.get(Translator.tense, {}).get(Translator.modal_eng_word)):
-            Translator.bn_negation_word = ""
-            bng_word = BnTable.modal_hhh_table_active_negation[Translator.tense][Translator.modal_eng_word]
+        if (tr.bn_negation_word and 
+            BnTable.modal_hhh_table_active_negation.get(tr.tense, {}).get(tr.modal_eng_word)):
+            tr.bn_negation_word = ""
+            bng_word = BnTable.modal_hhh_table_active_negation[tr.tense][tr.modal_eng_word]
         else:
-            bng_word = BnTable.modal_hhh_table_active[Translator.tense][Translator.modal_eng_word]
+            bng_word = BnTable.modal_hhh_table_active[tr.tense][tr.modal_eng_word]
         return bng_word
     else:
-        if Translator.bn_negation_word:
-            Translator.bn_negation_word = BnTable.bn_hhh_word_negation_table.get(Translator.tense, {}).get(eng_word, "")
+        if tr.bn_negation_word:
+            tr.bn_negation_word = BnTable.bn_hhh_word_negation_table.get(tr.tense, {}).get(eng_word, "")
         else:
-            bng_word = BnTable.bn_hhh_word_table.get(Translator.tense, {}).get(eng_word, "")
+            bng_word = BnTable.bn_hhh_word_table.get(tr.tense, {}).get(eng_word, "")
         return bng_word
 
 # This process for negation when verb is followed by preposition
-def bn_final_rootverb_after_preposition(eng_word):
+def bn_final_rootverb_after_preposition(tr, eng_word):
     bng_word = bn_dict.dictionary_lookup(eng_word)
     
-    if not Translator.bn_negation_preposition:
+    if not tr.bn_negation_preposition:
         return bng_word
     elif " " in bng_word:
-        bng_word = bng_word.replace(" ", f" {Translator.bn_negation_preposition} ")
-        Translator.bn_negation_preposition = ""
+        bng_word = bng_word.replace(" ", f" {tr.bn_negation_preposition} ")
+        tr.bn_negation_preposition = ""
         return bng_word
     else:
-        bng_word = f"{Translator.bn_negation_preposition} {bng_word}"
-        Translator.bn_negation_preposition = ""
+        bng_word = f"{tr.bn_negation_preposition} {bng_word}"
+        tr.bn_negation_preposition = ""
         return bng_word
 
 # process modal verb
-def process_modal_verb(eng_word):
+def process_modal_verb(tr, eng_word):
     eng_word = eng_word.lower()
     
     if eng_word in ["should", "ought", "must"]:
-        Translator.modal_eng_word = eng_word
+        tr.modal_eng_word = eng_word
         bn_wd = ""
     elif eng_word in ['can', 'may', 'could', 'might']:
-        Translator.bn_mainverb_suffix = Translator.bn_mainverb + Translator.bn_mainverb_suffix
-        Translator.bn_mainverb = ""
+        tr.bn_mainverb_suffix = tr.bn_mainverb + tr.bn_mainverb_suffix
+        tr.bn_mainverb = ""
         bn_wd = ""
-        Translator.modal_eng_word = eng_word
+        tr.modal_eng_word = eng_word
     else:
         bn_wd = BnTable.modal_verb_table_1_active.get(eng_word, "")
-        Translator.bn_mainverb = f"{Translator.bn_mainverb} {bn_wd}"
+        tr.bn_mainverb = f"{tr.bn_mainverb} {bn_wd}"
     
     return 0
 
 # Translate "be" as main verb 
-def process_be_as_mainverb(eng_word):
+def process_be_as_mainverb(tr, eng_word):
     eng_word = eng_word.lower()
     
-    if (Translator.bn_negation_word and 
-        BnTable.be_as_mainverb_negation_table.get(Translator.person, {}).get(Translator.tense)):
-        bng_word = BnTable.be_as_mainverb_negation_table[Translator.person][Translator.tense]
-        Translator.bn_negation_word = ""
+    if (tr.bn_negation_word and 
+        BnTable.be_as_mainverb_negation_table.get(tr.person, {}).get(tr.tense)):
+        bng_word = BnTable.be_as_mainverb_negation_table[tr.person][tr.tense]
+        tr.bn_negation_word = ""
     else:
-        bng_word = BnTable.be_as_mainverb_table.get(Translator.person, {}).get(Translator.tense, "")
+        bng_word = BnTable.be_as_mainverb_table.get(tr.person, {}).get(tr.tense, "")
     
     return bng_word
 
 # Translate non-main verb: am, is, are, was, were, will, shall
-def bn_non_mainverb(eng_word):
+def bn_non_mainverb(tr, eng_word):
     eng_word = eng_word.lower()
     bng_word = ""
     
-    if Translator.bn_negation_word:
-        if Translator.existential_there_ind:
-            bng_word = BnTable.bn_ex_aux_verb_negation_table.get(Translator.tense, {}).get(eng_word, "")
+    if tr.bn_negation_word:
+        if tr.existential_there_ind:
+            bng_word = BnTable.bn_ex_aux_verb_negation_table.get(tr.tense, {}).get(eng_word, "")
         
         if not bng_word:
-            bng_word = BnTable.bn_aux_verb_negation_table.get(Translator.person, {}).get(eng_word, "")
+            bng_word = BnTable.bn_aux_verb_negation_table.get(tr.person, {}).get(eng_word, "")
         
         if not bng_word:
-            bng_word = BnTable.bn_aux_verb_table.get(Translator.person, {}).get(eng_word, "")
+            bng_word = BnTable.bn_aux_verb_table.get(tr.person, {}).get(eng_word, "")
             if not bng_word:
                 bng_word = bn_dict.dictionary_lookup(eng_word)
-            bng_word = f"{bng_word} {Translator.bn_negation_word}"
-        Translator.bn_negation_word = ""
+            bng_word = f"{bng_word} {tr.bn_negation_word}"
+        tr.bn_negation_word = ""
     else:
-        if Translator.existential_there_ind:
-            bng_word = BnTable.bn_ex_aux_verb_table.get(Translator.tense, {}).get(eng_word, "")
+        if tr.existential_there_ind:
+            bng_word = BnTable.bn_ex_aux_verb_table.get(tr.tense, {}).get(eng_word, "")
         
         if not bng_word:
-            bng_word = BnTable.bn_aux_verb_table.get(Translator.person, {}).get(eng_word, "")
+            bng_word = BnTable.bn_aux_verb_table.get(tr.person, {}).get(eng_word, "")
         
         if not bng_word:
             bng_word = bn_dict.dictionary_lookup(eng_word)
@@ -1078,110 +1294,37 @@ def check_for_verb_tag(given_tag):
     return given_tag in verb_tags
 
 ## final form of the main verb
-def bn_final_rootverb(en_root_verb):
-    if Translator.passive_sentence_ind:
-        return bn_final_rootverb_passive(en_root_verb)
-    else:
-        return bn_final_rootverb_active(en_root_verb)
-
-## final form of the main verb
-def bn_final_rootverb_active(en_root_verb):
+def bn_final_rootverb(tr, en_root_verb):
     bn_root_verb = bn_dict.dictionary_lookup(en_root_verb)
     
     # Return if not found in dictionary
     if bn_root_verb == en_root_verb:
         return en_root_verb
     
-    verb_suffix = ""
+    # The form is looked up in the verb paradigms (see bn_verb)
+    choice = bn_verb.verb_choice(bn_verb.VerbState(
+        bool(tr.passive_sentence_ind),
+        bool(tr.modal_should_ought_ind),
+        bool(tr.modal_can_may_ind),
+        tr.modal_eng_word,
+        bool(tr.bn_negation_word),
+        tr.person,
+        tr.tense,
+        tr.tense_sc,
+        tr.formality == 2,
+        tr.imperative_sentence_ind == 1
+    ))
     
-    if Translator.modal_should_ought_ind:
-        Translator.modal_should_ought_ind = 0  # reset
-        
-        if (Translator.bn_negation_word and 
-            BnTable.modal_verb_table_2_active_negation.get(Translator.tense_sc, {}).get(Translator.modal_eng_word)):
-            Translator.bn_negation_word = ""
-            verb_suffix = BnTable.modal_verb_table_2_active_negation[Translator.tense_sc][Translator.modal_eng_word]
-        else:
-            verb_suffix = BnTable.modal_verb_table_2_active[Translator.tense_sc][Translator.modal_eng_word]
-        
-        return bn_sondhi.bn_verb_sondhi_passive(bn_root_verb, verb_suffix)
-    elif Translator.modal_can_may_ind:
-        Translator.modal_can_may_ind = 0
-        
-        if (Translator.bn_negation_word and 
-            BnTable.modal_verb_table_1_active_negation.get(Translator.modal_eng_word)):
-            verb_suffix = BnTable.modal_verb_table_1_active_negation[Translator.modal_eng_word]
-            Translator.bn_negation_word = ""
-        else:
-            verb_suffix = BnTable.modal_verb_table_1_active[Translator.modal_eng_word]
-        
-        verb_suffix = bn_sondhi.bn_verb_sondhi_active(
-            verb_suffix, 
-            BnTable.verb_mod_table_active.get(Translator.person, {}).get(Translator.tense, {}).get('s', "")
-        )
-        verb_suffix = verb_suffix.lstrip()
-        return bn_sondhi.bn_verb_sondhi_preposition(bn_root_verb, verb_suffix)
-    elif (Translator.bn_negation_word and 
-          BnTable.verb_mod_table_active_negation.get(Translator.person, {}).get(Translator.tense, {}).get(Translator.tense_sc)):
-        Translator.bn_negation_word = ""
-        verb_suffix = BnTable.verb_mod_table_active_negation[Translator.person][Translator.tense][Translator.tense_sc]
-        print("P,T,TSC",Translator.person,Translator.tense,Translator.tense_sc,'S',verb_suffix)
-        return bn_sondhi.bn_verb_sondhi_active(bn_root_verb, verb_suffix)
-    else:
-        if (Translator.formality == 2 and Translator.tense == 'present' and
-            Translator.tense_sc == 's'):
-            verb_suffix = BnTable.verb_mod_table_active_formality_2
-        else:
-            verb_suffix = BnTable.verb_mod_table_active.get(Translator.person, {}).get(Translator.tense, {}).get(Translator.tense_sc, "")
-        
-        return bn_sondhi.bn_verb_sondhi_active(
-            bn_root_verb, 
-            verb_suffix, 
-            Translator.imperative_sentence_ind
-        )
-
-## final form of the main verb
-def bn_final_rootverb_passive(en_root_verb):
-    bn_root_verb = bn_dict.dictionary_lookup(en_root_verb)
+    if tr.modal_should_ought_ind:
+        tr.modal_should_ought_ind = 0  # reset
+    elif tr.modal_can_may_ind:
+        tr.modal_can_may_ind = 0
+    elif choice.negated and not tr.passive_sentence_ind:
+        print("P,T,TSC",tr.person,tr.tense,tr.tense_sc,'S',choice.form.suffix)
     
-    # Return if not found in dictionary
-    if bn_root_verb == en_root_verb:
-        return en_root_verb
+    if choice.negated:
+        tr.bn_negation_word = ""
     
-    if Translator.modal_should_ought_ind:
-        Translator.modal_should_ought_ind = 0  # reset
-        
-        if (Translator.bn_negation_word and 
-            BnTable.modal_verb_table_passive_negation.get(Translator.tense_sc, {}).get(Translator.modal_eng_word)):
-            Translator.bn_negation_word = ""
-            verb_suffix = BnTable.modal_verb_table_passive_negation[Translator.tense_sc][Translator.modal_eng_word]
-        else:
-            verb_suffix = BnTable.modal_verb_table_passive[Translator.tense_sc][Translator.modal_eng_word]
-        
-        return bn_sondhi.bn_verb_sondhi_passive(bn_root_verb, verb_suffix)
-    elif Translator.modal_can_may_ind:
-        Translator.modal_can_may_ind = 0
-        
-        if (Translator.bn_negation_word and 
-            BnTable.modal_verb_table_passive_negation.get(Translator.tense_sc, {}).get(Translator.modal_eng_word)):
-            verb_suffix = BnTable.modal_verb_table_passive_negation[Translator.tense_sc][Translator.modal_eng_word]
-            Translator.bn_negation_word = ""
-        else:
-            verb_suffix = BnTable.modal_verb_table_passive[Translator.tense_sc][Translator.modal_eng_word]
-        
-        return bn_sondhi.bn_verb_sondhi_preposition(bn_root_verb, verb_suffix)
-    elif Translator.bn_negation_word:
-        verbmod = BnTable.verb_suffix_table_passive_negation.get(Translator.tense, {}).get(Translator.tense_sc, "")
-        if not verbmod:
-            verbmod = BnTable.verb_suffix_table_passive.get(Translator.tense, {}).get(Translator.tense_sc, "")
-        else:
-            Translator.bn_negation_word = ""
-        return bn_sondhi.bn_verb_sondhi_passive(bn_root_verb, verbmod)
-    else:
-        return bn_sondhi.bn_verb_sondhi_passive(
-            bn_root_verb, 
-            BnTable.verb_suffix_table_passive.get(Translator.tense, {}).get(Translator.tense_sc, "")
-        )
-        
+    return bn_verb.conjugate_verb(bn_root_verb, choice)
 
 
@@ -40,20 +40,16 @@ import re
 ###########################################
 
 def xml_pre_processor(*args):
-    input_string = "".join(args)
-    input_string = input_string.rstrip('\n')
-
-    if len(input_string) == 0:
-        return input_string  # no processing
+    processor = XmlPreProcessor()
+    return processor.feed("".join(args)) + processor.flush()
 
-    output_array = []
-    counter = 0
-
-    # Define mark-up indicators
-    mark_up_ind = 0
-    comments_ind = 0
-    outchar = ""
-    xml_doc_ind = 0
+class XmlPreProcessor:
+    """
+    Incremental form of xml_pre_processor. Text can be fed in pieces of
+    any size; the output is the same as that of xml_pre_processor over
+    the whole text, provided that "<?xml" or "<html" (if present) is
+    within the first header_size characters.
+    """
 
     # Empty sent mimics end of sentence without punctuation marks
     empty_sent = " <__ANUBADOK__EMPTY__SENT__> "
@@ -63,89 +59,272 @@ def xml_pre_processor(*args):
     # texts.
     anu_remove = " <__ANUBADOK__REMOVE__START__>" + " . " + "<__ANUBADOK__REMOVE__END__> "
 
-    # First sanitise
-    input_string = sanitise(input_string)
-
-    # Check whether its XML
-    if re.search(r'<\?xml', input_string, re.IGNORECASE):
-        xml_doc_ind = 1
-    elif re.search(r'<html', input_string, re.IGNORECASE):
-        input_string = re.sub(r'charset=.*"', 'charset=UTF-8"', input_string, flags=re.IGNORECASE)
-        if not re.search(r'charset=', input_string, re.IGNORECASE):
-            input_string = re.sub(r'</head', '<meta http-equiv="Content-Type" content="text/html; charset=UTF-8"></head', input_string, flags=re.IGNORECASE)
-
-    input_array = list(input_string)  # character splitting
-
-    while counter < len(input_array):
-        char = input_array[counter]
-        outchar = char
-        
-        # XML/XML Comment begins
-        if (counter + 3 < len(input_array) and 
-            char == "<" and 
-            input_array[counter+1] == "!" and 
-            input_array[counter+2] == "-" and 
-            input_array[counter+3] == "-"):
-            comments_ind += 1
-            outchar = char
-        # Treat java script as comments so that they are kept untouched
-        elif (not xml_doc_ind and 
-              counter + 6 < len(input_array) and 
-              char == "<" and 
-              input_array[counter+1].lower() == "s" and 
-              input_array[counter+2].lower() == "c" and 
-              input_array[counter+3].lower() == "r" and 
-              input_array[counter+4].lower() == "i" and 
-              input_array[counter+5].lower() == "p" and 
-              input_array[counter+6].lower() == "t"):
-            comments_ind += 1
-            outchar = char
-
-        elif not mark_up_ind and not comments_ind:
-            if char == "\n":
-                outchar = " <__ANUBADOK__LINE__BREAK__> "
-            elif char == "\t":
-                outchar = " <__ANUBADOK__TAB__> "
-            elif char == "<":
-                mark_up_ind = 1
-                outchar = empty_sent + " " + anu_remove + " " + char
-        else:
-            if comments_ind:
-                if (counter >= 2 and 
-                    char == ">" and 
-                    input_array[counter-1] == "-" and 
-                    input_array[counter-2] == "-"):
-                    comments_ind -= 1
-                elif (counter >= 7 and 
-                      input_array[counter-7] == "/" and 
-                      input_array[counter-6].lower() == "s" and 
-                      input_array[counter-5].lower() == "c" and 
-                      input_array[counter-4].lower() == "r" and 
-                      input_array[counter-3].lower() == "i" and 
-                      input_array[counter-2].lower() == "p" and 
-                      input_array[counter-1].lower() == "t" and 
-                      char == ">"):
-                    comments_ind -= 1
-                elif char == ">":
-                    outchar = "__ANUBADOK__GT__"
-                elif char == "<":
-                    outchar = "__ANUBADOK__LT__"
-
-            if char == " ":
-                outchar = "__ANUBADOK__SPACE__"
-            elif char == "\t":
-                outchar = "__ANUBADOK__TAB__"
-            elif char == "\n":
-                outchar = "__ANUBADOK__LINE__BREAK__"
-
-            if char == ">" and mark_up_ind and not comments_ind:
-                mark_up_ind = 0
-                outchar = char + " " + anu_remove + " " + empty_sent
-
-        output_array.append(outchar)
-        counter += 1
-
-    return "".join(output_array)
+    # Characters looked at behind/ahead of the current one ("<script")
+    lookaround = 7
+    # Characters to wait for before deciding whether it's XML or HTML
+    header_size = 4096
+    # Longest line kept back before it is processed in parts
+    max_pending = 65536
+
+    def __init__(self):
+        self.pending = ""   # Received but not processed yet
+        self.history = ""   # Last few processed characters
+
+        # Define mark-up indicators
+        self.header_ind = 0
+        self.xml_doc_ind = 0
+        self.html_doc_ind = 0
+        self.charset_ind = 0
+        self.mark_up_ind = 0
+        self.comments_ind = 0
+
+    def feed(self, text):
+        """
+        Add more input and return the output for the complete lines of it
+        """
+        self.pending += text
+        if not self.header_ind and len(self.pending) < self.header_size:
+            return ""
+
+        # Trailing line breaks are dropped at the end of the text, so they
+        # are kept back until something else follows
+        body = self.pending.rstrip('\n')
+        cut = body.rfind('\n') + 1
+        if not cut and len(body) > max(self.max_pending, self.lookaround):
+            cut = len(body) - self.lookaround
+
+        return self.process(cut) if cut else ""
+
+    def flush(self):
+        """
+        Return the output for the rest of the input
+        """
+        self.pending = self.pending.rstrip('\n')
+        return self.process(len(self.pending)) if self.pending else ""
+
+    def process(self, cut):
+        region = self.pending[:cut]
+        self.pending = self.pending[cut:]
+
+        if not self.header_ind:
+            self.check_document_type(region + self.pending)
+
+        # First sanitise
+        region = sanitise(region)
+
+        if self.html_doc_ind:
+            region = re.sub(r'charset=.*"', 'charset=UTF-8"', region, flags=re.IGNORECASE)
+            if not self.charset_ind:
+                region = re.sub(r'</head', '<meta http-equiv="Content-Type" content="text/html; charset=UTF-8"></head', region, flags=re.IGNORECASE)
+                if re.search(r'charset=', region, re.IGNORECASE):
+                    self.charset_ind = 1
+
+        start = len(self.history)
+        input_string = self.history + region + self.pending[:self.lookaround]
+        self.history = (self.history + region)[-self.lookaround:]
+
+        return self.scan(input_string, start, start + len(region))
+
+    def check_document_type(self, input_string):
+        """
+        Check whether its XML or HTML
+        """
+        self.header_ind = 1
+        if re.search(r'<\?xml', input_string, re.IGNORECASE):
+            self.xml_doc_ind = 1
+        elif re.search(r'<html', input_string, re.IGNORECASE):
+            self.html_doc_ind = 1
+            self.charset_ind = 1 if re.search(r'charset=', input_string, re.IGNORECASE) else 0
+
+    # Text outside mark-up: only "<" needs a closer look
+    text_special = re.compile(r'<')
+    text_table = str.maketrans({
+        "\n": " <__ANUBADOK__LINE__BREAK__> ",
+        "\t": " <__ANUBADOK__TAB__> "
+    })
+
+    # A whole mark-up which neither begins a comment nor a script
+    # (scripts are not special in XML documents)
+    plain_mark_up = re.compile(r'<(?!!--)(?![sS][cC][rR][iI][pP][tT])[^<>]*>')
+    plain_xml_mark_up = re.compile(r'<(?!!--)[^<>]*>')
+
+    # Inside mark-up and comments: "<" and ">"
+    mark_up_special = re.compile(r'[<>]')
+    mark_up_table = str.maketrans({
+        " ": "__ANUBADOK__SPACE__",
+        "\t": "__ANUBADOK__TAB__",
+        "\n": "__ANUBADOK__LINE__BREAK__"
+    })
+
+    def scan(self, input_string, counter, stop):
+        """
+        Mark up input_string[counter:stop]; the characters around them
+        are only looked at. Runs of text between "<" and ">" are copied
+        (or translated) as a whole.
+        """
+        output_array = []
+        empty_sent = self.empty_sent
+        anu_remove = self.anu_remove
+        mark_up_start = empty_sent + " " + anu_remove + " <"
+        mark_up_end = "> " + anu_remove + " " + empty_sent
+        xml_doc_ind = self.xml_doc_ind
+        mark_up_ind = self.mark_up_ind
+        comments_ind = self.comments_ind
+        length = len(input_string)
+        plain_mark_up = self.plain_xml_mark_up if xml_doc_ind else self.plain_mark_up
+
+        while counter < stop:
+            if mark_up_ind or comments_ind:
+                match = self.mark_up_special.search(input_string, counter, stop)
+                table = self.mark_up_table
+            else:
+                match = self.text_special.search(input_string, counter, stop)
+                table = self.text_table
+
+            position = match.start() if match else stop
+            if position > counter:
+                output_array.append(translate_run(input_string[counter:position], table))
+            if not match:
+                break
+
+            counter = position
+            char = input_string[counter]
+
+            if not mark_up_ind and not comments_ind:
+                # Most mark-ups can be taken in one go
+                match = plain_mark_up.match(input_string, counter, stop)
+                if match:
+                    output_array.append(mark_up_start)
+                    output_array.append(translate_run(input_string[counter+1:match.end()-1], self.mark_up_table))
+                    output_array.append(mark_up_end)
+                    counter = match.end()
+                    continue
+
+            if char == "<":
+                # XML/XML Comment begins
+                if (counter + 3 < length and
+                    input_string[counter+1:counter+4] == "!--"):
+                    comments_ind += 1
+                    output_array.append(char)
+                # Treat java script as comments so that they are kept untouched
+                elif (not xml_doc_ind and
+                      counter + 6 < length and
+                      input_string[counter+1:counter+7].lower() == "script"):
+                    comments_ind += 1
+                    output_array.append(char)
+                elif not mark_up_ind and not comments_ind:
+                    mark_up_ind = 1
+                    output_array.append(mark_up_start)
+                elif comments_ind:
+                    output_array.append("__ANUBADOK__LT__")
+                else:
+                    output_array.append(char)
+
+            else:   # ">" within mark-up or comments
+                outchar = char
+                if comments_ind:
+                    if counter >= 2 and input_string[counter-2:counter] == "--":
+                        comments_ind -= 1
+                    elif counter >= 7 and input_string[counter-7:counter].lower() == "/script":
+                        comments_ind -= 1
+                    else:
+                        outchar = "__ANUBADOK__GT__"
+
+                if mark_up_ind and not comments_ind:
+                    mark_up_ind = 0
+                    outchar = mark_up_end
+
+                output_array.append(outchar)
+
+            counter += 1
+
+        self.mark_up_ind = mark_up_ind
+        self.comments_ind = comments_ind
+        return "".join(output_array)
+
+def translate_run(run, table):
+    """
+    str.translate, skipped for the (usual) runs which need no change
+    """
+    if " " in run or "\t" in run or "\n" in run:
+        return run.translate(table)
+    return run
+
+class PreProcessedTextChunker:
+    """
+    Split pre-processed text into chunks which can be tagged and
+    translated on their own: a chunk ends right after a mark-up (where
+    an empty sent closes the sentence) or at a line break following
+    the end of a sentence. Text without either is cut anyway once it
+    reaches chunk_limit, at a sentence end or else between two words.
+    """
+
+    boundary = re.compile(
+        re.escape(XmlPreProcessor.anu_remove + " " + XmlPreProcessor.empty_sent) +
+        r'|(?<=[A-Za-z][.!?])(?= <__ANUBADOK__LINE__BREAK__> )'
+    )
+    # Most characters a boundary (with its look-ahead) spans
+    boundary_size = max(len(XmlPreProcessor.anu_remove + " " + XmlPreProcessor.empty_sent),
+                        len(" <__ANUBADOK__LINE__BREAK__> "))
+
+    sentence_end = re.compile(r'(?<=[A-Za-z][.!?])(?= )')
+    word_end = re.compile(r'(?<=[^\s>])(?= [^\s<])')
+
+    def __init__(self, chunk_size, chunk_limit):
+        self.chunk_size = chunk_size
+        self.chunk_limit = max(chunk_size, chunk_limit)
+        self.pending = ""
+        self.scanned = chunk_size - 1   # Where to look for boundaries next
+        self.cut = 0                    # End of the last boundary found
+
+    def feed(self, text):
+        """
+        Add pre-processed text and return the chunks completed so far
+        """
+        self.pending += text
+
+        chunks = []
+        while len(self.pending) >= self.chunk_size:
+            # Only text not scanned yet is searched, along with a boundary's
+            # size before it where a boundary may now be complete
+            for match in self.boundary.finditer(self.pending, self.scanned):
+                self.cut = match.end()
+            self.scanned = max(self.chunk_size - 1, len(self.pending) - self.boundary_size)
+
+            cut = self.cut
+            if not cut:
+                if len(self.pending) < self.chunk_limit:
+                    break
+                cut = self.forced_cut()
+
+            chunks.append(self.pending[:cut])
+            self.pending = self.pending[cut:]
+            self.scanned = self.chunk_size - 1
+            self.cut = 0
+        return chunks
+
+    def forced_cut(self):
+        """
+        Where to cut pending text which reached chunk_limit without a
+        boundary: after its last sentence end, else its last word
+        """
+        for pattern in (self.sentence_end, self.word_end):
+            cut = 0
+            for match in pattern.finditer(self.pending, self.chunk_size - 1, self.chunk_limit):
+                cut = match.end()
+            if cut:
+                return cut
+        return self.chunk_limit
+
+    def flush(self):
+        """
+        Return the last chunk, if any
+        """
+        chunk = self.pending
+        self.pending = ""
+        self.scanned = self.chunk_size - 1
+        self.cut = 0
+        return [chunk] if chunk else []
 
 def sanitise(string):
     # Original Perl code had commented-out sanitization steps
@@ -168,28 +347,87 @@ def xml_post_processor(*args):
     input_string = "".join(args)
     input_string = input_string.rstrip('\n')
 
-    input_string = input_string.replace('<__ANUBADOK__LINE__BREAK__>', '\n')
-    input_string = input_string.replace('<__ANUBADOK__TAB__>', '\t')
+    return adjust_spacing(replace_markers(input_string))
+
+# Markers left by xml_pre_processor, in the order they are replaced
+post_marker_table = (
+    ('<__ANUBADOK__LINE__BREAK__>', '\n'),
+    ('<__ANUBADOK__TAB__>', '\t'),
+
+    ('__ANUBADOK__LINE__BREAK__', '\n'),
+    ('__ANUBADOK__SPACE__', ' '),
+    ('__ANUBADOK__TAB__', '\t'),
+    ('__ANUBADOK__GT__', '>'),
+    ('__ANUBADOK__LT__', '<'),
+)
+
+# Spacing adjustments, in the order they are applied. Each one is a
+# literal search which is much faster than one pass with a combined
+# pattern (that has to be tried at every space of the text).
+post_spacing_table = tuple((re.compile(pattern), replacement) for pattern, replacement in (
+    (r' :', ':'),
+
+    # (r'" ', '"'),
+    # (r' "', '"'),
+
+    (r'\( ', '('),
+    (r' \)', ')'),
+
+    (r'\[ ', '['),
+    (r' \]', ']'),
+
+    # (r'> >', '>>'),
+    # (r' <', '<'),
+))
+
+def replace_markers(input_string):
+    if "__ANUBADOK__" not in input_string:
+        return input_string
+
+    for marker, replacement in post_marker_table:
+        input_string = input_string.replace(marker, replacement)
 
-    input_string = input_string.replace('__ANUBADOK__LINE__BREAK__', '\n')
-    input_string = input_string.replace('__ANUBADOK__SPACE__', ' ')
-    input_string = input_string.replace('__ANUBADOK__TAB__', '\t')
-    input_string = input_string.replace('__ANUBADOK__GT__', '>')
-    input_string = input_string.replace('__ANUBADOK__LT__', '<')
-    
-    input_string = re.sub(r' :', ':', input_string)
-    
-    # input_string = re.sub(r'" ', '"', input_string)
-    # input_string = re.sub(r' "', '"', input_string)
-    
-    input_string = re.sub(r'\( ', '(', input_string)
-    input_string = re.sub(r' \)', ')', input_string)
-    
-    input_string = re.sub(r'\[ ', '[', input_string)
-    input_string = re.sub(r' \]', ']', input_string)
-    
-    # input_string = re.sub(r'> >', '>>', input_string)
-    # input_string = re.sub(r' <', '<', input_string)
-    
     return input_string
 
+def adjust_spacing(input_string):
+    for pattern, replacement in post_spacing_table:
+        input_string = pattern.sub(replacement, input_string)
+
+    return input_string
+
+class XmlPostProcessor:
+    """
+    Incremental form of xml_post_processor for translated text that
+    arrives in pieces (each of them translated separately)
+    """
+
+    def __init__(self):
+        self.newlines = ""   # Trailing line breaks kept back
+        self.carry = ""      # Trailing " ([" kept back as adjust_spacing may join them with what follows
+
+    def feed(self, text):
+        """
+        Add translated text and return what can be output so far
+        """
+        body = text.rstrip('\n')
+        if not body:
+            self.newlines += text
+            return ""
+
+        output = self.carry + replace_markers(self.newlines + body)
+        self.newlines = text[len(body):]
+
+        # Spacing is adjusted in pairs of characters and only spaces are
+        # removed, so the text can be split after anything but " (["
+        keep = len(output.rstrip(" (["))
+        self.carry = output[keep:]
+        return adjust_spacing(output[:keep])
+
+    def flush(self):
+        """
+        Return the rest of the output
+        """
+        output = adjust_spacing(self.carry)
+        self.carry = ""
+        self.newlines = ""
+        return output
@@ -41,8 +41,7 @@ from anubadok import initialize
 initialize.check_user_anubadok_dir()
 
 from anubadok import settings
-from anubadok import xml_pp
-from anubadok import pos_tagger
+from anubadok import pipeline
 from anubadok import translator
 
 def main():
@@ -52,10 +51,29 @@ def main():
                         help='Suppress non-essential console output')
     parser.add_argument('-d', '--debug', action='count', default=0,
                         help='Enable debugging (use multiple times for more detail)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Translate large inputs with this many processes')
+    parser.add_argument('--stream', action='store_true',
+                        help='Translate and print the input piece by piece as it is read')
+    parser.add_argument('-m', '--memory', action='store_true',
+                        help='Reuse translations of unchanged inputs from the translation memory')
+    parser.add_argument('--server', action='store_true',
+                        help='Run as a translation server (see anubadok_client.py)')
+    parser.add_argument('--socket', default=settings.server_socket,
+                        help='Unix socket for the server ("" to disable)')
+    parser.add_argument('--host', default=settings.server_host,
+                        help='Address for the HTTP server')
+    parser.add_argument('--port', type=int, default=settings.server_port,
+                        help='Port for the HTTP server (0 to disable)')
     parser.add_argument('input_file', nargs='?', help='Input file (default: STDIN)')
     
     args = parser.parse_args()
 
+    # Streamed input is translated chunk by chunk, neither in a pool of
+    # processes nor as a whole text kept in the translation memory
+    if args.stream and (args.jobs or args.memory):
+        parser.error("--stream can't be combined with -j or -m")
+
     if args.version:
         print(f"{translator.version}")
         sys.exit(0)
@@ -63,6 +81,22 @@ def main():
     if args.debug:
         translator.Translator.turn_on_debugging = args.debug
 
+    if args.memory:
+        settings.use_translation_memory = True
+
+    # Only worth it when the tagger is called many times
+    if args.server or args.stream:
+        settings.penn_treebank_tagger_coprocess = True
+
+    if args.server:
+        from anubadok import server
+        try:
+            server.run_server(args.socket, args.host, args.port)
+        except IOError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+
     input_source = sys.stdin
     input_type = "STDIN"
 
@@ -83,16 +117,23 @@ def main():
         print("see manpage for details.)", file=sys.stderr)
 
     
+    if args.stream:
+        input_pieces = iter(lambda: input_source.readline(settings.stream_read_size), "")
+        for output in pipeline.translate_stream(input_pieces):
+            sys.stdout.write(output)
+            sys.stdout.flush()
+        print()
+        if input_type == "FILE":
+            input_source.close()
+        return
+
     # Read input
     input_content = input_source.read()
     if input_type == "FILE":
         input_source.close()
     
     # Process the content
-    processed = xml_pp.xml_pre_processor(input_content)
-    tagged = pos_tagger.penn_treebank_tagger(processed)
-    translated = translator.translate_in_bengali(tagged)
-    output = xml_pp.xml_post_processor(translated)
+    output = pipeline.translate_text(input_content, jobs=args.jobs)
     
     print(output)
 
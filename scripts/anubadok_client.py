@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+
+import sys
+import json
+import socket
+import argparse
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Import the necessary
+sys.path.insert(0, ".")
+from anubadok import settings
+
+def request_over_socket(socket_path, request):
+    """Send a request to the server over its Unix socket"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode('utf-8') + b"\n")
+        with sock.makefile('rb') as f:
+            response = f.readline()
+    if not response:
+        raise IOError(f"Error! No response from Anubadok server at {socket_path}.")
+    return json.loads(response.decode('utf-8'))
+
+def request_over_http(host, port, request):
+    """Send a request to the server over HTTP"""
+    if request.get("command") == "version":
+        http_request = urllib.request.Request(f"http://{host}:{port}/version")
+    else:
+        http_request = urllib.request.Request(
+            f"http://{host}:{port}/translate",
+            data=json.dumps(request).encode('utf-8'),
+            headers={"Content-Type": "application/json"}
+        )
+    try:
+        with urllib.request.urlopen(http_request) as response:
+            return json.loads(response.read().decode('utf-8'))
+    except urllib.error.HTTPError as e:
+        return json.loads(e.read().decode('utf-8'))
+
+def send_request(args, request):
+    """Send a request over the Unix socket if available, otherwise over HTTP"""
+    if args.port is None and args.socket and Path(args.socket).exists():
+        return request_over_socket(args.socket, request)
+    return request_over_http(args.host, args.port or settings.server_port, request)
+
+def main():
+    parser = argparse.ArgumentParser(description="Client for Anubadok translation server")
+    parser.add_argument('-v', '--version', action='store_true', help='Print version information')
+    parser.add_argument('-s', '--silent', '--quiet', action='store_true', 
+                        help='Suppress non-essential console output')
+    parser.add_argument('-d', '--debug', action='count', default=0,
+                        help='Enable debugging on the server (use multiple times for more detail)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Not supported: the server translates each input in one process')
+    parser.add_argument('--stream', action='store_true',
+                        help='Not supported: the server translates a whole input at once')
+    parser.add_argument('-m', '--memory', action='store_true',
+                        help='Reuse translations of unchanged inputs from the translation memory')
+    parser.add_argument('--socket', default=settings.server_socket,
+                        help='Unix socket of the server')
+    parser.add_argument('--host', default=settings.server_host,
+                        help='Address of the HTTP server')
+    parser.add_argument('--port', type=int, default=None,
+                        help='Port of the HTTP server (default: use the socket)')
+    parser.add_argument('input_file', nargs='?', help='Input file (default: STDIN)')
+    
+    args = parser.parse_args()
+
+    if args.stream:
+        print("Error! The server can't translate piece by piece; use anubadok --stream.",
+              file=sys.stderr)
+        sys.exit(1)
+    if args.jobs:
+        print("Error! The server translates each input in one process; use anubadok -j.",
+              file=sys.stderr)
+        sys.exit(1)
+
+    if args.version:
+        request = {"command": "version"}
+    else:
+        if args.input_file:
+            input_path = Path(args.input_file)
+            if not input_path.exists():
+                print(f"Error! Couldn't find \"{args.input_file}\"! Exiting.", file=sys.stderr)
+                sys.exit(1)
+            try:
+                input_content = input_path.read_text(encoding='utf-8')
+            except IOError:
+                print(f"Error! Couldn't open \"{args.input_file}\"! Exiting.", file=sys.stderr)
+                sys.exit(1)
+        else:
+            if not args.silent:
+                print("Reading from STDIN; (try: anubadok_client --help for usage)", file=sys.stderr)
+            input_content = sys.stdin.read()
+        request = {"text": input_content, "debug": args.debug}
+        if args.memory:
+            request["memory"] = True
+
+    try:
+        response = send_request(args, request)
+    except (IOError, ValueError) as e:
+        print(f"Error! Couldn't reach Anubadok server: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        sys.exit(1)
+
+    print(response["version"] if args.version else response["output"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+import sys
+import argparse
+
+# Import the necessary
+sys.path.insert(0, ".")
+from anubadok import initialize
+initialize.check_user_anubadok_dir()
+
+from anubadok import bn_dict
+from anubadok import bn_dict_compiler
+from anubadok import bn_verb
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile Anubadok's dictionaries into their memory mapped form")
+    parser.parse_args()
+
+    sources = bn_dict.compiled_dictionary_sources()
+    target = bn_dict_compiler.compiled_dictionary_path(sources)
+
+    try:
+        bn_dict_compiler.compile_dictionary(sources, target)
+        compiled = bn_dict_compiler.CompiledDictionary(target)
+    except IOError as e:
+        print(f"Error! Couldn't compile dictionary: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for source in sources:
+        print(f"{source}: {compiled.source_entries(source)} entries")
+    print(f"Compiled {len(compiled)} entries into {target}")
+
+    bn_dict.load_dictionary()
+    bn_verb.load_verb_paradigms(force=True)
+    print(f"Generated {bn_verb.verb_paradigm_info()['forms']} forms of the verbs "
+          f"into {bn_verb.verb_paradigm_path()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+
+import io
+import sys
+import glob
+import time
+import argparse
+import contextlib
+import subprocess
+import types
+
+# Import the necessary
+sys.path.insert(0, ".")
+from anubadok import initialize
+initialize.check_user_anubadok_dir()
+
+from anubadok import xml_pp
+from anubadok import ens_parser
+from anubadok import pos_tagger
+from anubadok import translator
+from anubadok import bn_sondhi
+from anubadok.en_token import Token, as_token
+
+###########################################
+#
+#  Reference implementations
+#
+#  Modules as of an earlier git revision (by default the first one),
+#  before the hot spots were optimised. Benchmarks check that the
+#  current implementation gives exactly the same output.
+#
+###########################################
+
+def first_revision():
+    """The first revision of the git repository"""
+    return git_output(["rev-list", "--max-parents=0", "HEAD"]).split()[-1]
+
+def git_output(arguments):
+    """Output of a git command run in the source tree"""
+    try:
+        return subprocess.run(["git"] + arguments, check=True, stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, text=True, encoding='utf-8').stdout
+    except (OSError, subprocess.CalledProcessError) as e:
+        error = getattr(e, 'stderr', None) or str(e)
+        raise IOError(f"Error! git {' '.join(arguments)} failed: {error.strip()}")
+
+def reference_module(revision, name):
+    """The module anubadok/<name>.py as of the given revision"""
+    path = f"anubadok/{name}.py"
+    source = git_output(["show", f"{revision}:{path}"])
+    module = types.ModuleType(f"reference_{name}")
+    exec(compile(source, f"{revision}:{path}", "exec"), module.__dict__)
+    return module
+
+def reference_sentence(module, sentence):
+    """A sentence as the reference module takes it (tokens or tagged lines)"""
+    if hasattr(module, "Token"):
+        return sentence
+    return [str(token) for token in sentence]
+
+
+###########################################
+#
+#  Benchmarks
+#
+###########################################
+
+def sample_html_document(size):
+    """A HTML document of about the given size (in characters)"""
+    page = '''<div class="section" id="s{0}">
+<h2>Section {0}</h2>
+<!-- generated section {0} -->
+<p>The student works in the city. He is <b>not</b> working, and she eats bread.
+How many birds are there? <a href="https://example.org/{0}" title="A link">Read more</a>.</p>
+<script type="text/javascript">var n = {0}; if (n < 2 && n > 0) {{ document.write("<p>x</p>"); }}</script>
+<table><tr><td>1</td>\t<td>Golam Mortuza Hossain</td></tr></table>
+</div>
+'''
+    parts = ['<html><head><title>Benchmark</title></head><body>\n']
+    length = 0
+    i = 0
+    while length < size:
+        part = page.format(i)
+        parts.append(part)
+        length += len(part)
+        i += 1
+    parts.append('</body></html>\n')
+    return "".join(parts)
+
+def sample_enumerations(size):
+    """Tagged sentences with long enumerations, of about the given size (in words)"""
+    item = [("apples", "NNS", "apple"), ("and", "CC", "and"), ("oranges", "NNS", "orange"),
+            (",", ",", ","), ("the", "DT", "the"), ("sweet", "JJ", "sweet"),
+            ("pears", "NNS", "pear"), ("of", "IN", "of"), ("Dhaka", "NP", "Dhaka"),
+            (",", ",", ",")]
+    ending = [("are", "VBP", "be"), ("sold", "VVN", "sell"), ("here", "RB", "here"),
+              ("and", "CC", "and"), ("we", "PP", "we"), ("buy", "VVP", "buy"),
+              ("them", "PP", "them"), (".", "SENT", ".")]
+    sentence = [Token(*word) for word in item * 200 + ending]
+
+    sentences = []
+    length = 0
+    while length < size:
+        sentences.append(sentence)
+        length += len(sentence)
+    return sentences
+
+sondhi_functions = ["bn_verb_sondhi_preposition", "bn_sondhi_preposition", "bn_sondhi_possessive",
+                    "bn_verb_sondhi_passive", "bn_verb_sondhi_active"]
+
+def test_suite_sondhi_joins():
+    """Sandhi joins (function name and arguments) made translating tests/*.xml"""
+    joins = []
+    functions = {name: getattr(bn_sondhi, name) for name in sondhi_functions}
+
+    def recorder(name):
+        def record(*args):
+            joins.append((name, args))
+            return functions[name](*args)
+        return record
+
+    try:
+        for name in sondhi_functions:
+            setattr(bn_sondhi, name, recorder(name))
+        for test_suite in sorted(glob.glob("tests/*.xml")):
+            with open(test_suite, 'r', encoding='utf-8') as f:
+                input_text = f.read()
+            tagged = pos_tagger.penn_treebank_tagger(xml_pp.xml_pre_processor(input_text))
+            with contextlib.redirect_stdout(io.StringIO()):
+                translator.translate_in_bengali(tagged)
+    finally:
+        for name, function in functions.items():
+            setattr(bn_sondhi, name, function)
+
+    return joins
+
+def time_it(function, *args, repeat=3):
+    """Best of a few runs, in seconds, and the result"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def report(name, reference_time, current_time, same):
+    print(f"{name:<28} reference {reference_time*1000:9.1f} ms   "
+          f"current {current_time*1000:9.1f} ms   "
+          f"speed-up {reference_time/current_time:6.1f}x   "
+          f"{'same output' if same else 'OUTPUT DIFFERS'}")
+    return same
+
+def benchmark_xml_pre_processor(size, revision):
+    reference = reference_module(revision, "xml_pp")
+    document = sample_html_document(size)
+    reference_time, expected = time_it(reference.xml_pre_processor, document)
+    current_time, result = time_it(xml_pp.xml_pre_processor, document)
+    return report("xml_pre_processor", reference_time, current_time, result == expected)
+
+def benchmark_xml_post_processor(size, revision):
+    reference = reference_module(revision, "xml_pp")
+    # Pre-processed text without the sentence markers stands in for
+    # translated text
+    document = xml_pp.xml_pre_processor(sample_html_document(size))
+    document = document.replace(" " + xml_pp.XmlPreProcessor.empty_sent + " ", "")
+    document = document.replace(" " + xml_pp.XmlPreProcessor.anu_remove + " ", "")
+    document = document.replace(" . ", " (see: [1], [2]) . ")
+
+    reference_time, expected = time_it(reference.xml_post_processor, document)
+    current_time, result = time_it(xml_pp.xml_post_processor, document)
+    return report("xml_post_processor", reference_time, current_time, result == expected)
+
+def benchmark_insert_logical_block_marker(size, revision):
+    reference = reference_module(revision, "ens_parser")
+    sentences = sample_enumerations(size // 64)
+    reference_sentences = [reference_sentence(reference, sentence) for sentence in sentences]
+    run = lambda function, sentences: [function(sentence) for sentence in sentences]
+    reference_time, expected = time_it(run, reference.insert_logical_block_marker, reference_sentences)
+    current_time, result = time_it(run, ens_parser.insert_logical_block_marker, sentences)
+    same = result == [[as_token(sts) for sts in sentence] for sentence in expected]
+    return report("insert_logical_block_marker", reference_time, current_time, same)
+
+def benchmark_bn_sondhi(size, revision):
+    reference = reference_module(revision, "bn_sondhi")
+    joins = test_suite_sondhi_joins() * max(1, size // (64 * 1024))
+    references = [(getattr(reference, name), args) for name, args in joins]
+    currents = [(getattr(bn_sondhi, name), args) for name, args in joins]
+    run = lambda calls: [function(*args) for function, args in calls]
+    reference_time, expected = time_it(run, references)
+    current_time, result = time_it(run, currents)
+    return report(f"bn_sondhi ({len(joins)} joins)", reference_time, current_time, result == expected)
+
+benchmarks = {
+    "xml_pre_processor": benchmark_xml_pre_processor,
+    "xml_post_processor": benchmark_xml_post_processor,
+    "insert_logical_block_marker": benchmark_insert_logical_block_marker,
+    "bn_sondhi": benchmark_bn_sondhi,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks of Anubadok's hot spots")
+    parser.add_argument('-s', '--size', type=float, default=2.0,
+                        help='Size of the sample documents in MB (default: 2)')
+    parser.add_argument('-r', '--reference', default=None,
+                        help='Git revision to compare with (default: the first one)')
+    parser.add_argument('benchmark', nargs='*', choices=[[]] + list(benchmarks),
+                        help='Benchmarks to run (default: all)')
+
+    args = parser.parse_args()
+    size = int(args.size * 1024 * 1024)
+
+    try:
+        revision = args.reference or first_revision()
+        failed = 0
+        for name in args.benchmark or benchmarks:
+            if not benchmarks[name](size, revision):
+                failed += 1
+    except IOError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
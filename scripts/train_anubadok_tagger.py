@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+#___________________________________________________________________
+#
+# Copyright (C) 2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+#
+# This program is a part of the *python port* of Anubadok system
+# which was originally written in Perl during 2005-2008. The python
+# version is also released under the same license as given below.
+#___________________________________________________________________
+#
+# This program is a part of "Anubadok: The Bengali Machine Translator",
+# a free (as in freedom) machine translator package for Bengali (Bangla)
+# developed by Golam Mortuza Hossain <gmhossain@gmail.com>.
+#___________________________________________________________________
+# 
+# Copyright (C) 2005-2025, Golam Mortuza Hossain <gmhossain@gmail.com>
+# 
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#___________________________________________________________________
+
+
+import sys
+import argparse
+
+# Import the necessary
+sys.path.insert(0, ".")
+from anubadok import initialize
+initialize.check_user_anubadok_dir()
+
+from anubadok import settings
+from anubadok import xml_pp
+from anubadok import pos_tagger
+from anubadok import en_tagger
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Train Anubadok's built-in PoS tagger on tagged text "
+                    "(word<TAB>TAG<TAB>lemma per line, as GPoSTTL gives it)")
+    parser.add_argument("files", nargs="+", help="Tagged files to train on")
+    parser.add_argument("-t", "--tag", action="store_true",
+                        help="Files are plain text or XML; tag them first with "
+                             f"the external tagger ({settings.penn_treebank_tagger})")
+    parser.add_argument("-o", "--output", default=settings.tagger_model,
+                        help=f"Model file to write (default: {settings.tagger_model})")
+    args = parser.parse_args()
+
+    if args.tag and pos_tagger.tagger_backend() is not None:
+        print("Error! --tag needs an external tagger as penn_treebank_tagger.",
+              file=sys.stderr)
+        sys.exit(1)
+
+    sentences = []
+    try:
+        for file_name in args.files:
+            with open(file_name, 'r', encoding='utf-8') as f:
+                text = f.read()
+            if args.tag:
+                text = pos_tagger.run_penn_treebank_tagger(xml_pp.xml_pre_processor(text))
+            sentences.extend(en_tagger.read_tagged_sentences(text.splitlines()))
+
+        model = en_tagger.TaggerModel.train(sentences)
+        en_tagger.save_tagger_model(model, args.output)
+    except IOError as e:
+        print(f"Error! Couldn't train the tagger: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    words = sum(len(sentence) for sentence in sentences)
+    print(f"Trained on {len(sentences)} sentences ({words} words, "
+          f"{len(model.lexicon)} distinct, {len(model.tags)} tags)")
+    print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()